@@ -1,221 +1,151 @@
-FreeMono12pt7bBitmaps = [
-    0x49, 0x24, 0x92, 0x48, 0x01, 0xF8, 0xE7, 0xE7, 0x67, 0x42, 0x42, 0x42, 
-    0x42, 0x09, 0x02, 0x41, 0x10, 0x44, 0x11, 0x1F, 0xF1, 0x10, 0x4C, 0x12,
-    0x3F, 0xE1, 0x20, 0x48, 0x12, 0x04, 0x81, 0x20, 0x48, 0x04, 0x07, 0xA2,
-    0x19, 0x02, 0x40, 0x10, 0x03, 0x00, 0x3C, 0x00, 0x80, 0x10, 0x06, 0x01,
-    0xE0, 0xA7, 0xC0, 0x40, 0x10, 0x04, 0x00, 0x3C, 0x19, 0x84, 0x21, 0x08,
-    0x66, 0x0F, 0x00, 0x0C, 0x1C, 0x78, 0x01, 0xE0, 0xCC, 0x21, 0x08, 0x43,
-    0x30, 0x78, 0x3E, 0x30, 0x10, 0x08, 0x02, 0x03, 0x03, 0x47, 0x14, 0x8A,
-    0x43, 0x11, 0x8F, 0x60, 0xFD, 0xA4, 0x90, 0x05, 0x25, 0x24, 0x92, 0x48,
-    0x92, 0x24, 0x11, 0x24, 0x89, 0x24, 0x92, 0x92, 0x90, 0x00, 0x04, 0x02,
-    0x11, 0x07, 0xF0, 0xC0, 0x50, 0x48, 0x42, 0x00, 0x08, 0x04, 0x02, 0x01,
-    0x00, 0x87, 0xFC, 0x20, 0x10, 0x08, 0x04, 0x02, 0x00, 0x3B, 0x9C, 0xCE,
-    0x62, 0x00, 0xFF, 0xE0, 0xFF, 0x80, 0x00, 0x80, 0xC0, 0x40, 0x20, 0x20,
-    0x10, 0x10, 0x08, 0x08, 0x04, 0x04, 0x02, 0x02, 0x01, 0x01, 0x00, 0x80,
-    0x80, 0x40, 0x00, 0x1C, 0x31, 0x90, 0x58, 0x38, 0x0C, 0x06, 0x03, 0x01,
-    0x80, 0xC0, 0x60, 0x30, 0x34, 0x13, 0x18, 0x70, 0x30, 0xE1, 0x44, 0x81,
-    0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x81, 0x1F, 0xC0, 0x1E, 0x10, 0x90,
-    0x68, 0x10, 0x08, 0x0C, 0x04, 0x04, 0x04, 0x06, 0x06, 0x06, 0x06, 0x0E,
-    0x07, 0xFE, 0x3E, 0x10, 0x40, 0x08, 0x02, 0x00, 0x80, 0x40, 0xE0, 0x04,
-    0x00, 0x80, 0x10, 0x04, 0x01, 0x00, 0xD8, 0x63, 0xE0, 0x06, 0x0A, 0x0A,
-    0x12, 0x22, 0x22, 0x42, 0x42, 0x82, 0x82, 0xFF, 0x02, 0x02, 0x02, 0x0F,
-    0x7F, 0x20, 0x10, 0x08, 0x04, 0x02, 0xF1, 0x8C, 0x03, 0x00, 0x80, 0x40,
-    0x20, 0x18, 0x16, 0x18, 0xF0, 0x0F, 0x8C, 0x08, 0x08, 0x04, 0x04, 0x02,
-    0x79, 0x46, 0xC1, 0xE0, 0x60, 0x28, 0x14, 0x19, 0x08, 0x78, 0xFF, 0x81,
-    0x81, 0x02, 0x02, 0x02, 0x02, 0x04, 0x04, 0x04, 0x04, 0x08, 0x08, 0x08,
-    0x08, 0x3E, 0x31, 0xB0, 0x70, 0x18, 0x0C, 0x05, 0x8C, 0x38, 0x63, 0x40,
-    0x60, 0x30, 0x18, 0x1B, 0x18, 0xF8, 0x3C, 0x31, 0x30, 0x50, 0x28, 0x0C,
-    0x0F, 0x06, 0x85, 0x3C, 0x80, 0x40, 0x40, 0x20, 0x20, 0x63, 0xE0, 0xFF,
-    0x80, 0x07, 0xFC, 0x39, 0xCE, 0x00, 0x00, 0x06, 0x33, 0x98, 0xC4, 0x00,
-    0x00, 0xC0, 0x60, 0x18, 0x0C, 0x06, 0x01, 0x80, 0x0C, 0x00, 0x60, 0x03,
-    0x00, 0x30, 0x01, 0x00, 0xFF, 0xF0, 0x00, 0x00, 0x0F, 0xFF, 0xC0, 0x06,
-    0x00, 0x30, 0x01, 0x80, 0x18, 0x01, 0x80, 0xC0, 0x30, 0x18, 0x0C, 0x02,
-    0x00, 0x00, 0x3E, 0x60, 0xA0, 0x20, 0x10, 0x08, 0x08, 0x18, 0x10, 0x08,
-    0x00, 0x00, 0x00, 0x01, 0xC0, 0xE0, 0x1C, 0x31, 0x10, 0x50, 0x28, 0x14,
-    0x3A, 0x25, 0x22, 0x91, 0x4C, 0xA3, 0xF0, 0x08, 0x02, 0x01, 0x80, 0x7C,
-    0x3F, 0x00, 0x0C, 0x00, 0x48, 0x01, 0x20, 0x04, 0x40, 0x21, 0x00, 0x84,
-    0x04, 0x08, 0x1F, 0xE0, 0x40, 0x82, 0x01, 0x08, 0x04, 0x20, 0x13, 0xE1,
-    0xF0, 0xFF, 0x08, 0x11, 0x01, 0x20, 0x24, 0x04, 0x81, 0x1F, 0xC2, 0x06,
-    0x40, 0x68, 0x05, 0x00, 0xA0, 0x14, 0x05, 0xFF, 0x00, 0x1E, 0x48, 0x74,
-    0x05, 0x01, 0x80, 0x20, 0x08, 0x02, 0x00, 0x80, 0x20, 0x04, 0x01, 0x01,
-    0x30, 0x87, 0xC0, 0xFE, 0x10, 0x44, 0x09, 0x02, 0x40, 0x50, 0x14, 0x05,
-    0x01, 0x40, 0x50, 0x14, 0x0D, 0x02, 0x41, 0x3F, 0x80, 0xFF, 0xC8, 0x09,
-    0x01, 0x20, 0x04, 0x00, 0x88, 0x1F, 0x02, 0x20, 0x40, 0x08, 0x01, 0x00,
-    0xA0, 0x14, 0x03, 0xFF, 0xC0, 0xFF, 0xE8, 0x05, 0x00, 0xA0, 0x04, 0x00,
-    0x88, 0x1F, 0x02, 0x20, 0x40, 0x08, 0x01, 0x00, 0x20, 0x04, 0x01, 0xF0,
-    0x00, 0x1F, 0x46, 0x19, 0x01, 0x60, 0x28, 0x01, 0x00, 0x20, 0x04, 0x00,
-    0x83, 0xF0, 0x0B, 0x01, 0x20, 0x23, 0x0C, 0x3E, 0x00, 0xE1, 0xD0, 0x24,
-    0x09, 0x02, 0x40, 0x90, 0x27, 0xF9, 0x02, 0x40, 0x90, 0x24, 0x09, 0x02,
-    0x40, 0xB8, 0x70, 0xFE, 0x20, 0x40, 0x81, 0x02, 0x04, 0x08, 0x10, 0x20,
-    0x40, 0x81, 0x1F, 0xC0, 0x0F, 0xE0, 0x10, 0x02, 0x00, 0x40, 0x08, 0x01,
-    0x00, 0x20, 0x04, 0x80, 0x90, 0x12, 0x02, 0x40, 0xC6, 0x30, 0x7C, 0x00,
-    0xF1, 0xE4, 0x0C, 0x41, 0x04, 0x20, 0x44, 0x04, 0x80, 0x5C, 0x06, 0x60,
-    0x43, 0x04, 0x10, 0x40, 0x84, 0x08, 0x40, 0xCF, 0x07, 0xF8, 0x04, 0x00,
-    0x80, 0x10, 0x02, 0x00, 0x40, 0x08, 0x01, 0x00, 0x20, 0x04, 0x04, 0x80,
-    0x90, 0x12, 0x03, 0xFF, 0xC0, 0xE0, 0x3B, 0x01, 0x94, 0x14, 0xA0, 0xA4,
-    0x89, 0x24, 0x49, 0x14, 0x48, 0xA2, 0x45, 0x12, 0x10, 0x90, 0x04, 0x80,
-    0x24, 0x01, 0x78, 0x3C, 0xE0, 0xF6, 0x02, 0x50, 0x25, 0x02, 0x48, 0x24,
-    0xC2, 0x44, 0x24, 0x22, 0x43, 0x24, 0x12, 0x40, 0xA4, 0x0A, 0x40, 0x6F,
-    0x06, 0x0F, 0x03, 0x0C, 0x60, 0x64, 0x02, 0x80, 0x18, 0x01, 0x80, 0x18,
-    0x01, 0x80, 0x18, 0x01, 0x40, 0x26, 0x06, 0x30, 0xC0, 0xF0, 0xFF, 0x10,
-    0x64, 0x05, 0x01, 0x40, 0x50, 0x34, 0x19, 0xFC, 0x40, 0x10, 0x04, 0x01,
-    0x00, 0x40, 0x3E, 0x00, 0x0F, 0x03, 0x0C, 0x60, 0x64, 0x02, 0x80, 0x18,
-    0x01, 0x80, 0x18, 0x01, 0x80, 0x18, 0x01, 0x40, 0x26, 0x06, 0x30, 0xC1,
-    0xF0, 0x0C, 0x01, 0xF1, 0x30, 0xE0, 0xFF, 0x04, 0x18, 0x40, 0xC4, 0x04,
-    0x40, 0x44, 0x0C, 0x41, 0x87, 0xE0, 0x43, 0x04, 0x10, 0x40, 0x84, 0x04,
-    0x40, 0x4F, 0x03, 0x1F, 0x48, 0x34, 0x05, 0x01, 0x40, 0x08, 0x01, 0xC0,
-    0x0E, 0x00, 0x40, 0x18, 0x06, 0x01, 0xE1, 0xA7, 0xC0, 0xFF, 0xF0, 0x86,
-    0x10, 0x82, 0x00, 0x40, 0x08, 0x01, 0x00, 0x20, 0x04, 0x00, 0x80, 0x10,
-    0x02, 0x00, 0x40, 0x7F, 0x00, 0xF0, 0xF4, 0x02, 0x40, 0x24, 0x02, 0x40,
-    0x24, 0x02, 0x40, 0x24, 0x02, 0x40, 0x24, 0x02, 0x40, 0x22, 0x04, 0x30,
-    0xC0, 0xF0, 0xF8, 0x7C, 0x80, 0x22, 0x01, 0x04, 0x04, 0x10, 0x20, 0x40,
-    0x80, 0x82, 0x02, 0x10, 0x08, 0x40, 0x11, 0x00, 0x48, 0x01, 0xA0, 0x03,
-    0x00, 0x0C, 0x00, 0xF8, 0x7C, 0x80, 0x22, 0x00, 0x88, 0xC2, 0x23, 0x10,
-    0x8E, 0x42, 0x29, 0x09, 0x24, 0x24, 0x90, 0x91, 0x41, 0x85, 0x06, 0x14,
-    0x18, 0x70, 0x60, 0x80, 0xF0, 0xF2, 0x06, 0x30, 0x41, 0x08, 0x09, 0x80,
-    0x50, 0x06, 0x00, 0x60, 0x0D, 0x00, 0x88, 0x10, 0xC2, 0x04, 0x60, 0x2F,
-    0x0F, 0xF0, 0xF2, 0x02, 0x10, 0x41, 0x04, 0x08, 0x80, 0x50, 0x05, 0x00,
-    0x20, 0x02, 0x00, 0x20, 0x02, 0x00, 0x20, 0x02, 0x01, 0xFC, 0xFF, 0x40,
-    0xA0, 0x90, 0x40, 0x40, 0x40, 0x20, 0x20, 0x20, 0x10, 0x50, 0x30, 0x18,
-    0x0F, 0xFC, 0xF2, 0x49, 0x24, 0x92, 0x49, 0x24, 0x9C, 0x80, 0x60, 0x10,
-    0x08, 0x02, 0x01, 0x00, 0x40, 0x20, 0x08, 0x04, 0x01, 0x00, 0x80, 0x20,
-    0x10, 0x04, 0x02, 0x00, 0x80, 0x40, 0xE4, 0x92, 0x49, 0x24, 0x92, 0x49,
-    0x3C, 0x08, 0x0C, 0x09, 0x0C, 0x4C, 0x14, 0x04, 0xFF, 0xFC, 0x84, 0x21,
-    0x3E, 0x00, 0x60, 0x08, 0x02, 0x3F, 0x98, 0x28, 0x0A, 0x02, 0xC3, 0x9F,
-    0x30, 0xE0, 0x01, 0x00, 0x08, 0x00, 0x40, 0x02, 0x00, 0x13, 0xE0, 0xA0,
-    0x86, 0x02, 0x20, 0x09, 0x00, 0x48, 0x02, 0x40, 0x13, 0x01, 0x14, 0x1B,
-    0x9F, 0x00, 0x1F, 0x4C, 0x19, 0x01, 0x40, 0x28, 0x01, 0x00, 0x20, 0x02,
-    0x00, 0x60, 0x43, 0xF0, 0x00, 0xC0, 0x08, 0x01, 0x00, 0x20, 0x04, 0x3C,
-    0x98, 0x52, 0x06, 0x80, 0x50, 0x0A, 0x01, 0x40, 0x24, 0x0C, 0xC2, 0x87,
-    0x98, 0x3F, 0x18, 0x68, 0x06, 0x01, 0xFF, 0xE0, 0x08, 0x03, 0x00, 0x60,
-    0xC7, 0xC0, 0x0F, 0x98, 0x08, 0x04, 0x02, 0x07, 0xF8, 0x80, 0x40, 0x20,
-    0x10, 0x08, 0x04, 0x02, 0x01, 0x03, 0xF8, 0x1E, 0x6C, 0x39, 0x03, 0x40,
-    0x28, 0x05, 0x00, 0xA0, 0x12, 0x06, 0x61, 0x43, 0xC8, 0x01, 0x00, 0x20,
-    0x08, 0x3E, 0x00, 0xC0, 0x10, 0x04, 0x01, 0x00, 0x40, 0x13, 0x87, 0x11,
-    0x82, 0x40, 0x90, 0x24, 0x09, 0x02, 0x40, 0x90, 0x2E, 0x1C, 0x08, 0x04,
-    0x02, 0x00, 0x00, 0x03, 0xC0, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01, 0x00,
-    0x80, 0x43, 0xFE, 0x04, 0x08, 0x10, 0x00, 0x1F, 0xC0, 0x81, 0x02, 0x04,
-    0x08, 0x10, 0x20, 0x40, 0x81, 0x02, 0x0B, 0xE0, 0xE0, 0x02, 0x00, 0x20,
-    0x02, 0x00, 0x20, 0x02, 0x3C, 0x21, 0x02, 0x60, 0x2C, 0x03, 0x80, 0x24,
-    0x02, 0x20, 0x21, 0x02, 0x08, 0xE1, 0xF0, 0x78, 0x04, 0x02, 0x01, 0x00,
-    0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01, 0x00, 0x80, 0x43, 0xFE,
-    0xDC, 0xE3, 0x19, 0x90, 0x84, 0x84, 0x24, 0x21, 0x21, 0x09, 0x08, 0x48,
-    0x42, 0x42, 0x17, 0x18, 0xC0, 0x67, 0x83, 0x84, 0x20, 0x22, 0x02, 0x20,
-    0x22, 0x02, 0x20, 0x22, 0x02, 0x20, 0x2F, 0x07, 0x1F, 0x04, 0x11, 0x01,
-    0x40, 0x18, 0x03, 0x00, 0x60, 0x0A, 0x02, 0x20, 0x83, 0xE0, 0xCF, 0x85,
-    0x06, 0x60, 0x24, 0x01, 0x40, 0x14, 0x01, 0x40, 0x16, 0x02, 0x50, 0x44,
-    0xF8, 0x40, 0x04, 0x00, 0x40, 0x0F, 0x00, 0x1E, 0x6C, 0x3B, 0x03, 0x40,
-    0x28, 0x05, 0x00, 0xA0, 0x12, 0x06, 0x61, 0x43, 0xC8, 0x01, 0x00, 0x20,
-    0x04, 0x03, 0xC0, 0xE3, 0x8B, 0x13, 0x80, 0x80, 0x20, 0x08, 0x02, 0x00,
-    0x80, 0x20, 0x3F, 0x80, 0x1F, 0x58, 0x34, 0x05, 0x80, 0x1E, 0x00, 0x60,
-    0x06, 0x01, 0xC0, 0xAF, 0xC0, 0x20, 0x04, 0x00, 0x80, 0x10, 0x0F, 0xF0,
-    0x40, 0x08, 0x01, 0x00, 0x20, 0x04, 0x00, 0x80, 0x10, 0x03, 0x04, 0x3F,
-    0x00, 0xC1, 0xC8, 0x09, 0x01, 0x20, 0x24, 0x04, 0x80, 0x90, 0x12, 0x02,
-    0x61, 0xC7, 0xCC, 0xF8, 0xF9, 0x01, 0x08, 0x10, 0x60, 0x81, 0x08, 0x08,
-    0x40, 0x22, 0x01, 0x20, 0x05, 0x00, 0x30, 0x00, 0xF0, 0x7A, 0x01, 0x10,
-    0x08, 0x8C, 0x42, 0x62, 0x12, 0x90, 0xA5, 0x05, 0x18, 0x28, 0xC0, 0x86,
-    0x00, 0x78, 0xF3, 0x04, 0x18, 0x80, 0xD0, 0x06, 0x00, 0x70, 0x09, 0x81,
-    0x0C, 0x20, 0x6F, 0x8F, 0xF0, 0xF2, 0x02, 0x20, 0x41, 0x04, 0x10, 0x80,
-    0x88, 0x09, 0x00, 0x50, 0x06, 0x00, 0x20, 0x04, 0x00, 0x40, 0x08, 0x0F,
-    0xE0, 0xFF, 0x41, 0x00, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x40, 0xBF,
-    0xC0, 0x19, 0x08, 0x42, 0x10, 0x84, 0x64, 0x18, 0x42, 0x10, 0x84, 0x20,
-    0xC0, 0xFF, 0xFF, 0xC0, 0xC1, 0x08, 0x42, 0x10, 0x84, 0x10, 0x4C, 0x42,
-    0x10, 0x84, 0x26, 0x00, 0x38, 0x13, 0x38, 0x38]
-
-FreeMono12pt7bGlyphs = [
-    #Index,  W, H,xAdv,dX, dY
-    [0, 0, 0, 14, 0, 1],        # 0x20 ' '
-    [0, 3, 15, 14, 6, -14],     # 0x21 '!'
-    [6, 8, 7, 14, 3, -14],      # 0x22 '"'
-    [13, 10, 16, 14, 2, -14],   # 0x23 '#'
-    [33, 10, 17, 14, 2, -14],   # 0x24 '$'
-    [55, 10, 15, 14, 2, -14],   # 0x25 '%'
-    [74, 9, 12, 14, 3, -11],    # 0x26 '&'
-    [88, 3, 7, 14, 5, -14],     # 0x27 '''
-    [91, 3, 18, 14, 7, -14],    # 0x28 '('
-    [98, 3, 18, 14, 4, -14],    # 0x29 ')'
-    [105, 9, 9, 14, 3, -14],    # 0x2A '*'
-    [116, 9, 11, 14, 3, -11],   # 0x2B '+'
-    [129, 5, 7, 14, 3, -3],     # 0x2C ','
-    [134, 11, 1, 14, 2, -6],    # 0x2D '-'
-    [136, 3, 3, 14, 5, -2],     # 0x2E '.'
-    [138, 9, 18, 14, 3, -15],   # 0x2F '/'
-    [159, 9, 15, 14, 3, -14],   # 0x30 '0'
-    [176, 7, 14, 14, 4, -13],   # 0x31 '1'
-    [189, 9, 15, 14, 2, -14],   # 0x32 '2'
-    [206, 10, 15, 14, 2, -14],  # 0x33 '3'
-    [225, 8, 15, 14, 3, -14],   # 0x34 '4'
-    [240, 9, 15, 14, 3, -14],   # 0x35 '5'
-    [257, 9, 15, 14, 3, -14],   # 0x36 '6'
-    [274, 8, 15, 14, 3, -14],   # 0x37 '7'
-    [289, 9, 15, 14, 3, -14],   # 0x38 '8'
-    [306, 9, 15, 14, 3, -14],   # 0x39 '9'
-    [323, 3, 10, 14, 5, -9],    # 0x3A ':'
-    [327, 5, 13, 14, 3, -9],    # 0x3B ';'
-    [336, 11, 11, 14, 2, -11],  # 0x3C '<'
-    [352, 12, 4, 14, 1, -8],    # 0x3D '='
-    [358, 11, 11, 14, 2, -11],  # 0x3E '>'
-    [374, 9, 14, 14, 3, -13],   # 0x3F '?'
-    [390, 9, 16, 14, 3, -14],   # 0x40 '@'
-    [408, 14, 14, 14, 0, -13],  # 0x41 'A'
-    [433, 11, 14, 14, 2, -13],  # 0x42 'B'
-    [453, 10, 14, 14, 2, -13],  # 0x43 'C'
-    [471, 10, 14, 14, 2, -13],  # 0x44 'D'
-    [489, 11, 14, 14, 2, -13],  # 0x45 'E'
-    [509, 11, 14, 14, 2, -13],  # 0x46 'F'
-    [529, 11, 14, 14, 2, -13],  # 0x47 'G'
-    [549, 10, 14, 14, 2, -13],  # 0x48 'H'
-    [567, 7, 14, 14, 4, -13],   # 0x49 'I'
-    [580, 11, 14, 14, 2, -13],  # 0x4A 'J'
-    [600, 12, 14, 14, 2, -13],  # 0x4B 'K'
-    [621, 11, 14, 14, 2, -13],  # 0x4C 'L'
-    [641, 13, 14, 14, 1, -13],  # 0x4D 'M'
-    [664, 12, 14, 14, 1, -13],  # 0x4E 'N'
-    [685, 12, 14, 14, 1, -13],  # 0x4F 'O'
-    [706, 10, 14, 14, 2, -13],  # 0x50 'P'
-    [724, 12, 17, 14, 1, -13],  # 0x51 'Q'
-    [750, 12, 14, 14, 2, -13],  # 0x52 'R'
-    [771, 10, 14, 14, 2, -13],  # 0x53 'S'
-    [789, 11, 14, 14, 2, -13],  # 0x54 'T'
-    [809, 12, 14, 14, 1, -13],  # 0x55 'U'
-    [830, 14, 14, 14, 0, -13],  # 0x56 'V'
-    [855, 14, 14, 14, 0, -13],  # 0x57 'W'
-    [880, 12, 14, 14, 1, -13],  # 0x58 'X'
-    [901, 12, 14, 14, 1, -13],  # 0x59 'Y'
-    [922, 9, 14, 14, 3, -13],   # 0x5A 'Z'
-    [938, 3, 18, 14, 7, -14],   # 0x5B '['
-    [945, 9, 18, 14, 3, -15],   # 0x5C '\'
-    [966, 3, 18, 14, 5, -14],   # 0x5D ']'
-    [973, 9, 6, 14, 3, -14],    # 0x5E '^'
-    [980, 14, 1, 14, 0, 3],     # 0x5F '_'
-    [982, 4, 4, 14, 4, -15],    # 0x60 '`'
-    [984, 10, 10, 14, 2, -9],   # 0x61 'a'
-    [997, 13, 15, 14, 0, -14],  # 0x62 'b'
-    [1022, 11, 10, 14, 2, -9],  # 0x63 'c'
-    [1036, 11, 15, 14, 2, -14], # 0x64 'd'
-    [1057, 10, 10, 14, 2, -9],  # 0x65 'e'
-    [1070, 9, 15, 14, 4, -14],  # 0x66 'f'
-    [1087, 11, 14, 14, 2, -9],  # 0x67 'g'
-    [1107, 10, 15, 14, 2, -14], # 0x68 'h'
-    [1126, 9, 15, 14, 3, -14],  # 0x69 'i'
-    [1143, 7, 19, 14, 3, -14],  # 0x6A 'j'
-    [1160, 12, 15, 14, 1, -14], # 0x6B 'k'
-    [1183, 9, 15, 14, 3, -14],  # 0x6C 'l'
-    [1200, 13, 10, 14, 1, -9],  # 0x6D 'm'
-    [1217, 12, 10, 14, 1, -9],  # 0x6E 'n'
-    [1232, 11, 10, 14, 2, -9],  # 0x6F 'o'
-    [1246, 12, 14, 14, 1, -9],  # 0x70 'p'
-    [1267, 11, 14, 14, 2, -9],  # 0x71 'q'
-    [1287, 10, 10, 14, 3, -9],  # 0x72 'r'
-    [1300, 10, 10, 14, 2, -9],  # 0x73 's'
-    [1313, 11, 14, 14, 1, -13], # 0x74 't'
-    [1333, 11, 10, 14, 2, -9],  # 0x75 'u'
-    [1347, 13, 10, 14, 1, -9],  # 0x76 'v'
-    [1364, 13, 10, 14, 1, -9],  # 0x77 'w'
-    [1381, 12, 10, 14, 1, -9],  # 0x78 'x'
-    [1396, 12, 14, 14, 1, -9],  # 0x79 'y'
-    [1417, 9, 10, 14, 3, -9],   # 0x7A 'z'
-    [1429, 5, 18, 14, 5, -14],  # 0x7B '['
-    [1441, 1, 18, 14, 7, -14],  # 0x7C '|'
-    [1444, 5, 18, 14, 5, -14],  # 0x7D ']'
-    [1456, 10, 3, 14, 2, -7]]  # 0x7E '~'
\ No newline at end of file
+# FreeMono12pt7b, converted by fontconv.py from FreeMono12pt7b.py
+# bitmaps : 1 bit per pixel, row after row for each glyph
+# glyphs : 7 bytes per character from first to last : bitmap offset (2 bytes, little
+# endian), width, height, x advance, x offset, y offset (signed bytes)
+first=32
+last=126
+char_width=19
+char_height=19
+line_spacing=2
+bitmaps=(
+    b'\x49\x24\x92\x48\x01\xf8\xe7\xe7\x67\x42\x42\x42\x42\x09\x02\x41'
+    b'\x10\x44\x11\x1f\xf1\x10\x4c\x12\x3f\xe1\x20\x48\x12\x04\x81\x20'
+    b'\x48\x04\x07\xa2\x19\x02\x40\x10\x03\x00\x3c\x00\x80\x10\x06\x01'
+    b'\xe0\xa7\xc0\x40\x10\x04\x00\x3c\x19\x84\x21\x08\x66\x0f\x00\x0c'
+    b'\x1c\x78\x01\xe0\xcc\x21\x08\x43\x30\x78\x3e\x30\x10\x08\x02\x03'
+    b'\x03\x47\x14\x8a\x43\x11\x8f\x60\xfd\xa4\x90\x05\x25\x24\x92\x48'
+    b'\x92\x24\x11\x24\x89\x24\x92\x92\x90\x00\x04\x02\x11\x07\xf0\xc0'
+    b'\x50\x48\x42\x00\x08\x04\x02\x01\x00\x87\xfc\x20\x10\x08\x04\x02'
+    b'\x00\x3b\x9c\xce\x62\x00\xff\xe0\xff\x80\x00\x80\xc0\x40\x20\x20'
+    b'\x10\x10\x08\x08\x04\x04\x02\x02\x01\x01\x00\x80\x80\x40\x00\x1c'
+    b'\x31\x90\x58\x38\x0c\x06\x03\x01\x80\xc0\x60\x30\x34\x13\x18\x70'
+    b'\x30\xe1\x44\x81\x02\x04\x08\x10\x20\x40\x81\x1f\xc0\x1e\x10\x90'
+    b'\x68\x10\x08\x0c\x04\x04\x04\x06\x06\x06\x06\x0e\x07\xfe\x3e\x10'
+    b'\x40\x08\x02\x00\x80\x40\xe0\x04\x00\x80\x10\x04\x01\x00\xd8\x63'
+    b'\xe0\x06\x0a\x0a\x12\x22\x22\x42\x42\x82\x82\xff\x02\x02\x02\x0f'
+    b'\x7f\x20\x10\x08\x04\x02\xf1\x8c\x03\x00\x80\x40\x20\x18\x16\x18'
+    b'\xf0\x0f\x8c\x08\x08\x04\x04\x02\x79\x46\xc1\xe0\x60\x28\x14\x19'
+    b'\x08\x78\xff\x81\x81\x02\x02\x02\x02\x04\x04\x04\x04\x08\x08\x08'
+    b'\x08\x3e\x31\xb0\x70\x18\x0c\x05\x8c\x38\x63\x40\x60\x30\x18\x1b'
+    b'\x18\xf8\x3c\x31\x30\x50\x28\x0c\x0f\x06\x85\x3c\x80\x40\x40\x20'
+    b'\x20\x63\xe0\xff\x80\x07\xfc\x39\xce\x00\x00\x06\x33\x98\xc4\x00'
+    b'\x00\xc0\x60\x18\x0c\x06\x01\x80\x0c\x00\x60\x03\x00\x30\x01\x00'
+    b'\xff\xf0\x00\x00\x0f\xff\xc0\x06\x00\x30\x01\x80\x18\x01\x80\xc0'
+    b'\x30\x18\x0c\x02\x00\x00\x3e\x60\xa0\x20\x10\x08\x08\x18\x10\x08'
+    b'\x00\x00\x00\x01\xc0\xe0\x1c\x31\x10\x50\x28\x14\x3a\x25\x22\x91'
+    b'\x4c\xa3\xf0\x08\x02\x01\x80\x7c\x3f\x00\x0c\x00\x48\x01\x20\x04'
+    b'\x40\x21\x00\x84\x04\x08\x1f\xe0\x40\x82\x01\x08\x04\x20\x13\xe1'
+    b'\xf0\xff\x08\x11\x01\x20\x24\x04\x81\x1f\xc2\x06\x40\x68\x05\x00'
+    b'\xa0\x14\x05\xff\x00\x1e\x48\x74\x05\x01\x80\x20\x08\x02\x00\x80'
+    b'\x20\x04\x01\x01\x30\x87\xc0\xfe\x10\x44\x09\x02\x40\x50\x14\x05'
+    b'\x01\x40\x50\x14\x0d\x02\x41\x3f\x80\xff\xc8\x09\x01\x20\x04\x00'
+    b'\x88\x1f\x02\x20\x40\x08\x01\x00\xa0\x14\x03\xff\xc0\xff\xe8\x05'
+    b'\x00\xa0\x04\x00\x88\x1f\x02\x20\x40\x08\x01\x00\x20\x04\x01\xf0'
+    b'\x00\x1f\x46\x19\x01\x60\x28\x01\x00\x20\x04\x00\x83\xf0\x0b\x01'
+    b'\x20\x23\x0c\x3e\x00\xe1\xd0\x24\x09\x02\x40\x90\x27\xf9\x02\x40'
+    b'\x90\x24\x09\x02\x40\xb8\x70\xfe\x20\x40\x81\x02\x04\x08\x10\x20'
+    b'\x40\x81\x1f\xc0\x0f\xe0\x10\x02\x00\x40\x08\x01\x00\x20\x04\x80'
+    b'\x90\x12\x02\x40\xc6\x30\x7c\x00\xf1\xe4\x0c\x41\x04\x20\x44\x04'
+    b'\x80\x5c\x06\x60\x43\x04\x10\x40\x84\x08\x40\xcf\x07\xf8\x04\x00'
+    b'\x80\x10\x02\x00\x40\x08\x01\x00\x20\x04\x04\x80\x90\x12\x03\xff'
+    b'\xc0\xe0\x3b\x01\x94\x14\xa0\xa4\x89\x24\x49\x14\x48\xa2\x45\x12'
+    b'\x10\x90\x04\x80\x24\x01\x78\x3c\xe0\xf6\x02\x50\x25\x02\x48\x24'
+    b'\xc2\x44\x24\x22\x43\x24\x12\x40\xa4\x0a\x40\x6f\x06\x0f\x03\x0c'
+    b'\x60\x64\x02\x80\x18\x01\x80\x18\x01\x80\x18\x01\x40\x26\x06\x30'
+    b'\xc0\xf0\xff\x10\x64\x05\x01\x40\x50\x34\x19\xfc\x40\x10\x04\x01'
+    b'\x00\x40\x3e\x00\x0f\x03\x0c\x60\x64\x02\x80\x18\x01\x80\x18\x01'
+    b'\x80\x18\x01\x40\x26\x06\x30\xc1\xf0\x0c\x01\xf1\x30\xe0\xff\x04'
+    b'\x18\x40\xc4\x04\x40\x44\x0c\x41\x87\xe0\x43\x04\x10\x40\x84\x04'
+    b'\x40\x4f\x03\x1f\x48\x34\x05\x01\x40\x08\x01\xc0\x0e\x00\x40\x18'
+    b'\x06\x01\xe1\xa7\xc0\xff\xf0\x86\x10\x82\x00\x40\x08\x01\x00\x20'
+    b'\x04\x00\x80\x10\x02\x00\x40\x7f\x00\xf0\xf4\x02\x40\x24\x02\x40'
+    b'\x24\x02\x40\x24\x02\x40\x24\x02\x40\x22\x04\x30\xc0\xf0\xf8\x7c'
+    b'\x80\x22\x01\x04\x04\x10\x20\x40\x80\x82\x02\x10\x08\x40\x11\x00'
+    b'\x48\x01\xa0\x03\x00\x0c\x00\xf8\x7c\x80\x22\x00\x88\xc2\x23\x10'
+    b'\x8e\x42\x29\x09\x24\x24\x90\x91\x41\x85\x06\x14\x18\x70\x60\x80'
+    b'\xf0\xf2\x06\x30\x41\x08\x09\x80\x50\x06\x00\x60\x0d\x00\x88\x10'
+    b'\xc2\x04\x60\x2f\x0f\xf0\xf2\x02\x10\x41\x04\x08\x80\x50\x05\x00'
+    b'\x20\x02\x00\x20\x02\x00\x20\x02\x01\xfc\xff\x40\xa0\x90\x40\x40'
+    b'\x40\x20\x20\x20\x10\x50\x30\x18\x0f\xfc\xf2\x49\x24\x92\x49\x24'
+    b'\x9c\x80\x60\x10\x08\x02\x01\x00\x40\x20\x08\x04\x01\x00\x80\x20'
+    b'\x10\x04\x02\x00\x80\x40\xe4\x92\x49\x24\x92\x49\x3c\x08\x0c\x09'
+    b'\x0c\x4c\x14\x04\xff\xfc\x84\x21\x3e\x00\x60\x08\x02\x3f\x98\x28'
+    b'\x0a\x02\xc3\x9f\x30\xe0\x01\x00\x08\x00\x40\x02\x00\x13\xe0\xa0'
+    b'\x86\x02\x20\x09\x00\x48\x02\x40\x13\x01\x14\x1b\x9f\x00\x1f\x4c'
+    b'\x19\x01\x40\x28\x01\x00\x20\x02\x00\x60\x43\xf0\x00\xc0\x08\x01'
+    b'\x00\x20\x04\x3c\x98\x52\x06\x80\x50\x0a\x01\x40\x24\x0c\xc2\x87'
+    b'\x98\x3f\x18\x68\x06\x01\xff\xe0\x08\x03\x00\x60\xc7\xc0\x0f\x98'
+    b'\x08\x04\x02\x07\xf8\x80\x40\x20\x10\x08\x04\x02\x01\x03\xf8\x1e'
+    b'\x6c\x39\x03\x40\x28\x05\x00\xa0\x12\x06\x61\x43\xc8\x01\x00\x20'
+    b'\x08\x3e\x00\xc0\x10\x04\x01\x00\x40\x13\x87\x11\x82\x40\x90\x24'
+    b'\x09\x02\x40\x90\x2e\x1c\x08\x04\x02\x00\x00\x03\xc0\x20\x10\x08'
+    b'\x04\x02\x01\x00\x80\x43\xfe\x04\x08\x10\x00\x1f\xc0\x81\x02\x04'
+    b'\x08\x10\x20\x40\x81\x02\x0b\xe0\xe0\x02\x00\x20\x02\x00\x20\x02'
+    b'\x3c\x21\x02\x60\x2c\x03\x80\x24\x02\x20\x21\x02\x08\xe1\xf0\x78'
+    b'\x04\x02\x01\x00\x80\x40\x20\x10\x08\x04\x02\x01\x00\x80\x43\xfe'
+    b'\xdc\xe3\x19\x90\x84\x84\x24\x21\x21\x09\x08\x48\x42\x42\x17\x18'
+    b'\xc0\x67\x83\x84\x20\x22\x02\x20\x22\x02\x20\x22\x02\x20\x2f\x07'
+    b'\x1f\x04\x11\x01\x40\x18\x03\x00\x60\x0a\x02\x20\x83\xe0\xcf\x85'
+    b'\x06\x60\x24\x01\x40\x14\x01\x40\x16\x02\x50\x44\xf8\x40\x04\x00'
+    b'\x40\x0f\x00\x1e\x6c\x3b\x03\x40\x28\x05\x00\xa0\x12\x06\x61\x43'
+    b'\xc8\x01\x00\x20\x04\x03\xc0\xe3\x8b\x13\x80\x80\x20\x08\x02\x00'
+    b'\x80\x20\x3f\x80\x1f\x58\x34\x05\x80\x1e\x00\x60\x06\x01\xc0\xaf'
+    b'\xc0\x20\x04\x00\x80\x10\x0f\xf0\x40\x08\x01\x00\x20\x04\x00\x80'
+    b'\x10\x03\x04\x3f\x00\xc1\xc8\x09\x01\x20\x24\x04\x80\x90\x12\x02'
+    b'\x61\xc7\xcc\xf8\xf9\x01\x08\x10\x60\x81\x08\x08\x40\x22\x01\x20'
+    b'\x05\x00\x30\x00\xf0\x7a\x01\x10\x08\x8c\x42\x62\x12\x90\xa5\x05'
+    b'\x18\x28\xc0\x86\x00\x78\xf3\x04\x18\x80\xd0\x06\x00\x70\x09\x81'
+    b'\x0c\x20\x6f\x8f\xf0\xf2\x02\x20\x41\x04\x10\x80\x88\x09\x00\x50'
+    b'\x06\x00\x20\x04\x00\x40\x08\x0f\xe0\xff\x41\x00\x80\x80\x80\x80'
+    b'\x80\x80\x40\xbf\xc0\x19\x08\x42\x10\x84\x64\x18\x42\x10\x84\x20'
+    b'\xc0\xff\xff\xc0\xc1\x08\x42\x10\x84\x10\x4c\x42\x10\x84\x26\x00'
+    b'\x38\x13\x38\x38')
+glyphs=(
+    b'\x00\x00\x00\x00\x0e\x00\x01\x00\x00\x03\x0f\x0e\x06\xf2'
+    b'\x06\x00\x08\x07\x0e\x03\xf2\x0d\x00\x0a\x10\x0e\x02\xf2'
+    b'\x21\x00\x0a\x11\x0e\x02\xf2\x37\x00\x0a\x0f\x0e\x02\xf2'
+    b'\x4a\x00\x09\x0c\x0e\x03\xf5\x58\x00\x03\x07\x0e\x05\xf2'
+    b'\x5b\x00\x03\x12\x0e\x07\xf2\x62\x00\x03\x12\x0e\x04\xf2'
+    b'\x69\x00\x09\x09\x0e\x03\xf2\x74\x00\x09\x0b\x0e\x03\xf5'
+    b'\x81\x00\x05\x07\x0e\x03\xfd\x86\x00\x0b\x01\x0e\x02\xfa'
+    b'\x88\x00\x03\x03\x0e\x05\xfe\x8a\x00\x09\x12\x0e\x03\xf1'
+    b'\x9f\x00\x09\x0f\x0e\x03\xf2\xb0\x00\x07\x0e\x0e\x04\xf3'
+    b'\xbd\x00\x09\x0f\x0e\x02\xf2\xce\x00\x0a\x0f\x0e\x02\xf2'
+    b'\xe1\x00\x08\x0f\x0e\x03\xf2\xf0\x00\x09\x0f\x0e\x03\xf2'
+    b'\x01\x01\x09\x0f\x0e\x03\xf2\x12\x01\x08\x0f\x0e\x03\xf2'
+    b'\x21\x01\x09\x0f\x0e\x03\xf2\x32\x01\x09\x0f\x0e\x03\xf2'
+    b'\x43\x01\x03\x0a\x0e\x05\xf7\x47\x01\x05\x0d\x0e\x03\xf7'
+    b'\x50\x01\x0b\x0b\x0e\x02\xf5\x60\x01\x0c\x04\x0e\x01\xf8'
+    b'\x66\x01\x0b\x0b\x0e\x02\xf5\x76\x01\x09\x0e\x0e\x03\xf3'
+    b'\x86\x01\x09\x10\x0e\x03\xf2\x98\x01\x0e\x0e\x0e\x00\xf3'
+    b'\xb1\x01\x0b\x0e\x0e\x02\xf3\xc5\x01\x0a\x0e\x0e\x02\xf3'
+    b'\xd7\x01\x0a\x0e\x0e\x02\xf3\xe9\x01\x0b\x0e\x0e\x02\xf3'
+    b'\xfd\x01\x0b\x0e\x0e\x02\xf3\x11\x02\x0b\x0e\x0e\x02\xf3'
+    b'\x25\x02\x0a\x0e\x0e\x02\xf3\x37\x02\x07\x0e\x0e\x04\xf3'
+    b'\x44\x02\x0b\x0e\x0e\x02\xf3\x58\x02\x0c\x0e\x0e\x02\xf3'
+    b'\x6d\x02\x0b\x0e\x0e\x02\xf3\x81\x02\x0d\x0e\x0e\x01\xf3'
+    b'\x98\x02\x0c\x0e\x0e\x01\xf3\xad\x02\x0c\x0e\x0e\x01\xf3'
+    b'\xc2\x02\x0a\x0e\x0e\x02\xf3\xd4\x02\x0c\x11\x0e\x01\xf3'
+    b'\xee\x02\x0c\x0e\x0e\x02\xf3\x03\x03\x0a\x0e\x0e\x02\xf3'
+    b'\x15\x03\x0b\x0e\x0e\x02\xf3\x29\x03\x0c\x0e\x0e\x01\xf3'
+    b'\x3e\x03\x0e\x0e\x0e\x00\xf3\x57\x03\x0e\x0e\x0e\x00\xf3'
+    b'\x70\x03\x0c\x0e\x0e\x01\xf3\x85\x03\x0c\x0e\x0e\x01\xf3'
+    b'\x9a\x03\x09\x0e\x0e\x03\xf3\xaa\x03\x03\x12\x0e\x07\xf2'
+    b'\xb1\x03\x09\x12\x0e\x03\xf1\xc6\x03\x03\x12\x0e\x05\xf2'
+    b'\xcd\x03\x09\x06\x0e\x03\xf2\xd4\x03\x0e\x01\x0e\x00\x03'
+    b'\xd6\x03\x04\x04\x0e\x04\xf1\xd8\x03\x0a\x0a\x0e\x02\xf7'
+    b'\xe5\x03\x0d\x0f\x0e\x00\xf2\xfe\x03\x0b\x0a\x0e\x02\xf7'
+    b'\x0c\x04\x0b\x0f\x0e\x02\xf2\x21\x04\x0a\x0a\x0e\x02\xf7'
+    b'\x2e\x04\x09\x0f\x0e\x04\xf2\x3f\x04\x0b\x0e\x0e\x02\xf7'
+    b'\x53\x04\x0a\x0f\x0e\x02\xf2\x66\x04\x09\x0f\x0e\x03\xf2'
+    b'\x77\x04\x07\x13\x0e\x03\xf2\x88\x04\x0c\x0f\x0e\x01\xf2'
+    b'\x9f\x04\x09\x0f\x0e\x03\xf2\xb0\x04\x0d\x0a\x0e\x01\xf7'
+    b'\xc1\x04\x0c\x0a\x0e\x01\xf7\xd0\x04\x0b\x0a\x0e\x02\xf7'
+    b'\xde\x04\x0c\x0e\x0e\x01\xf7\xf3\x04\x0b\x0e\x0e\x02\xf7'
+    b'\x07\x05\x0a\x0a\x0e\x03\xf7\x14\x05\x0a\x0a\x0e\x02\xf7'
+    b'\x21\x05\x0b\x0e\x0e\x01\xf3\x35\x05\x0b\x0a\x0e\x02\xf7'
+    b'\x43\x05\x0d\x0a\x0e\x01\xf7\x54\x05\x0d\x0a\x0e\x01\xf7'
+    b'\x65\x05\x0c\x0a\x0e\x01\xf7\x74\x05\x0c\x0e\x0e\x01\xf7'
+    b'\x89\x05\x09\x0a\x0e\x03\xf7\x95\x05\x05\x12\x0e\x05\xf2'
+    b'\xa1\x05\x01\x12\x0e\x07\xf2\xa4\x05\x05\x12\x0e\x05\xf2'
+    b'\xb0\x05\x0a\x03\x0e\x02\xf9')
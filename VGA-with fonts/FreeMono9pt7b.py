@@ -1,170 +1,112 @@
-FreeMono9pt7bBitmaps = [
-    0xAA, 0xA8, 0x0C, 0xED, 0x24, 0x92, 0x48, 0x24, 0x48, 0x91, 0x2F, 0xE4,
-    0x89, 0x7F, 0x28, 0x51, 0x22, 0x40, 0x08, 0x3E, 0x62, 0x40, 0x30, 0x0E,
-    0x01, 0x81, 0xC3, 0xBE, 0x08, 0x08, 0x71, 0x12, 0x23, 0x80, 0x23, 0xB8,
-    0x0E, 0x22, 0x44, 0x70, 0x38, 0x81, 0x02, 0x06, 0x1A, 0x65, 0x46, 0xC8,
-    0xEC, 0xE9, 0x24, 0x5A, 0xAA, 0xA9, 0x40, 0xA9, 0x55, 0x5A, 0x80, 0x10,
-    0x22, 0x4B, 0xE3, 0x05, 0x11, 0x00, 0x10, 0x20, 0x47, 0xF1, 0x02, 0x04,
-    0x00, 0x6B, 0x48, 0xFF, 0x00, 0xF0, 0x02, 0x08, 0x10, 0x60, 0x81, 0x04,
-    0x08, 0x20, 0x41, 0x02, 0x08, 0x00, 0x38, 0x8A, 0x0C, 0x18, 0x30, 0x60,
-    0xC1, 0x82, 0x88, 0xE0, 0x27, 0x28, 0x42, 0x10, 0x84, 0x21, 0x3E, 0x38,
-    0x8A, 0x08, 0x10, 0x20, 0x82, 0x08, 0x61, 0x03, 0xF8, 0x7C, 0x06, 0x02,
-    0x02, 0x1C, 0x06, 0x01, 0x01, 0x01, 0x42, 0x3C, 0x18, 0xA2, 0x92, 0x8A,
-    0x28, 0xBF, 0x08, 0x21, 0xC0, 0x7C, 0x81, 0x03, 0xE4, 0x40, 0x40, 0x81,
-    0x03, 0x88, 0xE0, 0x1E, 0x41, 0x04, 0x0B, 0x98, 0xB0, 0xC1, 0xC2, 0x88,
-    0xE0, 0xFE, 0x04, 0x08, 0x20, 0x40, 0x82, 0x04, 0x08, 0x20, 0x40, 0x38,
-    0x8A, 0x0C, 0x14, 0x47, 0x11, 0x41, 0x83, 0x8C, 0xE0, 0x38, 0x8A, 0x1C,
-    0x18, 0x68, 0xCE, 0x81, 0x04, 0x13, 0xC0, 0xF0, 0x0F, 0x6C, 0x00, 0xD2,
-    0xD2, 0x00, 0x03, 0x04, 0x18, 0x60, 0x60, 0x18, 0x04, 0x03, 0xFF, 0x80,
-    0x00, 0x1F, 0xF0, 0x40, 0x18, 0x03, 0x00, 0x60, 0x20, 0x60, 0xC0, 0x80,
-    0x3D, 0x84, 0x08, 0x30, 0xC2, 0x00, 0x00, 0x00, 0x30, 0x3C, 0x46, 0x82,
-    0x8E, 0xB2, 0xA2, 0xA2, 0x9F, 0x80, 0x80, 0x40, 0x3C, 0x3C, 0x01, 0x40,
-    0x28, 0x09, 0x01, 0x10, 0x42, 0x0F, 0xC1, 0x04, 0x40, 0x9E, 0x3C, 0xFE,
-    0x21, 0x90, 0x48, 0x67, 0xE2, 0x09, 0x02, 0x81, 0x41, 0xFF, 0x80, 0x3E,
-    0xB0, 0xF0, 0x30, 0x08, 0x04, 0x02, 0x00, 0x80, 0x60, 0x8F, 0x80, 0xFE,
-    0x21, 0x90, 0x68, 0x14, 0x0A, 0x05, 0x02, 0x83, 0x43, 0x7F, 0x00, 0xFF,
-    0x20, 0x90, 0x08, 0x87, 0xC2, 0x21, 0x00, 0x81, 0x40, 0xFF, 0xC0, 0xFF,
-    0xA0, 0x50, 0x08, 0x87, 0xC2, 0x21, 0x00, 0x80, 0x40, 0x78, 0x00, 0x1E,
-    0x98, 0x6C, 0x0A, 0x00, 0x80, 0x20, 0xF8, 0x0B, 0x02, 0x60, 0x87, 0xC0,
-    0xE3, 0xA0, 0x90, 0x48, 0x27, 0xF2, 0x09, 0x04, 0x82, 0x41, 0x71, 0xC0,
-    0xF9, 0x08, 0x42, 0x10, 0x84, 0x27, 0xC0, 0x1F, 0x02, 0x02, 0x02, 0x02,
-    0x02, 0x82, 0x82, 0xC6, 0x78, 0xE3, 0xA1, 0x11, 0x09, 0x05, 0x83, 0x21,
-    0x08, 0x84, 0x41, 0x70, 0xC0, 0xE0, 0x40, 0x40, 0x40, 0x40, 0x40, 0x41,
-    0x41, 0x41, 0xFF, 0xE0, 0xEC, 0x19, 0x45, 0x28, 0xA4, 0xA4, 0x94, 0x91,
-    0x12, 0x02, 0x40, 0x5C, 0x1C, 0xC3, 0xB0, 0x94, 0x4A, 0x24, 0x92, 0x49,
-    0x14, 0x8A, 0x43, 0x70, 0x80, 0x1E, 0x31, 0x90, 0x50, 0x18, 0x0C, 0x06,
-    0x02, 0x82, 0x63, 0x0F, 0x00, 0xFE, 0x43, 0x41, 0x41, 0x42, 0x7C, 0x40,
-    0x40, 0x40, 0xF0, 0x1C, 0x31, 0x90, 0x50, 0x18, 0x0C, 0x06, 0x02, 0x82,
-    0x63, 0x1F, 0x04, 0x07, 0x92, 0x30, 0xFE, 0x21, 0x90, 0x48, 0x24, 0x23,
-    0xE1, 0x10, 0x84, 0x41, 0x70, 0xC0, 0x3A, 0xCD, 0x0A, 0x03, 0x01, 0x80,
-    0xC1, 0xC7, 0x78, 0xFF, 0xC4, 0x62, 0x21, 0x00, 0x80, 0x40, 0x20, 0x10,
-    0x08, 0x1F, 0x00, 0xE3, 0xA0, 0x90, 0x48, 0x24, 0x12, 0x09, 0x04, 0x82,
-    0x22, 0x0E, 0x00, 0xF1, 0xE8, 0x10, 0x82, 0x10, 0x42, 0x10, 0x22, 0x04,
-    0x80, 0x50, 0x0C, 0x00, 0x80, 0xF1, 0xE8, 0x09, 0x11, 0x25, 0x44, 0xA8,
-    0x55, 0x0C, 0xA1, 0x8C, 0x31, 0x84, 0x30, 0xE3, 0xA0, 0x88, 0x82, 0x80,
-    0x80, 0xC0, 0x90, 0x44, 0x41, 0x71, 0xC0, 0xE3, 0xA0, 0x88, 0x82, 0x81,
-    0x40, 0x40, 0x20, 0x10, 0x08, 0x1F, 0x00, 0xFD, 0x0A, 0x20, 0x81, 0x04,
-    0x10, 0x21, 0x83, 0xFC, 0xEA, 0xAA, 0xAA, 0xC0, 0x80, 0x81, 0x03, 0x02,
-    0x04, 0x04, 0x08, 0x08, 0x10, 0x10, 0x20, 0x20, 0xD5, 0x55, 0x55, 0xC0,
-    0x10, 0x51, 0x22, 0x28, 0x20, 0xFF, 0xE0, 0x88, 0x80, 0x7E, 0x00, 0x80,
-    0x47, 0xEC, 0x14, 0x0A, 0x0C, 0xFB, 0xC0, 0x20, 0x10, 0x0B, 0xC6, 0x12,
-    0x05, 0x02, 0x81, 0x40, 0xB0, 0xB7, 0x80, 0x3A, 0x8E, 0x0C, 0x08, 0x10,
-    0x10, 0x9E, 0x03, 0x00, 0x80, 0x47, 0xA4, 0x34, 0x0A, 0x05, 0x02, 0x81,
-    0x21, 0x8F, 0x60, 0x3C, 0x43, 0x81, 0xFF, 0x80, 0x80, 0x61, 0x3E, 0x3D,
-    0x04, 0x3E, 0x41, 0x04, 0x10, 0x41, 0x0F, 0x80, 0x3D, 0xA1, 0xA0, 0x50,
-    0x28, 0x14, 0x09, 0x0C, 0x7A, 0x01, 0x01, 0x87, 0x80, 0xC0, 0x20, 0x10,
-    0x0B, 0xC6, 0x32, 0x09, 0x04, 0x82, 0x41, 0x20, 0xB8, 0xE0, 0x10, 0x01,
-    0xC0, 0x81, 0x02, 0x04, 0x08, 0x11, 0xFC, 0x10, 0x3E, 0x10, 0x84, 0x21,
-    0x08, 0x42, 0x3F, 0x00, 0xC0, 0x40, 0x40, 0x4F, 0x44, 0x58, 0x70, 0x48,
-    0x44, 0x42, 0xC7, 0x70, 0x20, 0x40, 0x81, 0x02, 0x04, 0x08, 0x10, 0x23,
-    0xF8, 0xB7, 0x64, 0x62, 0x31, 0x18, 0x8C, 0x46, 0x23, 0x91, 0x5E, 0x31,
-    0x90, 0x48, 0x24, 0x12, 0x09, 0x05, 0xC7, 0x3E, 0x31, 0xA0, 0x30, 0x18,
-    0x0C, 0x05, 0x8C, 0x7C, 0xDE, 0x30, 0x90, 0x28, 0x14, 0x0A, 0x05, 0x84,
-    0xBC, 0x40, 0x20, 0x38, 0x00, 0x3D, 0xA1, 0xA0, 0x50, 0x28, 0x14, 0x09,
-    0x0C, 0x7A, 0x01, 0x00, 0x80, 0xE0, 0xCE, 0xA1, 0x82, 0x04, 0x08, 0x10,
-    0x7C, 0x3A, 0x8D, 0x0B, 0x80, 0xF0, 0x70, 0xDE, 0x40, 0x40, 0xFC, 0x40,
-    0x40, 0x40, 0x40, 0x40, 0x41, 0x3E, 0xC3, 0x41, 0x41, 0x41, 0x41, 0x41,
-    0x43, 0x3D, 0xE3, 0xA0, 0x90, 0x84, 0x42, 0x20, 0xA0, 0x50, 0x10, 0xE3,
-    0xC0, 0x92, 0x4B, 0x25, 0x92, 0xA9, 0x98, 0x44, 0xE3, 0x31, 0x05, 0x01,
-    0x01, 0x41, 0x11, 0x05, 0xC7, 0xE3, 0xA0, 0x90, 0x84, 0x42, 0x40, 0xA0,
-    0x60, 0x10, 0x10, 0x08, 0x3E, 0x00, 0xFD, 0x08, 0x20, 0x82, 0x08, 0x10,
-    0xBF, 0x29, 0x24, 0xA2, 0x49, 0x26, 0xFF, 0xF8, 0x89, 0x24, 0x8A, 0x49,
-    0x2C, 0x61, 0x24, 0x30]
-
-FreeMono9pt7bGlyphs = [
-    #Index,  W, H,xAdv,dX, dY
-    [0, 0, 0, 11, 0, 1],      # 0x20 ' '
-    [0, 2, 11, 11, 4, -10],   # 0x21 '!'
-    [3, 6, 5, 11, 2, -10],    # 0x22 '"'
-    [7, 7, 12, 11, 2, -10],   # 0x23 '#'
-    [18, 8, 12, 11, 1, -10],  # 0x24 '$'
-    [30, 7, 11, 11, 2, -10],  # 0x25 '%'
-    [40, 7, 10, 11, 2, -9],   # 0x26 '&'
-    [49, 3, 5, 11, 4, -10],   # 0x27 '''
-    [51, 2, 13, 11, 5, -10],  # 0x28 '('
-    [55, 2, 13, 11, 4, -10],  # 0x29 ')'
-    [59, 7, 7, 11, 2, -10],   # 0x2A '*'
-    [66, 7, 7, 11, 2, -8],    # 0x2B '+'
-    [73, 3, 5, 11, 2, -1],    # 0x2C ','
-    [75, 9, 1, 11, 1, -5],    # 0x2D '-'
-    [77, 2, 2, 11, 4, -1],    # 0x2E '.'
-    [78, 7, 13, 11, 2, -11],  # 0x2F '/'
-    [90, 7, 11, 11, 2, -10],  # 0x30 '0'
-    [100, 5, 11, 11, 3, -10], # 0x31 '1'
-    [107, 7, 11, 11, 2, -10], # 0x32 '2'
-    [117, 8, 11, 11, 1, -10], # 0x33 '3'
-    [128, 6, 11, 11, 3, -10], # 0x34 '4'
-    [137, 7, 11, 11, 2, -10], # 0x35 '5'
-    [147, 7, 11, 11, 2, -10], # 0x36 '6'
-    [157, 7, 11, 11, 2, -10], # 0x37 '7'
-    [167, 7, 11, 11, 2, -10], # 0x38 '8'
-    [177, 7, 11, 11, 2, -10], # 0x39 '9'
-    [187, 2, 8, 11, 4, -7],   # 0x3A ':'
-    [189, 3, 11, 11, 3, -7],  # 0x3B ';'
-    [194, 8, 8, 11, 1, -8],   # 0x3C '<'
-    [202, 9, 4, 11, 1, -6],   # 0x3D '='
-    [207, 9, 8, 11, 1, -8],   # 0x3E '>'
-    [216, 7, 10, 11, 2, -9],  # 0x3F '?'
-    [225, 8, 12, 11, 2, -10], # 0x40 '@'
-    [237, 11, 10, 11, 0, -9], # 0x41 'A'
-    [251, 9, 10, 11, 1, -9],  # 0x42 'B'
-    [263, 9, 10, 11, 1, -9],  # 0x43 'C'
-    [275, 9, 10, 11, 1, -9],  # 0x44 'D'
-    [287, 9, 10, 11, 1, -9],  # 0x45 'E'
-    [299, 9, 10, 11, 1, -9],  # 0x46 'F'
-    [311, 10, 10, 11, 1, -9], # 0x47 'G'
-    [324, 9, 10, 11, 1, -9],  # 0x48 'H'
-    [336, 5, 10, 11, 3, -9],  # 0x49 'I'
-    [343, 8, 10, 11, 2, -9],  # 0x4A 'J'
-    [353, 9, 10, 11, 1, -9],  # 0x4B 'K'
-    [365, 8, 10, 11, 2, -9],  # 0x4C 'L'
-    [375, 11, 10, 11, 0, -9], # 0x4D 'M'
-    [389, 9, 10, 11, 1, -9],  # 0x4E 'N'
-    [401, 9, 10, 11, 1, -9],  # 0x4F 'O'
-    [413, 8, 10, 11, 1, -9],  # 0x50 'P'
-    [423, 9, 13, 11, 1, -9],  # 0x51 'Q'
-    [438, 9, 10, 11, 1, -9],  # 0x52 'R'
-    [450, 7, 10, 11, 2, -9],  # 0x53 'S'
-    [459, 9, 10, 11, 1, -9],  # 0x54 'T'
-    [471, 9, 10, 11, 1, -9],  # 0x55 'U'
-    [483, 11, 10, 11, 0, -9], # 0x56 'V'
-    [497, 11, 10, 11, 0, -9], # 0x57 'W'
-    [511, 9, 10, 11, 1, -9],  # 0x58 'X'
-    [523, 9, 10, 11, 1, -9],  # 0x59 'Y'
-    [535, 7, 10, 11, 2, -9],  # 0x5A 'Z'
-    [544, 2, 13, 11, 5, -10], # 0x5B '['
-    [548, 7, 13, 11, 2, -11], # 0x5C '\'
-    [560, 2, 13, 11, 4, -10], # 0x5D ']'
-    [564, 7, 5, 11, 2, -10],  # 0x5E '^'
-    [569, 11, 1, 11, 0, 2],   # 0x5F '_'
-    [571, 3, 3, 11, 3, -11],  # 0x60 '`'
-    [573, 9, 8, 11, 1, -7],   # 0x61 'a'
-    [582, 9, 11, 11, 1, -10], # 0x62 'b'
-    [595, 7, 8, 11, 2, -7],   # 0x63 'c'
-    [602, 9, 11, 11, 1, -10], # 0x64 'd'
-    [615, 8, 8, 11, 1, -7],   # 0x65 'e'
-    [623, 6, 11, 11, 3, -10], # 0x66 'f'
-    [632, 9, 11, 11, 1, -7],  # 0x67 'g'
-    [645, 9, 11, 11, 1, -10], # 0x68 'h'
-    [658, 7, 10, 11, 2, -9],  # 0x69 'i'
-    [667, 5, 13, 11, 3, -9],  # 0x6A 'j'
-    [676, 8, 11, 11, 2, -10], # 0x6B 'k'
-    [687, 7, 11, 11, 2, -10], # 0x6C 'l'
-    [697, 9, 8, 11, 1, -7],   # 0x6D 'm'
-    [706, 9, 8, 11, 1, -7],   # 0x6E 'n'
-    [715, 9, 8, 11, 1, -7],   # 0x6F 'o'
-    [724, 9, 11, 11, 1, -7],  # 0x70 'p'
-    [737, 9, 11, 11, 1, -7],  # 0x71 'q'
-    [750, 7, 8, 11, 3, -7],   # 0x72 'r'
-    [757, 7, 8, 11, 2, -7],   # 0x73 's'
-    [764, 8, 10, 11, 2, -9],  # 0x74 't'
-    [774, 8, 8, 11, 1, -7],   # 0x75 'u'
-    [782, 9, 8, 11, 1, -7],   # 0x76 'v'
-    [791, 9, 8, 11, 1, -7],   # 0x77 'w'
-    [800, 9, 8, 11, 1, -7],   # 0x78 'x'
-    [809, 9, 11, 11, 1, -7],  # 0x79 'y'
-    [822, 7, 8, 11, 2, -7],   # 0x7A 'z'
-    [829, 3, 13, 11, 4, -10], # 0x7B '['
-    [834, 1, 13, 11, 5, -10], # 0x7C '|'
-    [836, 3, 13, 11, 4, -10], # 0x7D ']'
-    [841, 7, 3, 11, 2, -6]]  # 0x7E '~'
\ No newline at end of file
+# FreeMono9pt7b, converted by fontconv.py from FreeMono9pt7b.py
+# bitmaps : 1 bit per pixel, row after row for each glyph
+# glyphs : 7 bytes per character from first to last : bitmap offset (2 bytes, little
+# endian), width, height, x advance, x offset, y offset (signed bytes)
+first=32
+last=126
+char_width=13
+char_height=13
+line_spacing=2
+bitmaps=(
+    b'\xaa\xa8\x0c\xed\x24\x92\x48\x24\x48\x91\x2f\xe4\x89\x7f\x28\x51'
+    b'\x22\x40\x08\x3e\x62\x40\x30\x0e\x01\x81\xc3\xbe\x08\x08\x71\x12'
+    b'\x23\x80\x23\xb8\x0e\x22\x44\x70\x38\x81\x02\x06\x1a\x65\x46\xc8'
+    b'\xec\xe9\x24\x5a\xaa\xa9\x40\xa9\x55\x5a\x80\x10\x22\x4b\xe3\x05'
+    b'\x11\x00\x10\x20\x47\xf1\x02\x04\x00\x6b\x48\xff\x00\xf0\x02\x08'
+    b'\x10\x60\x81\x04\x08\x20\x41\x02\x08\x00\x38\x8a\x0c\x18\x30\x60'
+    b'\xc1\x82\x88\xe0\x27\x28\x42\x10\x84\x21\x3e\x38\x8a\x08\x10\x20'
+    b'\x82\x08\x61\x03\xf8\x7c\x06\x02\x02\x1c\x06\x01\x01\x01\x42\x3c'
+    b'\x18\xa2\x92\x8a\x28\xbf\x08\x21\xc0\x7c\x81\x03\xe4\x40\x40\x81'
+    b'\x03\x88\xe0\x1e\x41\x04\x0b\x98\xb0\xc1\xc2\x88\xe0\xfe\x04\x08'
+    b'\x20\x40\x82\x04\x08\x20\x40\x38\x8a\x0c\x14\x47\x11\x41\x83\x8c'
+    b'\xe0\x38\x8a\x1c\x18\x68\xce\x81\x04\x13\xc0\xf0\x0f\x6c\x00\xd2'
+    b'\xd2\x00\x03\x04\x18\x60\x60\x18\x04\x03\xff\x80\x00\x1f\xf0\x40'
+    b'\x18\x03\x00\x60\x20\x60\xc0\x80\x3d\x84\x08\x30\xc2\x00\x00\x00'
+    b'\x30\x3c\x46\x82\x8e\xb2\xa2\xa2\x9f\x80\x80\x40\x3c\x3c\x01\x40'
+    b'\x28\x09\x01\x10\x42\x0f\xc1\x04\x40\x9e\x3c\xfe\x21\x90\x48\x67'
+    b'\xe2\x09\x02\x81\x41\xff\x80\x3e\xb0\xf0\x30\x08\x04\x02\x00\x80'
+    b'\x60\x8f\x80\xfe\x21\x90\x68\x14\x0a\x05\x02\x83\x43\x7f\x00\xff'
+    b'\x20\x90\x08\x87\xc2\x21\x00\x81\x40\xff\xc0\xff\xa0\x50\x08\x87'
+    b'\xc2\x21\x00\x80\x40\x78\x00\x1e\x98\x6c\x0a\x00\x80\x20\xf8\x0b'
+    b'\x02\x60\x87\xc0\xe3\xa0\x90\x48\x27\xf2\x09\x04\x82\x41\x71\xc0'
+    b'\xf9\x08\x42\x10\x84\x27\xc0\x1f\x02\x02\x02\x02\x02\x82\x82\xc6'
+    b'\x78\xe3\xa1\x11\x09\x05\x83\x21\x08\x84\x41\x70\xc0\xe0\x40\x40'
+    b'\x40\x40\x40\x41\x41\x41\xff\xe0\xec\x19\x45\x28\xa4\xa4\x94\x91'
+    b'\x12\x02\x40\x5c\x1c\xc3\xb0\x94\x4a\x24\x92\x49\x14\x8a\x43\x70'
+    b'\x80\x1e\x31\x90\x50\x18\x0c\x06\x02\x82\x63\x0f\x00\xfe\x43\x41'
+    b'\x41\x42\x7c\x40\x40\x40\xf0\x1c\x31\x90\x50\x18\x0c\x06\x02\x82'
+    b'\x63\x1f\x04\x07\x92\x30\xfe\x21\x90\x48\x24\x23\xe1\x10\x84\x41'
+    b'\x70\xc0\x3a\xcd\x0a\x03\x01\x80\xc1\xc7\x78\xff\xc4\x62\x21\x00'
+    b'\x80\x40\x20\x10\x08\x1f\x00\xe3\xa0\x90\x48\x24\x12\x09\x04\x82'
+    b'\x22\x0e\x00\xf1\xe8\x10\x82\x10\x42\x10\x22\x04\x80\x50\x0c\x00'
+    b'\x80\xf1\xe8\x09\x11\x25\x44\xa8\x55\x0c\xa1\x8c\x31\x84\x30\xe3'
+    b'\xa0\x88\x82\x80\x80\xc0\x90\x44\x41\x71\xc0\xe3\xa0\x88\x82\x81'
+    b'\x40\x40\x20\x10\x08\x1f\x00\xfd\x0a\x20\x81\x04\x10\x21\x83\xfc'
+    b'\xea\xaa\xaa\xc0\x80\x81\x03\x02\x04\x04\x08\x08\x10\x10\x20\x20'
+    b'\xd5\x55\x55\xc0\x10\x51\x22\x28\x20\xff\xe0\x88\x80\x7e\x00\x80'
+    b'\x47\xec\x14\x0a\x0c\xfb\xc0\x20\x10\x0b\xc6\x12\x05\x02\x81\x40'
+    b'\xb0\xb7\x80\x3a\x8e\x0c\x08\x10\x10\x9e\x03\x00\x80\x47\xa4\x34'
+    b'\x0a\x05\x02\x81\x21\x8f\x60\x3c\x43\x81\xff\x80\x80\x61\x3e\x3d'
+    b'\x04\x3e\x41\x04\x10\x41\x0f\x80\x3d\xa1\xa0\x50\x28\x14\x09\x0c'
+    b'\x7a\x01\x01\x87\x80\xc0\x20\x10\x0b\xc6\x32\x09\x04\x82\x41\x20'
+    b'\xb8\xe0\x10\x01\xc0\x81\x02\x04\x08\x11\xfc\x10\x3e\x10\x84\x21'
+    b'\x08\x42\x3f\x00\xc0\x40\x40\x4f\x44\x58\x70\x48\x44\x42\xc7\x70'
+    b'\x20\x40\x81\x02\x04\x08\x10\x23\xf8\xb7\x64\x62\x31\x18\x8c\x46'
+    b'\x23\x91\x5e\x31\x90\x48\x24\x12\x09\x05\xc7\x3e\x31\xa0\x30\x18'
+    b'\x0c\x05\x8c\x7c\xde\x30\x90\x28\x14\x0a\x05\x84\xbc\x40\x20\x38'
+    b'\x00\x3d\xa1\xa0\x50\x28\x14\x09\x0c\x7a\x01\x00\x80\xe0\xce\xa1'
+    b'\x82\x04\x08\x10\x7c\x3a\x8d\x0b\x80\xf0\x70\xde\x40\x40\xfc\x40'
+    b'\x40\x40\x40\x40\x41\x3e\xc3\x41\x41\x41\x41\x41\x43\x3d\xe3\xa0'
+    b'\x90\x84\x42\x20\xa0\x50\x10\xe3\xc0\x92\x4b\x25\x92\xa9\x98\x44'
+    b'\xe3\x31\x05\x01\x01\x41\x11\x05\xc7\xe3\xa0\x90\x84\x42\x40\xa0'
+    b'\x60\x10\x10\x08\x3e\x00\xfd\x08\x20\x82\x08\x10\xbf\x29\x24\xa2'
+    b'\x49\x26\xff\xf8\x89\x24\x8a\x49\x2c\x61\x24\x30')
+glyphs=(
+    b'\x00\x00\x00\x00\x0b\x00\x01\x00\x00\x02\x0b\x0b\x04\xf6'
+    b'\x03\x00\x06\x05\x0b\x02\xf6\x07\x00\x07\x0c\x0b\x02\xf6'
+    b'\x12\x00\x08\x0c\x0b\x01\xf6\x1e\x00\x07\x0b\x0b\x02\xf6'
+    b'\x28\x00\x07\x0a\x0b\x02\xf7\x31\x00\x03\x05\x0b\x04\xf6'
+    b'\x33\x00\x02\x0d\x0b\x05\xf6\x37\x00\x02\x0d\x0b\x04\xf6'
+    b'\x3b\x00\x07\x07\x0b\x02\xf6\x42\x00\x07\x07\x0b\x02\xf8'
+    b'\x49\x00\x03\x05\x0b\x02\xff\x4b\x00\x09\x01\x0b\x01\xfb'
+    b'\x4d\x00\x02\x02\x0b\x04\xff\x4e\x00\x07\x0d\x0b\x02\xf5'
+    b'\x5a\x00\x07\x0b\x0b\x02\xf6\x64\x00\x05\x0b\x0b\x03\xf6'
+    b'\x6b\x00\x07\x0b\x0b\x02\xf6\x75\x00\x08\x0b\x0b\x01\xf6'
+    b'\x80\x00\x06\x0b\x0b\x03\xf6\x89\x00\x07\x0b\x0b\x02\xf6'
+    b'\x93\x00\x07\x0b\x0b\x02\xf6\x9d\x00\x07\x0b\x0b\x02\xf6'
+    b'\xa7\x00\x07\x0b\x0b\x02\xf6\xb1\x00\x07\x0b\x0b\x02\xf6'
+    b'\xbb\x00\x02\x08\x0b\x04\xf9\xbd\x00\x03\x0b\x0b\x03\xf9'
+    b'\xc2\x00\x08\x08\x0b\x01\xf8\xca\x00\x09\x04\x0b\x01\xfa'
+    b'\xcf\x00\x09\x08\x0b\x01\xf8\xd8\x00\x07\x0a\x0b\x02\xf7'
+    b'\xe1\x00\x08\x0c\x0b\x02\xf6\xed\x00\x0b\x0a\x0b\x00\xf7'
+    b'\xfb\x00\x09\x0a\x0b\x01\xf7\x07\x01\x09\x0a\x0b\x01\xf7'
+    b'\x13\x01\x09\x0a\x0b\x01\xf7\x1f\x01\x09\x0a\x0b\x01\xf7'
+    b'\x2b\x01\x09\x0a\x0b\x01\xf7\x37\x01\x0a\x0a\x0b\x01\xf7'
+    b'\x44\x01\x09\x0a\x0b\x01\xf7\x50\x01\x05\x0a\x0b\x03\xf7'
+    b'\x57\x01\x08\x0a\x0b\x02\xf7\x61\x01\x09\x0a\x0b\x01\xf7'
+    b'\x6d\x01\x08\x0a\x0b\x02\xf7\x77\x01\x0b\x0a\x0b\x00\xf7'
+    b'\x85\x01\x09\x0a\x0b\x01\xf7\x91\x01\x09\x0a\x0b\x01\xf7'
+    b'\x9d\x01\x08\x0a\x0b\x01\xf7\xa7\x01\x09\x0d\x0b\x01\xf7'
+    b'\xb6\x01\x09\x0a\x0b\x01\xf7\xc2\x01\x07\x0a\x0b\x02\xf7'
+    b'\xcb\x01\x09\x0a\x0b\x01\xf7\xd7\x01\x09\x0a\x0b\x01\xf7'
+    b'\xe3\x01\x0b\x0a\x0b\x00\xf7\xf1\x01\x0b\x0a\x0b\x00\xf7'
+    b'\xff\x01\x09\x0a\x0b\x01\xf7\x0b\x02\x09\x0a\x0b\x01\xf7'
+    b'\x17\x02\x07\x0a\x0b\x02\xf7\x20\x02\x02\x0d\x0b\x05\xf6'
+    b'\x24\x02\x07\x0d\x0b\x02\xf5\x30\x02\x02\x0d\x0b\x04\xf6'
+    b'\x34\x02\x07\x05\x0b\x02\xf6\x39\x02\x0b\x01\x0b\x00\x02'
+    b'\x3b\x02\x03\x03\x0b\x03\xf5\x3d\x02\x09\x08\x0b\x01\xf9'
+    b'\x46\x02\x09\x0b\x0b\x01\xf6\x53\x02\x07\x08\x0b\x02\xf9'
+    b'\x5a\x02\x09\x0b\x0b\x01\xf6\x67\x02\x08\x08\x0b\x01\xf9'
+    b'\x6f\x02\x06\x0b\x0b\x03\xf6\x78\x02\x09\x0b\x0b\x01\xf9'
+    b'\x85\x02\x09\x0b\x0b\x01\xf6\x92\x02\x07\x0a\x0b\x02\xf7'
+    b'\x9b\x02\x05\x0d\x0b\x03\xf7\xa4\x02\x08\x0b\x0b\x02\xf6'
+    b'\xaf\x02\x07\x0b\x0b\x02\xf6\xb9\x02\x09\x08\x0b\x01\xf9'
+    b'\xc2\x02\x09\x08\x0b\x01\xf9\xcb\x02\x09\x08\x0b\x01\xf9'
+    b'\xd4\x02\x09\x0b\x0b\x01\xf9\xe1\x02\x09\x0b\x0b\x01\xf9'
+    b'\xee\x02\x07\x08\x0b\x03\xf9\xf5\x02\x07\x08\x0b\x02\xf9'
+    b'\xfc\x02\x08\x0a\x0b\x02\xf7\x06\x03\x08\x08\x0b\x01\xf9'
+    b'\x0e\x03\x09\x08\x0b\x01\xf9\x17\x03\x09\x08\x0b\x01\xf9'
+    b'\x20\x03\x09\x08\x0b\x01\xf9\x29\x03\x09\x0b\x0b\x01\xf9'
+    b'\x36\x03\x07\x08\x0b\x02\xf9\x3d\x03\x03\x0d\x0b\x04\xf6'
+    b'\x42\x03\x01\x0d\x0b\x05\xf6\x44\x03\x03\x0d\x0b\x04\xf6'
+    b'\x49\x03\x07\x03\x0b\x02\xfa')
@@ -1,192 +1,88 @@
-FreeSansSerif7pt7bBitmaps = [
-    0x00, # ' '
-    0xAA,0x88, # '!'
-    0xAA,0xA0, # '"'
-    0x24,0x24,0x7E,0x28,0xFC,0x48,0x48, # '#'
-    0x21,0xEA,0x38,0x38,0xAF,0x08, # '$'
-    0xE4,0x52,0x2A,0x1F,0xE1,0x51,0x28,0x9C, # '%'
-    0x30,0x48,0x40,0xB2,0x8A,0xCC,0x72, # '&'
-    0xA8, # '''
-    0x52,0x49,0x24,0x40, # '('
-    0x91,0x24,0x94,0x80, # ')'
-    0xA9,0xC7,0x2A, # '*'
-    0x10,0x10,0x10,0xFE,0x10,0x10,0x10, # '+'
-    0xA0, # ','
-    0xE0, # '-'
-    0x80, # '.'
-    0x22,0x44,0x44,0x88, # '/'
-    0x72,0x28,0xA2,0x8A,0x27,0x00, # '0'
-    0xE0,0x82,0x08,0x20,0x8F,0x80, # '1'
-    0x72,0x20,0x84,0x21,0x0F,0x80, # '2'
-    0x72,0x20,0x9C,0x0A,0x27,0x00, # '3'
-    0x10,0xC5,0x24,0xF8,0x41,0x00, # '4'
-    0xF2,0x0F,0x02,0x08,0x2F,0x00, # '5'
-    0x7B,0x08,0x3C,0x8A,0x27,0x00, # '6'
-    0xF8,0x21,0x04,0x20,0x84,0x00, # '7'
-    0x72,0x28,0x9C,0x8A,0x27,0x00, # '8'
-    0x72,0x28,0x9E,0x08,0x6F,0x00, # '9'
-    0x80,0x80, # ':'
-    0x80,0xA0, # ';'
-    0x04,0x73,0x01,0xC0,0x40, # '<'
-    0xFC,0x03,0xF0, # '='
-    0x80,0xE0,0x33,0x88,0x00, # '>'
-    0xF0,0x88,0x84,0x01,0x00, # '?'
-    0x3E,0x18,0x4C,0x0A,0x72,0x95,0xA7,0xCC,0x01,0x88,0x3C,0x00, # '@'
-    0x10,0x28,0x28,0x44,0x7C,0x44,0x82, # 'A'
-    0xF2,0x28,0xBC,0x8A,0x2F,0x00, # 'B'
-    0x38,0x8A,0x04,0x08,0x08,0x8E,0x00, # 'C'
-    0xF9,0x1A,0x14,0x28,0x51,0xBE,0x00, # 'D'
-    0xFA,0x08,0x3E,0x82,0x0F,0x80, # 'E'
-    0xF4,0x21,0xE8,0x42,0x00, # 'F'
-    0x79,0x8A,0x04,0xE8,0x58,0x9E,0x00, # 'G'
-    0x85,0x0A,0x17,0xE8,0x50,0xA1,0x00, # 'H'
-    0xAA,0xA8, # 'I'
-    0x22,0x22,0x22,0x22,0xC0, # 'J'
-    0x89,0x22,0x86,0x0A,0x12,0x22,0x00, # 'K'
-    0x82,0x08,0x20,0x82,0x0F,0x80, # 'L'
-    0x82,0xC6,0xC6,0xAA,0xAA,0x92,0x82, # 'M'
-    0x85,0x8A,0x95,0x29,0x51,0xA1,0x00, # 'N'
-    0x79,0x9A,0x14,0x28,0x59,0x9E,0x00, # 'O'
-    0xF2,0x28,0xBC,0x82,0x08,0x00, # 'P'
-    0x79,0x9A,0x14,0x28,0x59,0x1C,0x04, # 'Q'
-    0xF1,0x12,0x27,0x89,0x11,0x21,0x00, # 'R'
-    0x72,0x28,0x1C,0x0A,0x27,0x00, # 'S'
-    0xF8,0x82,0x08,0x20,0x82,0x00, # 'T'
-    0x85,0x0A,0x14,0x28,0x50,0x9E,0x00, # 'U'
-    0x82,0x82,0x44,0x44,0x28,0x28,0x10, # 'V'
-    0x88,0xA2,0x25,0x51,0x54,0x55,0x08,0x82,0x20, # 'W'
-    0xCC,0x90,0xC1,0x83,0x09,0x33,0x00, # 'X'
-    0x82,0x44,0x28,0x10,0x10,0x10,0x10, # 'Y'
-    0xFC,0x10,0x41,0x82,0x08,0x3F,0x00, # 'Z'
-    0xD2,0x49,0x24,0xC0, # '['
-    0x88,0x44,0x44,0x22, # '\'
-    0xC9,0x24,0x92,0xC0, # ']'
-    0x30,0x92,0x10, # '^'
-    0xF8, # '_'
-    0x88, # '`'
-    0x70,0x27,0xA2,0xF8, # 'a'
-    0x82,0x08,0x3C,0x8A,0x28,0xBC, # 'b'
-    0x74,0x21,0x07,0x00, # 'c'
-    0x08,0x20,0x9E,0x8A,0x28,0x9E, # 'd'
-    0x72,0x2F,0xA0,0x78, # 'e'
-    0x72,0x11,0xC4,0x21,0x08, # 'f'
-    0x7A,0x28,0xA2,0x78,0x27,0x00, # 'g'
-    0x82,0x08,0x3C,0x8A,0x28,0xA2, # 'h'
-    0x82,0xAA, # 'i'
-    0x40,0x24,0x92,0x58, # 'j'
-    0x82,0x08,0x24,0xA3,0x0A,0x24, # 'k'
-    0xAA,0xAA, # 'l'
-    0xF7,0x22,0x28,0x8A,0x22,0x88,0x80, # 'm'
-    0xF2,0x28,0xA2,0x88, # 'n'
-    0x72,0x28,0xA2,0x70, # 'o'
-    0xF2,0x28,0xA2,0xF2,0x08,0x00, # 'p'
-    0x7A,0x28,0xA2,0x78,0x20,0x80, # 'q'
-    0xE8,0x88,0x80, # 'r'
-    0xF4,0x1C,0x2F,0x00, # 's'
-    0x42,0x3C,0x84,0x21,0xC0, # 't'
-    0x8A,0x28,0xA2,0x78, # 'u'
-    0x8A,0x25,0x14,0x20, # 'v'
-    0x92,0xAA,0xAA,0x44,0x44, # 'w'
-    0x89,0x42,0x14,0x88, # 'x'
-    0x8A,0x25,0x14,0x20,0x8C,0x00, # 'y'
-    0xF0,0x88,0x8F,0x00, # 'z'
-    0x31,0x08,0x4C,0x10,0x84,0x30, # '['
-    0xAA,0xAA,0xA0, # '|'
-    0xC2,0x10,0x83,0x21,0x08,0xC0] # ']'
-
-FreeSansSerif7pt7bGlyphs = [
-    #Index,  W, H,xAdv,dX, dY
-    [     0,   1,   1,   4,    0,    0 ], # ' '
-    [     1,   2,   7,   5,    2,   -7 ], # '!'
-    [     3,   4,   3,   6,    1,   -7 ], # '"'
-    [     5,   8,   7,   9,    1,   -7 ], # '#'
-    [    12,   6,   8,   7,    1,   -7 ], # '$'
-    [    18,   9,   7,  11,    1,   -7 ], # '%'
-    [    26,   8,   7,  10,    1,   -7 ], # '&'
-    [    33,   2,   3,   4,    1,   -7 ], # '''
-    [    34,   3,   9,   5,    1,   -8 ], # '('
-    [    38,   3,   9,   5,    1,   -8 ], # ')'
-    [    42,   6,   4,   6,    0,   -7 ], # '*'
-    [    45,   8,   7,   9,    1,   -7 ], # '+'
-    [    52,   2,   2,   4,    1,   -1 ], # ','
-    [    53,   4,   1,   5,    1,   -3 ], # '-'
-    [    54,   2,   1,   4,    1,   -1 ], # '.'
-    [    55,   4,   8,   4,    0,   -7 ], # '/'
-    [    59,   6,   7,   7,    1,   -7 ], # '0'
-    [    65,   6,   7,   7,    1,   -7 ], # '1'
-    [    71,   6,   7,   7,    1,   -7 ], # '2'
-    [    77,   6,   7,   7,    1,   -7 ], # '3'
-    [    83,   6,   7,   7,    1,   -7 ], # '4'
-    [    89,   6,   7,   7,    1,   -7 ], # '5'
-    [    95,   6,   7,   7,    1,   -7 ], # '6'
-    [   101,   6,   7,   7,    1,   -7 ], # '7'
-    [   107,   6,   7,   7,    1,   -7 ], # '8'
-    [   113,   6,   7,   7,    1,   -7 ], # '9'
-    [   119,   2,   5,   4,    1,   -5 ], # ':'
-    [   121,   2,   6,   4,    1,   -5 ], # ';'
-    [   123,   7,   5,   9,    1,   -6 ], # '<'
-    [   128,   7,   3,   9,    1,   -5 ], # '='
-    [   131,   7,   5,   9,    1,   -6 ], # '>'
-    [   136,   5,   7,   6,    1,   -7 ], # '?'
-    [   141,  10,   9,  12,    1,   -7 ], # '@'
-    [   153,   8,   7,   8,    0,   -7 ], # 'A'
-    [   160,   6,   7,   8,    1,   -7 ], # 'B'
-    [   166,   7,   7,   9,    1,   -7 ], # 'C'
-    [   173,   7,   7,   9,    1,   -7 ], # 'D'
-    [   180,   6,   7,   8,    1,   -7 ], # 'E'
-    [   186,   5,   7,   7,    1,   -7 ], # 'F'
-    [   191,   7,   7,   9,    1,   -7 ], # 'G'
-    [   198,   7,   7,   9,    1,   -7 ], # 'H'
-    [   205,   2,   7,   4,    1,   -7 ], # 'I'
-    [   207,   4,   9,   4,   -1,   -7 ], # 'J'
-    [   212,   7,   7,   8,    1,   -7 ], # 'K'
-    [   219,   6,   7,   7,    1,   -7 ], # 'L'
-    [   225,   8,   7,  10,    1,   -7 ], # 'M'
-    [   232,   7,   7,   9,    1,   -7 ], # 'N'
-    [   239,   7,   7,   9,    1,   -7 ], # 'O'
-    [   246,   6,   7,   8,    1,   -7 ], # 'P'
-    [   252,   7,   8,   9,    1,   -7 ], # 'Q'
-    [   259,   7,   7,   8,    1,   -7 ], # 'R'
-    [   266,   6,   7,   8,    1,   -7 ], # 'S'
-    [   272,   6,   7,   6,    0,   -7 ], # 'T'
-    [   278,   7,   7,   9,    1,   -7 ], # 'U'
-    [   285,   8,   7,   8,    0,   -7 ], # 'V'
-    [   292,  10,   7,  10,    0,   -7 ], # 'W'
-    [   301,   7,   7,   7,    0,   -7 ], # 'X'
-    [   308,   8,   7,   8,    0,   -7 ], # 'Y'
-    [   315,   7,   7,   7,    0,   -7 ], # 'Z'
-    [   322,   3,   9,   5,    1,   -8 ], # '['
-    [   326,   4,   8,   4,    0,   -7 ], # '\'
-    [   330,   3,   9,   5,    1,   -8 ], # ']'
-    [   334,   7,   3,   9,    1,   -7 ], # '^'
-    [   337,   6,   1,   6,    0,    1 ], # '_'
-    [   338,   3,   2,   6,    1,   -8 ], # '`'
-    [   339,   6,   5,   7,    1,   -5 ], # 'a'
-    [   343,   6,   8,   7,    1,   -8 ], # 'b'
-    [   349,   5,   5,   6,    1,   -5 ], # 'c'
-    [   353,   6,   8,   7,    1,   -8 ], # 'd'
-    [   359,   6,   5,   7,    1,   -5 ], # 'e'
-    [   363,   5,   8,   5,    1,   -8 ], # 'f'
-    [   368,   6,   7,   7,    1,   -5 ], # 'g'
-    [   374,   6,   8,   7,    1,   -8 ], # 'h'
-    [   380,   2,   8,   3,    1,   -8 ], # 'i'
-    [   382,   3,  10,   3,    0,   -8 ], # 'j'
-    [   386,   6,   8,   6,    1,   -8 ], # 'k'
-    [   392,   2,   8,   3,    1,   -8 ], # 'l'
-    [   394,  10,   5,  11,    1,   -5 ], # 'm'
-    [   401,   6,   5,   7,    1,   -5 ], # 'n'
-    [   405,   6,   5,   7,    1,   -5 ], # 'o'
-    [   409,   6,   7,   7,    1,   -5 ], # 'p'
-    [   415,   6,   7,   7,    1,   -5 ], # 'q'
-    [   421,   4,   5,   5,    1,   -5 ], # 'r'
-    [   424,   5,   5,   6,    1,   -5 ], # 's'
-    [   428,   5,   7,   5,    0,   -7 ], # 't'
-    [   433,   6,   5,   7,    1,   -5 ], # 'u'
-    [   437,   6,   5,   7,    1,   -5 ], # 'v'
-    [   441,   8,   5,   9,    1,   -5 ], # 'w'
-    [   446,   6,   5,   7,    1,   -5 ], # 'x'
-    [   450,   6,   7,   7,    1,   -5 ], # 'y'
-    [   456,   5,   5,   6,    1,   -5 ], # 'z'
-    [   460,   5,   9,   7,    1,   -8 ], # '['
-    [   466,   2,  10,   4,    1,   -8 ], # '|'
-    [   469,   5,   9,   7,    1,   -8 ]] # ']'
+# FreeSansSerif7pt7b, converted by fontconv.py from FreeSansSerif7pt7b.py
+# bitmaps : 1 bit per pixel, row after row for each glyph
+# glyphs : 7 bytes per character from first to last : bitmap offset (2 bytes, little
+# endian), width, height, x advance, x offset, y offset (signed bytes)
+first=32
+last=125
+char_width=7
+char_height=8
+line_spacing=2
+bitmaps=(
+    b'\x00\xaa\x88\xaa\xa0\x24\x24\x7e\x28\xfc\x48\x48\x21\xea\x38\x38'
+    b'\xaf\x08\xe4\x52\x2a\x1f\xe1\x51\x28\x9c\x30\x48\x40\xb2\x8a\xcc'
+    b'\x72\xa8\x52\x49\x24\x40\x91\x24\x94\x80\xa9\xc7\x2a\x10\x10\x10'
+    b'\xfe\x10\x10\x10\xa0\xe0\x80\x22\x44\x44\x88\x72\x28\xa2\x8a\x27'
+    b'\x00\xe0\x82\x08\x20\x8f\x80\x72\x20\x84\x21\x0f\x80\x72\x20\x9c'
+    b'\x0a\x27\x00\x10\xc5\x24\xf8\x41\x00\xf2\x0f\x02\x08\x2f\x00\x7b'
+    b'\x08\x3c\x8a\x27\x00\xf8\x21\x04\x20\x84\x00\x72\x28\x9c\x8a\x27'
+    b'\x00\x72\x28\x9e\x08\x6f\x00\x80\x80\x80\xa0\x04\x73\x01\xc0\x40'
+    b'\xfc\x03\xf0\x80\xe0\x33\x88\x00\xf0\x88\x84\x01\x00\x3e\x18\x4c'
+    b'\x0a\x72\x95\xa7\xcc\x01\x88\x3c\x00\x10\x28\x28\x44\x7c\x44\x82'
+    b'\xf2\x28\xbc\x8a\x2f\x00\x38\x8a\x04\x08\x08\x8e\x00\xf9\x1a\x14'
+    b'\x28\x51\xbe\x00\xfa\x08\x3e\x82\x0f\x80\xf4\x21\xe8\x42\x00\x79'
+    b'\x8a\x04\xe8\x58\x9e\x00\x85\x0a\x17\xe8\x50\xa1\x00\xaa\xa8\x22'
+    b'\x22\x22\x22\xc0\x89\x22\x86\x0a\x12\x22\x00\x82\x08\x20\x82\x0f'
+    b'\x80\x82\xc6\xc6\xaa\xaa\x92\x82\x85\x8a\x95\x29\x51\xa1\x00\x79'
+    b'\x9a\x14\x28\x59\x9e\x00\xf2\x28\xbc\x82\x08\x00\x79\x9a\x14\x28'
+    b'\x59\x1c\x04\xf1\x12\x27\x89\x11\x21\x00\x72\x28\x1c\x0a\x27\x00'
+    b'\xf8\x82\x08\x20\x82\x00\x85\x0a\x14\x28\x50\x9e\x00\x82\x82\x44'
+    b'\x44\x28\x28\x10\x88\xa2\x25\x51\x54\x55\x08\x82\x20\xcc\x90\xc1'
+    b'\x83\x09\x33\x00\x82\x44\x28\x10\x10\x10\x10\xfc\x10\x41\x82\x08'
+    b'\x3f\x00\xd2\x49\x24\xc0\x88\x44\x44\x22\xc9\x24\x92\xc0\x30\x92'
+    b'\x10\xf8\x88\x70\x27\xa2\xf8\x82\x08\x3c\x8a\x28\xbc\x74\x21\x07'
+    b'\x00\x08\x20\x9e\x8a\x28\x9e\x72\x2f\xa0\x78\x72\x11\xc4\x21\x08'
+    b'\x7a\x28\xa2\x78\x27\x00\x82\x08\x3c\x8a\x28\xa2\x82\xaa\x40\x24'
+    b'\x92\x58\x82\x08\x24\xa3\x0a\x24\xaa\xaa\xf7\x22\x28\x8a\x22\x88'
+    b'\x80\xf2\x28\xa2\x88\x72\x28\xa2\x70\xf2\x28\xa2\xf2\x08\x00\x7a'
+    b'\x28\xa2\x78\x20\x80\xe8\x88\x80\xf4\x1c\x2f\x00\x42\x3c\x84\x21'
+    b'\xc0\x8a\x28\xa2\x78\x8a\x25\x14\x20\x92\xaa\xaa\x44\x44\x89\x42'
+    b'\x14\x88\x8a\x25\x14\x20\x8c\x00\xf0\x88\x8f\x00\x31\x08\x4c\x10'
+    b'\x84\x30\xaa\xaa\xa0\xc2\x10\x83\x21\x08\xc0')
+glyphs=(
+    b'\x00\x00\x01\x01\x04\x00\x00\x01\x00\x02\x07\x05\x02\xf9'
+    b'\x03\x00\x04\x03\x06\x01\xf9\x05\x00\x08\x07\x09\x01\xf9'
+    b'\x0c\x00\x06\x08\x07\x01\xf9\x12\x00\x09\x07\x0b\x01\xf9'
+    b'\x1a\x00\x08\x07\x0a\x01\xf9\x21\x00\x02\x03\x04\x01\xf9'
+    b'\x22\x00\x03\x09\x05\x01\xf8\x26\x00\x03\x09\x05\x01\xf8'
+    b'\x2a\x00\x06\x04\x06\x00\xf9\x2d\x00\x08\x07\x09\x01\xf9'
+    b'\x34\x00\x02\x02\x04\x01\xff\x35\x00\x04\x01\x05\x01\xfd'
+    b'\x36\x00\x02\x01\x04\x01\xff\x37\x00\x04\x08\x04\x00\xf9'
+    b'\x3b\x00\x06\x07\x07\x01\xf9\x41\x00\x06\x07\x07\x01\xf9'
+    b'\x47\x00\x06\x07\x07\x01\xf9\x4d\x00\x06\x07\x07\x01\xf9'
+    b'\x53\x00\x06\x07\x07\x01\xf9\x59\x00\x06\x07\x07\x01\xf9'
+    b'\x5f\x00\x06\x07\x07\x01\xf9\x65\x00\x06\x07\x07\x01\xf9'
+    b'\x6b\x00\x06\x07\x07\x01\xf9\x71\x00\x06\x07\x07\x01\xf9'
+    b'\x77\x00\x02\x05\x04\x01\xfb\x79\x00\x02\x06\x04\x01\xfb'
+    b'\x7b\x00\x07\x05\x09\x01\xfa\x80\x00\x07\x03\x09\x01\xfb'
+    b'\x83\x00\x07\x05\x09\x01\xfa\x88\x00\x05\x07\x06\x01\xf9'
+    b'\x8d\x00\x0a\x09\x0c\x01\xf9\x99\x00\x08\x07\x08\x00\xf9'
+    b'\xa0\x00\x06\x07\x08\x01\xf9\xa6\x00\x07\x07\x09\x01\xf9'
+    b'\xad\x00\x07\x07\x09\x01\xf9\xb4\x00\x06\x07\x08\x01\xf9'
+    b'\xba\x00\x05\x07\x07\x01\xf9\xbf\x00\x07\x07\x09\x01\xf9'
+    b'\xc6\x00\x07\x07\x09\x01\xf9\xcd\x00\x02\x07\x04\x01\xf9'
+    b'\xcf\x00\x04\x09\x04\xff\xf9\xd4\x00\x07\x07\x08\x01\xf9'
+    b'\xdb\x00\x06\x07\x07\x01\xf9\xe1\x00\x08\x07\x0a\x01\xf9'
+    b'\xe8\x00\x07\x07\x09\x01\xf9\xef\x00\x07\x07\x09\x01\xf9'
+    b'\xf6\x00\x06\x07\x08\x01\xf9\xfc\x00\x07\x08\x09\x01\xf9'
+    b'\x03\x01\x07\x07\x08\x01\xf9\x0a\x01\x06\x07\x08\x01\xf9'
+    b'\x10\x01\x06\x07\x06\x00\xf9\x16\x01\x07\x07\x09\x01\xf9'
+    b'\x1d\x01\x08\x07\x08\x00\xf9\x24\x01\x0a\x07\x0a\x00\xf9'
+    b'\x2d\x01\x07\x07\x07\x00\xf9\x34\x01\x08\x07\x08\x00\xf9'
+    b'\x3b\x01\x07\x07\x07\x00\xf9\x42\x01\x03\x09\x05\x01\xf8'
+    b'\x46\x01\x04\x08\x04\x00\xf9\x4a\x01\x03\x09\x05\x01\xf8'
+    b'\x4e\x01\x07\x03\x09\x01\xf9\x51\x01\x06\x01\x06\x00\x01'
+    b'\x52\x01\x03\x02\x06\x01\xf8\x53\x01\x06\x05\x07\x01\xfb'
+    b'\x57\x01\x06\x08\x07\x01\xf8\x5d\x01\x05\x05\x06\x01\xfb'
+    b'\x61\x01\x06\x08\x07\x01\xf8\x67\x01\x06\x05\x07\x01\xfb'
+    b'\x6b\x01\x05\x08\x05\x01\xf8\x70\x01\x06\x07\x07\x01\xfb'
+    b'\x76\x01\x06\x08\x07\x01\xf8\x7c\x01\x02\x08\x03\x01\xf8'
+    b'\x7e\x01\x03\x0a\x03\x00\xf8\x82\x01\x06\x08\x06\x01\xf8'
+    b'\x88\x01\x02\x08\x03\x01\xf8\x8a\x01\x0a\x05\x0b\x01\xfb'
+    b'\x91\x01\x06\x05\x07\x01\xfb\x95\x01\x06\x05\x07\x01\xfb'
+    b'\x99\x01\x06\x07\x07\x01\xfb\x9f\x01\x06\x07\x07\x01\xfb'
+    b'\xa5\x01\x04\x05\x05\x01\xfb\xa8\x01\x05\x05\x06\x01\xfb'
+    b'\xac\x01\x05\x07\x05\x00\xf9\xb1\x01\x06\x05\x07\x01\xfb'
+    b'\xb5\x01\x06\x05\x07\x01\xfb\xb9\x01\x08\x05\x09\x01\xfb'
+    b'\xbe\x01\x06\x05\x07\x01\xfb\xc2\x01\x06\x07\x07\x01\xfb'
+    b'\xc8\x01\x05\x05\x06\x01\xfb\xcc\x01\x05\x09\x07\x01\xf8'
+    b'\xd2\x01\x02\x0a\x04\x01\xf8\xd5\x01\x05\x09\x07\x01\xf8')
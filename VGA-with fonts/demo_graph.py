@@ -0,0 +1,93 @@
+# Demo of the VGA driver with fonts : plots a few functions with their legend and axes
+# Copy VGA.py, this file and the font modules (FreeMono9pt7b.py...) on the Pico
+import VGA
+from VGA import RED,GREEN,BLUE,YELLOW,BLACK,WHITE,CYAN,MAGENTA
+from math import cos,sin,pi,log
+from gc import mem_free,collect
+
+def plot_graph(valmax,resol,backcol,colgraph1,colgraph2,colgraph3,colgraph4,colaxes,k, offset,resolpol,polcol):
+    x=-1*valmax
+    VGA.fill_screen(backcol)
+    VGA.setfont(2)
+    VGA.settextcursor(10,20)
+    VGA.settextcolor(colgraph1)
+    VGA.printh("y = x.cos(x)")
+    VGA.settextcursor(10,40)
+    VGA.settextcolor(colgraph2)
+    VGA.printh("y = x.sin(x)")
+    VGA.settextcursor(10,60)
+    VGA.settextcolor(polcol)
+    VGA.printh("r = sin("+str(k)+".theta) + "+str(offset))
+    VGA.settextcursor(10,80)
+    VGA.settextcolor(colgraph3)
+    VGA.printh("y = 1/x^3-1/x^2-1/x+1")
+    VGA.settextcursor(10,100)
+    VGA.settextcolor(colgraph4)
+    VGA.printh("y = 2x.ln(3/x)")
+
+    VGA.draw_fastHline(0,640,240,colaxes)
+    VGA.draw_fastVline(320,0,480,colaxes)
+
+    scale_factor=abs(320/x)
+    for i in range(20,640,40):
+        VGA.draw_fastVline(i,240,245,colaxes)
+        VGA.settextcursor(i-10,255)
+        VGA.settextcolor(colaxes)
+        VGA.printh(str(round((i-320)/scale_factor,2)))
+    for i in range(20,480,40):
+        VGA.draw_fastHline(315,320,i,colaxes)
+        VGA.settextcursor(290,i+5)
+        VGA.settextcolor(colaxes)
+        VGA.printh(str(round((240-i)/scale_factor,2)))
+
+    xc0,yc0 = (int(scale_factor*x),int(scale_factor*x*cos(x)))
+    xs0,ys0 = (int(scale_factor*x),int(scale_factor*x*sin(x)))
+    
+    print("Scale:\t"+str(-1*valmax)+" "+str(valmax)+"\tScale factor:\t"+str(scale_factor)+"\tIncrement:\t"+str(1/scale_factor))
+
+    while x<valmax:
+        x+=(1/scale_factor/resol)
+        xc1,yc1 = (int(scale_factor*x),int(scale_factor*x*cos(x)))
+        xs1,ys1 = (int(scale_factor*x),int(scale_factor*x*sin(x)))
+        VGA.draw_line(320+xc0,240-yc0,320+xc1,240-yc1,colgraph1)
+        VGA.draw_line(320+xs0,240-ys0,320+xs1,240-ys1,colgraph2)
+        xc0,yc0 = xc1,yc1
+        xs0,ys0 = xs1,ys1
+ 
+    x=-1*valmax
+    xp0,yp0 = (int(scale_factor*x),int(scale_factor*((1/x/x/x)-(1/x/x)-(1/x)+1)))
+    while x<valmax:
+        x+=(1/scale_factor/resol)
+        xp1,yp1 = (int(scale_factor*x),int(scale_factor*((1/x/x/x)-(1/x/x)-(1/x)+1)))
+        VGA.draw_line(320+xp0,240-yp0,320+xp1,240-yp1,colgraph3)
+        xp0,yp0 = xp1,yp1
+
+    x=0.0001
+    xl0,yl0 = (int(scale_factor*x),int(scale_factor*(2*x*log(3/x))))
+    while x<valmax:
+        x+=(1/scale_factor/resol)
+        xp1,yp1 = (int(scale_factor*x),int(scale_factor*(2*x*log(3/x))))
+        VGA.draw_line(320+xp0,240-yp0,320+xp1,240-yp1,colgraph4)
+        xp0,yp0 = xp1,yp1
+
+    theta=0
+    r=sin(k*theta)+2
+    x0,y0=int(scale_factor*r*cos(theta)),int(scale_factor*r*sin(theta))
+    while theta<=2*pi:
+        theta+=0.005/resolpol
+        r=sin(k*theta)+offset
+        x1,y1=int(scale_factor*r*cos(theta)),int(scale_factor*r*sin(theta))
+        VGA.draw_line(320+x0,240-y0,320+x1,240-y1,polcol)
+        x0,y0=x1,y1
+    collect()
+    print("remaining RAM:\t"+str(mem_free()))
+
+
+if __name__=="__main__":
+    VGA.init(VGA.MODE_250MHZ,verbose=True)
+    plot_graph(9.6,10,BLACK,CYAN,RED,GREEN,YELLOW,WHITE,5,2,2,MAGENTA)
+    #plot_graph(5,5,BLACK,CYAN,RED,GREEN,YELLOW,WHITE,5,1,2,MAGENTA)
+    # VGA.setfont(3)
+    # VGA.settextcursor(402,180)
+    # VGA.settextcolor(RED)
+    # VGA.printh("Testing font n3")
@@ -4,6 +4,17 @@ from micropython import const
 from array import array
 from uctypes import addressof
 from gc import mem_free,collect
+from time import ticks_us,ticks_diff
+from math import sin,cos,radians
+
+# VGA driver library : importing this module only defines things, nothing runs on the hardware
+# until init() is called. Typical use :
+#   import VGA
+#   VGA.init()                      # allocates the frame buffer and starts the VGA output
+#   VGA.fill_rect(20,20,150,150,VGA.BLUE)
+#   ...
+#   VGA.deinit()                    # stops the output and frees the buffer
+# See demo.py and "VGA-with fonts/demo_graph.py" for examples.
 
 # 640*480 resolution
 # Scanline part    Pixels    Time [µs]    32bits-Words
@@ -14,9 +25,6 @@ from gc import mem_free,collect
 # Whole line        800      31.7775         125
 
 
-# Possibility to change the system clock freq if needed - 125MHz (default/False) or 250MHz (True)
-OVCLK=False     
-
 # Routine to boost system clock
 @micropython.viper
 def set_freq(fclock:int)->int:
@@ -45,17 +53,54 @@ bit_per_pix=const(3)         # Bits per pixel
 pixel_bitmask=const(0b111)   # Corresponding bitmask (used for replacing one 3bit pixel in a 32b word)
 usable_bits=const(30)        # Numbers of bits that will be used in each 32b word
 pix_per_words=const(10)     # Number of 3b pixel per 32b word
+words_per_line=const(64)     # Number of 32b words per line (H_res/pix_per_words)
+
+# Initiate cursor position (for character drawing only)
+x_cursor = 0
+y_cursor = 0
+
+# Output modes - system clock used to generate the signal (see init)
+MODE_125MHZ=const(0)    # Standard 125 MHz system clock
+MODE_250MHZ=const(1)    # Overclocked 250 MHz system clock (does not really impact the picture quality)
+
+# State machine frequencies for each mode : (H sync SM, V sync SM, RGB SM)
+SM_FREQS = ((25175000, 125000000, 100700000),   # MODE_125MHZ
+            (12587500, 125000000, 113287500))   # MODE_250MHZ
+
+# State machines, created by init()
+paral_write_Hsync = None
+paral_write_Vsync = None
+paral_write_RGB = None
+
+# Mode given to init()
+output_mode = MODE_125MHZ
+
+# Frame buffer and its address for the DMA, allocated by init()
+H_buffer_line = None
+H_buffer_line_address = None
 
-if OVCLK:
-    set_freq(250000000)# To use this Freq you'll have to modify the RGB PIO SM -> see comments in SM2 RGB PIO script
-    SM0_FREQ=12587500  # Horizontal sync SM - For use with overclocked 250 MHz system clock
-    SM1_FREQ=125000000 # Vertical sync SM - Max freq (driven by SM0 IRQ)
-    SM2_FREQ=113287500 # RGB signal output - For use with overclocked 250 MHz system clock
-else:
-    SM0_FREQ=25175000 # Horizontal sync SM - For use with standard 125 MHz system clock
-    SM1_FREQ=125000000 # Vertical sync SM - Max freq (driven by SM0 IRQ)
-    SM2_FREQ=100700000 # Horizontal sync SM - For use with standard 125 MHz system clock
+# Pixel addressing tables, built by init() (see build_tables)
+row_word = None     # 32b word index of the first pixels of each line (of the selected canvas)
+col_word = None     # Word offset of each column within its line
+col_shift = None    # Bit position of each column within its word
+col_pix = None      # Pixel position of each column within its word (0-9)
 
+# Constant masks and color words, built by init() (see build_tables)
+left_mask = None    # left_mask[i] : bits of the pixels i to 9 of a word (11 masks, i=0-10)
+right_mask = None   # right_mask[i] : bits of the pixels 0 to i-1 of a word (11 masks, i=0-10)
+color_word = None   # color_word[col] : word with its 10 pixels set to col (8 colors)
+mask_expand = None  # mask_expand[b] : 3 bit pixel mask of the 5 bit transparency mask b (see Sprite)
+
+# Clip rectangle honoured by every drawing primitive : x1,y1 included, x2,y2 excluded (set_clip)
+clip_rect = array('h',[0,0,H_res,V_res])
+
+# Canvas the primitives draw into (see select) - the screen, created by init(), by default
+screen = None
+target = None
+draw_buf = None             # its packed pixels
+draw_stride = words_per_line    # its number of words per row
+draw_width = H_res
+draw_height = V_res
 
 #statemachine configuration
 #sm0 is used for H sync signal
@@ -75,8 +120,6 @@ def paral_Hsync():
     set(pins, 1) [13]    # High for back porch (32 cycles)
     irq(0)               # Set IRQ to signal end of line (47 cycles)
     wrap()
-#     
-paral_write_Hsync = StateMachine(0, paral_Hsync,freq=SM0_FREQ, set_base=Pin(4))
 # #
 # #sm1 is used for V sync signal
 @asm_pio(sideset_init=(PIO.OUT_HIGH,) * 1, autopull=True, pull_thresh=32)
@@ -104,10 +147,8 @@ def paral_Vsync():
     jmp(y_dec,"backporch")             # Remain in backporch, decrementing counter
     wait(1,irq,0)
     wrap()
-# 
-paral_write_Vsync = StateMachine(1, paral_Vsync,freq=SM1_FREQ, sideset_base=Pin(5))
 
-#sm4 is used for RGB signal
+#sm2 is used for RGB signal
 @asm_pio(out_init=(PIO.OUT_LOW,) * 3, out_shiftdir=PIO.SHIFT_RIGHT, sideset_init=(PIO.OUT_LOW,) * 3, autopull=True, pull_thresh=usable_bits)
 def paral_RGB():
     pull(block)                  # Pull from FIFO to OSR (only once)
@@ -118,13 +159,25 @@ def paral_RGB():
     label("colorout")
     out(pins,3)                # Push out to pins (one pixel)
     nop()                      [1]   
-#     nop()                            #
-#     nop()                      [1]   #  Uncomment these 3 lines if using 250MHz system clock
-#     nop()                      [1]   #
     jmp(x_dec,"colorout")       # Stay here thru horizontal active mode
     wrap()                   
-    
-paral_write_RGB = StateMachine(2, paral_RGB,freq=SM2_FREQ, out_base=Pin(0),sideset_base=Pin(0))
+
+# Same program for the 250MHz system clock (3 more nops per pixel)
+@asm_pio(out_init=(PIO.OUT_LOW,) * 3, out_shiftdir=PIO.SHIFT_RIGHT, sideset_init=(PIO.OUT_LOW,) * 3, autopull=True, pull_thresh=usable_bits)
+def paral_RGB_250():
+    pull(block)                  # Pull from FIFO to OSR (only once)
+    mov(y, osr)                  # Copy value from OSR to y scratch register
+    wrap_target()
+    mov(x, y)                  .side(0) # Initialize counter variable + set colour pins to zero
+    wait(1,irq,1)              # Wait for vsync active mode (starts 5 cycles after execution)
+    label("colorout")
+    out(pins,3)                # Push out to pins (one pixel)
+    nop()                      [1]   
+    nop()                            #
+    nop()                      [1]   #  3 more nops for the 250MHz system clock
+    nop()                      [1]   #
+    jmp(x_dec,"colorout")       # Stay here thru horizontal active mode
+    wrap()                   
 
 @micropython.viper
 def configure_DMAs(nword:int, H_buffer_line_add:ptr32):
@@ -182,100 +235,415 @@ def stopsync():
     ptr32(0x50200000)[0] &= 0b111111111000   # Disable PIO0 SM 0, 1 and2
     
 
+def build_tables():
+    # Pixel (x,y) is in word row_word[y]+col_word[x] at bit col_shift[x]
+    # The column tables have H_res+1 entries so that x=H_res can be used as an excluded end
+    # The buffer is shifted by one word for the DMA : pixel n of the frame is in word (n//10)-1,
+    # so row_word[y]=y*64-1. The only negative index left is -1 (first 10 pixels of the frame),
+    # which is the last word of the buffer
+    # A span from x1 to x2 (excluded) writes left_mask[col_pix[x1]] in its first word,
+    # right_mask[col_pix[x2]] in its last word and color_word[col] in between
+    global row_word,col_word,col_shift,col_pix,left_mask,right_mask,color_word,mask_expand
+    row_word=array('l',range(-1,int(V_res)*int(words_per_line)-1,int(words_per_line)))
+    col_word=bytearray(H_res+1)
+    col_shift=bytearray(H_res+1)
+    col_pix=bytearray(H_res+1)
+    for x in range(H_res+1):
+        col_word[x]=x//pix_per_words
+        col_pix[x]=x%pix_per_words
+        col_shift[x]=(x%pix_per_words)*bit_per_pix
+    full=(1<<usable_bits)-1
+    left_mask=array('L',[(full<<(bit_per_pix*i))&full for i in range(pix_per_words+1)])
+    right_mask=array('L',[(1<<(bit_per_pix*i))-1 for i in range(pix_per_words+1)])
+    color_word=array('L',[full//pixel_bitmask*col for col in range(8)])
+    mask_expand=array('L',[sum(pixel_bitmask<<(bit_per_pix*i) for i in range(5) if b>>i&1) for b in range(32)])
+
+def set_clip(x1=0,y1=0,x2=None,y2=None):
+    # Restricts the drawing to the pixels from (x1,y1) included to (x2,y2) excluded, like
+    # fill_rect - set_clip() gives back the whole screen (or canvas)
+    if x2 is None:
+        x2=draw_width
+    if y2 is None:
+        y2=draw_height
+    if x2<x1:
+        x1,x2=x2,x1
+    if y2<y1:
+        y1,y2=y2,y1
+    clip_rect[0]=min(max(x1,0),draw_width)
+    clip_rect[1]=min(max(y1,0),draw_height)
+    clip_rect[2]=min(max(x2,0),draw_width)
+    clip_rect[3]=min(max(y2,0),draw_height)
+
+def get_clip():
+    return tuple(clip_rect)
+
 @micropython.viper
 def draw_pix(x:int,y:int,col:int):
-    Data=ptr32(H_buffer_line)
-    n=int((y)*(int(H_res)*int(bit_per_pix))+ (x)*int(bit_per_pix))
-    k=(n//int(usable_bits)-1) if (n//int(usable_bits)>0)  else (int(len(H_buffer_line))-1)
-    p=n%int(usable_bits)
+    C=ptr16(clip_rect)
+    if (x<int(C[0]) or x>=int(C[2]) or y<int(C[1]) or y>=int(C[3])):
+        return
+    Data=ptr32(draw_buf)
+    k=int(ptr32(row_word)[y])+int(ptr8(col_word)[x])
+    if k<0:k=int(len(draw_buf))-1
+    p=int(ptr8(col_shift)[x])
     mask= ((int(pixel_bitmask) << p)^0x3FFFFFFF)
     Data[k]=(Data[k] & mask) | (col << p)
 
+@micropython.viper
+def get_pix(x:int,y:int)->int:
+    # Color of the pixel (x,y), -1 out of the canvas
+    if (x<0 or x>=int(draw_width) or y<0 or y>=int(draw_height)):
+        return -1
+    k=int(ptr32(row_word)[y])+int(ptr8(col_word)[x])
+    if k<0:k=int(len(draw_buf))-1
+    return (int(ptr32(draw_buf)[k])>>int(ptr8(col_shift)[x]))&int(pixel_bitmask)
+
 @micropython.viper
 def fill_screen(col:int):
-    Data=ptr32(H_buffer_line)
-    mask=0
-    for i in range(0,int(pix_per_words)):
-        mask|=col<<(int(bit_per_pix)*i)
+    C=ptr16(clip_rect)
+    if (int(C[0])>0 or int(C[1])>0 or int(C[2])<int(draw_width) or int(C[3])<int(draw_height)):
+        fill_rect(int(C[0]),int(C[1]),int(C[2]),int(C[3]),col)
+        return
+    Data=ptr32(draw_buf)
+    mask=int(ptr32(color_word)[col])
     i=0
-    while i < int(len(H_buffer_line)):
+    while i < int(len(draw_buf)):
         Data[i]=mask
         i+=1
     
 
 @micropython.viper
 def draw_fastHline(x1:int,x2:int,y:int,col:int):
-    if (x1<0):x1=0
-    if (x1>(int(H_res)-1)):x1=(int(H_res)-1)
-    if (x2<0):x2=0
-    if (x2>(int(H_res)-1)):x2=(int(H_res)-1)
-    if (y<0):y=0
-    if (y>(int(V_res)-1)):y=(int(V_res)-1)
+    # Draws the pixels from x1 to x2 excluded (x2=H_res reaches the last column)
+    C=ptr16(clip_rect)
+    if (y<int(C[1]) or y>=int(C[3])):
+        return
     if (x2<x1):
         temp = x1
         x1 = x2
         x2 = temp
-    Data=ptr32(H_buffer_line)
-    n1=int((y)*(int(H_res)*int(bit_per_pix))+ (x1)*int(bit_per_pix))
-    n2=int((y)*(int(H_res)*int(bit_per_pix))+ (x2)*int(bit_per_pix))
-    k1=(n1//int(usable_bits)-1) if (n1//int(usable_bits)>0)  else (int(len(H_buffer_line))-1)
-    k2=(n2//int(usable_bits)-1) if (n2//int(usable_bits)>0)  else (int(len(H_buffer_line))-1)
-    if (k2==k1):
-        for i in range(x1,x2):
-            draw_pix(i,y,col)
+    if (x1<int(C[0])):x1=int(C[0])
+    if (x2>int(C[2])):x2=int(C[2])
+    if (x1>=x2):
         return
-    p1=n1%int(usable_bits)
-    p2=n2%int(usable_bits)
-    mask1off=0
-    mask1col=0
-    mask2off=0
-    mask2col=0
-    for i in range(p1//int(bit_per_pix),int(pix_per_words)):
-        mask1off|=(int(pixel_bitmask))<<(int(bit_per_pix)*i)
-        mask1col|=col<<(int(bit_per_pix)*i)
-    mask1off^=int(0x3FFFFFFF)
-    for i in range(0,p2//int(bit_per_pix)):
-        mask2off|=(int(pixel_bitmask))<<(int(bit_per_pix)*i)
-        mask2col|=col<<(int(bit_per_pix)*i)
-    mask2off^=0x3FFFFFFF
-    Data[k1]=(Data[k1] & mask1off) | mask1col
-    Data[k2]=(Data[k2] & mask2off) | mask2col
-    mask=0
-    for i in range(0,int(pix_per_words)):
-        mask|=col<<(int(bit_per_pix)*i)
+    Data=ptr32(draw_buf)
+    CW=ptr8(col_word)
+    CP=ptr8(col_pix)
+    row=int(ptr32(row_word)[y])
+    k1=row+CW[x1]
+    k2=row+CW[x2]
+    mask=int(ptr32(color_word)[col])
+    mask1=int(ptr32(left_mask)[CP[x1]])
+    mask2=int(ptr32(right_mask)[CP[x2]])
     i=k1+1
-    if (i>(int(len(H_buffer_line))-1)):i=0
+    if (k2==k1):
+        # Short span within one word : a single read-modify-write
+        if k1<0:k1=int(len(draw_buf))-1
+        mask1&=mask2
+        Data[k1]=(Data[k1] & (mask1^0x3FFFFFFF)) | (mask & mask1)
+        return
+    if k1<0:k1=int(len(draw_buf))-1
+    Data[k1]=(Data[k1] & (mask1^0x3FFFFFFF)) | (mask & mask1)
+    if mask2:
+        Data[k2]=(Data[k2] & (mask2^0x3FFFFFFF)) | (mask & mask2)
     while i < k2:
         Data[i]=mask
         i+=1
     
 @micropython.viper
 def draw_fastVline(x:int,y1:int,y2:int,col:int):
-    if (x<0):x=0
-    if (x>(int(H_res)-1)):x=(int(H_res)-1)
-    if (y1<0):y1=0
-    if (y1>(int(V_res)-1)):y1=(int(V_res)-1)
-    if (y2<0):y2=0
-    if (y2>(int(V_res)-1)):y2=(int(V_res)-1)
+    # Draws the pixels from y1 to y2 excluded (y2=V_res reaches the last line)
+    C=ptr16(clip_rect)
+    if (x<int(C[0]) or x>=int(C[2])):
+        return
     if (y2<y1):
         temp = y1
         y1 = y2
         y2 = temp
-    Data=ptr32(H_buffer_line)
-    n1=int((y1)*(int(H_res)*int(bit_per_pix))+ (x)*int(bit_per_pix))
-    k1=(n1//int(usable_bits)-1) if (n1//int(usable_bits)>0)  else (int(len(H_buffer_line))-1)
-    p1=n1%int(usable_bits)
-    nword=(int(len(H_buffer_line))//int(V_res))
+    if (y1<int(C[1])):y1=int(C[1])
+    if (y2>int(C[3])):y2=int(C[3])
+    if (y1>=y2):
+        return
+    Data=ptr32(draw_buf)
+    k=int(ptr32(row_word)[y1])+int(ptr8(col_word)[x])
+    p1=int(ptr8(col_shift)[x])
     mask= ((int(pixel_bitmask) << p1)^0x3FFFFFFF)
+    colp=col << p1
+    if k<0:
+        # first 10 pixels of the frame are in the last word
+        n=int(len(draw_buf))-1
+        Data[n]=(Data[n] & mask) | colp
+        k+=int(draw_stride)
+        y1+=1
     for i in range(y2-y1):
-        Data[k1+i*nword]=(Data[k1+i*nword] & mask) | (col << p1)
+        Data[k]=(Data[k] & mask) | colp
+        k+=int(draw_stride)
+
+@micropython.viper
+def div_round(n:int,d:int)->int:
+    # n/d rounded to the nearest integer
+    if d<0:
+        n=0-n
+        d=0-d
+    return (n+(d>>1))//d
+
+@micropython.viper
+def draw_line(x1:int,y1:int,x2:int,y2:int,col:int):
+    # Draws the line from (x1,y1) to (x2,y2) included - integer Bresenham algorithm, all octants
+    C=ptr16(clip_rect)
+    xmin=int(C[0])
+    ymin=int(C[1])
+    xmax=int(C[2])-1
+    ymax=int(C[3])-1
+    if (xmax<xmin or ymax<ymin):
+        return
+    # Cohen-Sutherland clipping against the clip rectangle (outcodes : 1 left, 2 right, 4 top,
+    # 8 bottom)
+    while 1:
+        c1=(1 if x1<xmin else 0)|(2 if x1>xmax else 0)|(4 if y1<ymin else 0)|(8 if y1>ymax else 0)
+        c2=(1 if x2<xmin else 0)|(2 if x2>xmax else 0)|(4 if y2<ymin else 0)|(8 if y2>ymax else 0)
+        if (c1|c2)==0:
+            break
+        if (c1&c2):
+            return                      # Entirely on one side of the clip rectangle
+        c=c1 if c1 else c2
+        if (c&8):
+            x=x1+int(div_round((x2-x1)*(ymax-y1),y2-y1))
+            y=ymax
+        elif (c&4):
+            x=x1+int(div_round((x2-x1)*(ymin-y1),y2-y1))
+            y=ymin
+        elif (c&2):
+            y=y1+int(div_round((y2-y1)*(xmax-x1),x2-x1))
+            x=xmax
+        else:
+            y=y1+int(div_round((y2-y1)*(xmin-x1),x2-x1))
+            x=xmin
+        if c==c1:
+            x1=x
+            y1=y
+        else:
+            x2=x
+            y2=y
+    # Horizontal and vertical lines use the span and column fast paths
+    if (y1==y2):
+        if (x1<x2):
+            draw_fastHline(x1,x2+1,y1,col)
+        else:
+            draw_fastHline(x2,x1+1,y1,col)
+        return
+    if (x1==x2):
+        if (y1<y2):
+            draw_fastVline(x1,y1,y2+1,col)
+        else:
+            draw_fastVline(x1,y2,y1+1,col)
+        return
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CS=ptr8(col_shift)
+    last=int(len(draw_buf))-1
+    dx=x2-x1
+    sx=1
+    if dx<0:
+        dx=0-dx
+        sx=-1
+    dy=y1-y2
+    sy=1
+    if dy>0:
+        dy=0-dy
+        sy=-1
+    err=dx+dy
+    while 1:
+        k=int(RW[y1])+int(CW[x1])
+        if k<0:k=last
+        p=int(CS[x1])
+        Data[k]=(Data[k] & ((int(pixel_bitmask) << p)^0x3FFFFFFF)) | (col << p)
+        if (x1==x2 and y1==y2):
+            break
+        e2=2*err
+        if (e2>=dy):
+            err+=dy
+            x1+=sx
+        if (e2<=dx):
+            err+=dx
+            y1+=sy
+        
+@micropython.viper
+def draw_polyline(xs,ys,col:int):
+    # Draws the lines joining the points (xs[i],ys[i]) - xs and ys are array('h') of coordinates
+    # The whole path is clipped and rasterized here (same algorithm as draw_line), without one
+    # Python call per segment
+    X=ptr16(xs)
+    Y=ptr16(ys)
+    n=int(len(xs))
+    if int(len(ys))<n:n=int(len(ys))
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CS=ptr8(col_shift)
+    last=int(len(draw_buf))-1
+    C=ptr16(clip_rect)
+    xmin=int(C[0])
+    ymin=int(C[1])
+    xmax=int(C[2])-1
+    ymax=int(C[3])-1
+    if (xmax<xmin or ymax<ymin):
+        return
+    mask=int(pixel_bitmask)
+    i=1
+    while i<n:
+        # array('h') values are read unsigned
+        x1=int(X[i-1])
+        if x1>32767:x1-=65536
+        y1=int(Y[i-1])
+        if y1>32767:y1-=65536
+        x2=int(X[i])
+        if x2>32767:x2-=65536
+        y2=int(Y[i])
+        if y2>32767:y2-=65536
+        i+=1
+        visible=1
+        while 1:
+            c1=(1 if x1<xmin else 0)|(2 if x1>xmax else 0)|(4 if y1<ymin else 0)|(8 if y1>ymax else 0)
+            c2=(1 if x2<xmin else 0)|(2 if x2>xmax else 0)|(4 if y2<ymin else 0)|(8 if y2>ymax else 0)
+            if (c1|c2)==0:
+                break
+            if (c1&c2):
+                visible=0
+                break
+            c=c1 if c1 else c2
+            if (c&8):
+                x=x1+int(div_round((x2-x1)*(ymax-y1),y2-y1))
+                y=ymax
+            elif (c&4):
+                x=x1+int(div_round((x2-x1)*(ymin-y1),y2-y1))
+                y=ymin
+            elif (c&2):
+                y=y1+int(div_round((y2-y1)*(xmax-x1),x2-x1))
+                x=xmax
+            else:
+                y=y1+int(div_round((y2-y1)*(xmin-x1),x2-x1))
+                x=xmin
+            if c==c1:
+                x1=x
+                y1=y
+            else:
+                x2=x
+                y2=y
+        if not visible:
+            continue
+        dx=x2-x1
+        sx=1
+        if dx<0:
+            dx=0-dx
+            sx=-1
+        dy=y1-y2
+        sy=1
+        if dy>0:
+            dy=0-dy
+            sy=-1
+        err=dx+dy
+        while 1:
+            k=int(RW[y1])+int(CW[x1])
+            if k<0:k=last
+            p=int(CS[x1])
+            Data[k]=(Data[k] & ((mask << p)^0x3FFFFFFF)) | (col << p)
+            if (x1==x2 and y1==y2):
+                break
+            e2=2*err
+            if (e2>=dy):
+                err+=dy
+                x1+=sx
+            if (e2<=dx):
+                err+=dx
+                y1+=sy
+
+@micropython.viper
+def draw_points(xs,ys,col:int):
+    # Draws the points (xs[i],ys[i]) inside the clip rectangle - xs and ys are array('h') of
+    # coordinates
+    X=ptr16(xs)
+    Y=ptr16(ys)
+    n=int(len(xs))
+    if int(len(ys))<n:n=int(len(ys))
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CS=ptr8(col_shift)
+    last=int(len(draw_buf))-1
+    C=ptr16(clip_rect)
+    xmin=int(C[0])
+    ymin=int(C[1])
+    xmax=int(C[2])
+    ymax=int(C[3])
+    mask=int(pixel_bitmask)
+    i=0
+    while i<n:
+        # array('h') values are read unsigned : negative coordinates are above 32767
+        x=int(X[i])
+        y=int(Y[i])
+        i+=1
+        if (x<xmin or x>=xmax or y<ymin or y>=ymax):
+            continue
+        k=int(RW[y])+int(CW[x])
+        if k<0:k=last
+        p=int(CS[x])
+        Data[k]=(Data[k] & ((mask << p)^0x3FFFFFFF)) | (col << p)
 
 @micropython.viper
 def fill_rect(x1:int,y1:int,x2:int,y2:int,col:int):
-    j=int(min(y1,y2))
-    while (j<int(max(y1,y2))):
-        draw_fastHline(x1,x2,j,col)
-        j+=1
+    # Span fill : the rectangle is clipped, and the edge masks and color word are computed once,
+    # then each line only writes its 2 edge words and the solid words in between
+    if (x2<x1):
+        temp = x1
+        x1 = x2
+        x2 = temp
+    if (y2<y1):
+        temp = y1
+        y1 = y2
+        y2 = temp
+    C=ptr16(clip_rect)
+    if (x1<int(C[0])):x1=int(C[0])
+    if (x2>int(C[2])):x2=int(C[2])
+    if (y1<int(C[1])):y1=int(C[1])
+    if (y2>int(C[3])):y2=int(C[3])
+    if (x1>=x2 or y1>=y2):
+        return
+    Data=ptr32(draw_buf)
+    CW=ptr8(col_word)
+    CP=ptr8(col_pix)
+    w1=int(CW[x1])
+    w2=int(CW[x2])
+    p2=int(CP[x2])
+    last=int(len(draw_buf))-1
+    # masks of the pixels to write in the first and last words
+    mask1=int(ptr32(left_mask)[CP[x1]])
+    mask2=int(ptr32(right_mask)[CP[x2]])
+    colword=int(ptr32(color_word)[col])
+    if (w1==w2):
+        # whole span within one word
+        mask1&=mask2
+    mask1col=colword & mask1
+    mask2col=colword & mask2
+    mask1^=0x3FFFFFFF
+    mask2^=0x3FFFFFFF
+    k=int(ptr32(row_word)[y1])
+    n=y2-y1
+    while n>0:
+        k1=k+w1
+        k2=k+w2
+        i=k1+1
+        if k1<0:k1=last
+        Data[k1]=(Data[k1] & mask1) | mask1col
+        if (w2>w1):
+            if p2:
+                Data[k2]=(Data[k2] & mask2) | mask2col
+            while i < k2:
+                Data[i]=colword
+                i+=1
+        k+=int(draw_stride)
+        n-=1
 
 @micropython.viper
 def draw_rect(x1:int,y1:int,x2:int,y2:int,col:int):
@@ -284,77 +652,858 @@ def draw_rect(x1:int,y1:int,x2:int,y2:int,col:int):
     draw_fastVline(x1,y1,y2,col)
     draw_fastVline(x2,y1,y2,col)
 
+@micropython.viper
+def scroll(x1:int,y1:int,x2:int,y2:int,dy:int,col:int):
+    # Moves the pixels of the rectangle from (x1,y1) to (x2,y2) excluded up by dy lines (down if
+    # dy<0) - whole words copied between the edge words - and fills the lines uncovered with col
+    if (x2<x1):
+        temp = x1
+        x1 = x2
+        x2 = temp
+    if (y2<y1):
+        temp = y1
+        y1 = y2
+        y2 = temp
+    C=ptr16(clip_rect)
+    if (x1<int(C[0])):x1=int(C[0])
+    if (x2>int(C[2])):x2=int(C[2])
+    if (y1<int(C[1])):y1=int(C[1])
+    if (y2>int(C[3])):y2=int(C[3])
+    if (x1>=x2 or y1>=y2 or dy==0):
+        return
+    if (dy>=y2-y1 or -dy>=y2-y1):
+        fill_rect(x1,y1,x2,y2,col)
+        return
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CP=ptr8(col_pix)
+    w1=int(ptr8(col_word)[x1])
+    w2=int(ptr8(col_word)[x2])
+    p2=int(CP[x2])
+    last=int(len(draw_buf))-1
+    mask1=int(ptr32(left_mask)[CP[x1]])
+    mask2=int(ptr32(right_mask)[CP[x2]])
+    if (w1==w2):
+        mask1&=mask2
+    # destination lines from the top when moving up, from the bottom when moving down
+    if dy>0:
+        y=y1
+        step=1
+        n=y2-y1-dy
+    else:
+        y=y2-1
+        step=-1
+        n=y2-y1+dy
+    while n>0:
+        kd=int(RW[y])+w1
+        ks=int(RW[y+dy])+w1
+        e=int(RW[y])+w2
+        i=kd+1
+        j=ks+1
+        if kd<0:kd=last
+        if ks<0:ks=last
+        Data[kd]=(Data[kd]&(mask1^0x3FFFFFFF))|(Data[ks]&mask1)
+        if (w2>w1):
+            while i<e:
+                Data[i]=Data[j]
+                i+=1
+                j+=1
+            if p2:
+                Data[e]=(Data[e]&(mask2^0x3FFFFFFF))|(Data[j]&mask2)
+        y+=step
+        n-=1
+    if dy>0:
+        fill_rect(x1,y2-dy,x2,y2,col)
+    else:
+        fill_rect(x1,y1,x2,y1-dy,col)
+
+# Circles, ellipses and arcs : the outlines are written straight into the buffer (same
+# addressing as draw_pix, points outside the clip rectangle skipped) and the filled shapes
+# draw each scanline exactly once
+
+# Sector used by draw_arc : directions (x,y) of the start and end angles scaled by 1024,
+# and 0 for the whole circle, 1 for a sector up to 180°, 2 for a larger one
+arc_sector=array('l',[0,0,0,0,0])
+full_circle=array('l',[0,0,0,0,0])
+
+@micropython.viper
+def circle_points(x:int,y:int,r:int,col:int,sector):
+    # 8-way symmetric midpoint circle, restricted to a sector (see arc_sector)
+    C=ptr16(clip_rect)
+    xmin=int(C[0])
+    ymin=int(C[1])
+    xmax=int(C[2])
+    ymax=int(C[3])
+    if (r<0 or x+r<xmin or x-r>=xmax or y+r<ymin or y-r>=ymax):
+        return
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CS=ptr8(col_shift)
+    S=ptr32(sector)
+    sx=S[0]
+    sy=S[1]
+    ex=S[2]
+    ey=S[3]
+    mode=S[4]
+    last=int(len(draw_buf))-1
+    a=r
+    b=0
+    err=1-r
+    while a>=b:
+        m=0
+        while m<8:
+            # The 8 points (±a,±b) and (±b,±a), y pointing up
+            dx=a
+            dy=b
+            if m>=4:
+                dx=b
+                dy=a
+            if m&1:dx=0-dx
+            if m&2:dy=0-dy
+            m+=1
+            if mode:
+                c1=sx*dy-sy*dx
+                c2=dx*ey-dy*ex
+                if mode==1:
+                    if (c1<0 or c2<0):
+                        continue
+                elif (c1<0 and c2<0):
+                    continue
+            px=x+dx
+            py=y-dy
+            if (px<xmin or px>=xmax or py<ymin or py>=ymax):
+                continue
+            k=int(RW[py])+int(CW[px])
+            if k<0:k=last
+            p=int(CS[px])
+            Data[k]=(Data[k] & ((int(pixel_bitmask) << p)^0x3FFFFFFF)) | (col << p)
+        b+=1
+        if err<0:
+            err+=2*b+1
+        else:
+            a-=1
+            err+=2*(b-a)+1
+
 @micropython.viper
 def draw_circle(x:int, y:int, r:int , color:int):
-    if (x < 0 or y < 0 or x >= int(H_res) or y >= int(V_res)):
+    circle_points(x,y,r,color,full_circle)
+
+def draw_arc(x,y,r,start,end,color):
+    # Arc of circle going counterclockwise from angle start to end (degrees, 0 pointing right)
+    if end-start>=360:
+        draw_circle(x,y,r,color)
         return
-    # Bresenham algorithm
-    x_pos = 0-r
-    y_pos = 0
-    err = 2 - 2 * r
-    while 1:
-        draw_pix(x-x_pos, y+y_pos,color)
-        draw_pix(x-x_pos, y-y_pos,color)
-        draw_pix(x+x_pos, y+y_pos,color)
-        draw_pix(x+x_pos, y-y_pos,color)
-        e2 = err
-        if (e2 <= y_pos):
-            y_pos += 1
-            err += y_pos * 2 + 1
-            if((0-x_pos) == y_pos and e2 <= x_pos):
-                e2 = 0
-        if (e2 > x_pos):
-            x_pos += 1
-            err += x_pos * 2 + 1
-        if x_pos > 0:
-            break
+    sweep=(end-start)%360
+    if sweep==0:
+        return
+    start=radians(start)
+    end=radians(end)
+    arc_sector[0]=round(1024*cos(start))
+    arc_sector[1]=round(1024*sin(start))
+    arc_sector[2]=round(1024*cos(end))
+    arc_sector[3]=round(1024*sin(end))
+    arc_sector[4]=1 if sweep<=180 else 2
+    circle_points(x,y,r,color,arc_sector)
 
 @micropython.viper
 def fill_disk(x:int, y:int, r:int , color:int):
-    if (x < 0 or y < 0 or x >= int(H_res) or y >= int(V_res)):
+    C=ptr16(clip_rect)
+    if (r<0 or x+r<int(C[0]) or x-r>=int(C[2]) or y+r<int(C[1]) or y-r>=int(C[3])):
         return
-    # Bresenham algorithm
-    x_pos = 0-r
-    y_pos = 0
-    err = 2 - 2 * r
-    while 1:
-        draw_fastHline(x-x_pos,x+x_pos,y+y_pos,color)
-        draw_fastHline(x-x_pos,x+x_pos,y-y_pos,color)
-        e2 = err
-        if (e2 <= y_pos):
-            y_pos += 1
-            err += y_pos * 2 + 1
-            if((0-x_pos) == y_pos and e2 <= x_pos):
-                e2 = 0
-        if (e2 > x_pos):
-            x_pos += 1
-            err += x_pos * 2 + 1
-        if x_pos > 0:
-            break
+    # Midpoint algorithm : the rows y±b are drawn at every step (half width a), the rows y±a
+    # only when a is about to change, with the last (widest) b
+    a=r
+    b=0
+    err=1-r
+    while a>=b:
+        draw_fastHline(x-a,x+a+1,y+b,color)
+        if b:
+            draw_fastHline(x-a,x+a+1,y-b,color)
+        b+=1
+        if err<0:
+            err+=2*b+1
+        else:
+            if a>=b:
+                draw_fastHline(x-b+1,x+b,y+a,color)
+                draw_fastHline(x-b+1,x+b,y-a,color)
+            a-=1
+            err+=2*(b-a)+1
+
+@micropython.viper
+def draw_ellipse(x:int, y:int, rx:int, ry:int, color:int):
+    C=ptr16(clip_rect)
+    xmin=int(C[0])
+    ymin=int(C[1])
+    xmax=int(C[2])
+    ymax=int(C[3])
+    if (rx<0 or ry<0 or x+rx<xmin or x-rx>=xmax or y+ry<ymin or y-ry>=ymax):
+        return
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CS=ptr8(col_shift)
+    last=int(len(draw_buf))-1
+    # Bresenham ellipse : one quadrant (xx from -rx to 0, yy from 0 to ry) mirrored 4 times
+    a2=rx*rx
+    b2=ry*ry
+    xx=0-rx
+    yy=0
+    err=xx*(2*b2+xx)+b2
+    while xx<=0:
+        m=0
+        while m<4:
+            px=x+xx
+            py=y+yy
+            if m&1:px=x-xx
+            if m&2:py=y-yy
+            m+=1
+            if (px<xmin or px>=xmax or py<ymin or py>=ymax):
+                continue
+            k=int(RW[py])+int(CW[px])
+            if k<0:k=last
+            p=int(CS[px])
+            Data[k]=(Data[k] & ((int(pixel_bitmask) << p)^0x3FFFFFFF)) | (color << p)
+        e2=2*err
+        if (e2>=(xx*2+1)*b2):
+            xx+=1
+            err+=(xx*2+1)*b2
+        if (e2<=(yy*2+1)*a2):
+            yy+=1
+            err+=(yy*2+1)*a2
+    # Very flat ellipses stop early : finish the tips
+    while yy<ry:
+        yy+=1
+        draw_pix(x,y+yy,color)
+        draw_pix(x,y-yy,color)
+
+@micropython.viper
+def fill_ellipse(x:int, y:int, rx:int, ry:int, color:int):
+    C=ptr16(clip_rect)
+    if (rx<0 or ry<0 or x+rx<int(C[0]) or x-rx>=int(C[2]) or y+ry<int(C[1]) or y-ry>=int(C[3])):
+        return
+    # Same walk as draw_ellipse : each row is drawn the first time it is reached, which is
+    # also when it is the widest
+    a2=rx*rx
+    b2=ry*ry
+    xx=0-rx
+    yy=0
+    err=xx*(2*b2+xx)+b2
+    done=-1
+    tip=0
+    while yy<=ry:
+        if xx>0:
+            # very flat ellipses stop early : the tips are one pixel wide
+            xx=0
+            tip=1
+        if yy!=done:
+            done=yy
+            draw_fastHline(x+xx,x-xx+1,y+yy,color)
+            if yy:
+                draw_fastHline(x+xx,x-xx+1,y-yy,color)
+        if tip:
+            yy+=1
+            continue
+        e2=2*err
+        if (e2>=(xx*2+1)*b2):
+            xx+=1
+            err+=(xx*2+1)*b2
+        if (e2<=(yy*2+1)*a2):
+            yy+=1
+            err+=(yy*2+1)*a2
+
+# Polygons : scanline fill with an active edge table, one draw_fastHline span per row and
+# pair of edges. Pixels are filled like fill_rect : a row y is inside an edge going from
+# ymin to ymax when ymin<=y<ymax, and a span goes from its left edge included to its right
+# edge excluded, so that polygons sharing an edge do not overlap.
+
+poly_table=None             # scratch array('l') of fill_polygon, grown as needed
+tri_x=array('h',[0,0,0])    # vertices of fill_triangle
+tri_y=array('h',[0,0,0])
+
+@micropython.viper
+def fill_poly(xs,ys,n:int,col:int,table):
+    # Even-odd fill of the polygon (xs[i],ys[i]) i<n, table being an array('l') of 10*n words :
+    # 7 words per edge (top row, bottom row, x, error, x step, error step, height), then the
+    # edges sorted by top row, the active edges and the crossings of the current row
+    X=ptr16(xs)
+    Y=ptr16(ys)
+    E=ptr32(table)
+    order=7*n
+    active=8*n
+    cross=9*n
+    ne=0
+    ymax=-32768
+    j=n-1
+    i=0
+    while i<n:
+        # array('h') values are read unsigned
+        x1=int(X[j])
+        if x1>32767:x1-=65536
+        y1=int(Y[j])
+        if y1>32767:y1-=65536
+        x2=int(X[i])
+        if x2>32767:x2-=65536
+        y2=int(Y[i])
+        if y2>32767:y2-=65536
+        j=i
+        i+=1
+        if y1==y2:
+            continue
+        if y1>y2:
+            temp=x1
+            x1=x2
+            x2=temp
+            temp=y1
+            y1=y2
+            y2=temp
+        if y2>ymax:ymax=y2
+        # x is followed exactly as x1+(y-y1)*dx/dy = x-err/dy, x being the rounded up value
+        # and 0<=err<dy : each row adds step to x and removes frac from err
+        dx=x2-x1
+        dy=y2-y1
+        if dx>=0:
+            step=dx//dy
+        else:
+            step=0-((dy-1-dx)//dy)
+        b=7*ne
+        E[b]=y1
+        E[b+1]=y2
+        E[b+2]=x1
+        E[b+3]=0
+        E[b+4]=step
+        E[b+5]=dx-step*dy
+        E[b+6]=dy
+        # insertion sort on the top row
+        k=ne
+        while k>0 and int(E[7*int(E[order+k-1])])>y1:
+            E[order+k]=E[order+k-1]
+            k-=1
+        E[order+k]=ne
+        ne+=1
+    if ne==0:
+        return
+    C=ptr16(clip_rect)
+    ymin=int(C[1])
+    if ymax>int(C[3]):ymax=int(C[3])
+    y=int(E[7*int(E[order])])
+    na=0
+    nxt=0
+    while y<ymax:
+        # edges starting on this row join the active table, the finished ones leave it
+        while nxt<ne and int(E[7*int(E[order+nxt])])==y:
+            E[active+na]=E[order+nxt]
+            na+=1
+            nxt+=1
+        k=0
+        m=0
+        while k<na:
+            b=int(E[active+k])
+            k+=1
+            if int(E[7*b+1])>y:
+                E[active+m]=b
+                m+=1
+        na=m
+        if y>=ymin:
+            # crossings sorted by insertion (already almost sorted from the previous row)
+            k=0
+            while k<na:
+                x=int(E[7*int(E[active+k])+2])
+                m=k
+                while m>0 and int(E[cross+m-1])>x:
+                    E[cross+m]=E[cross+m-1]
+                    m-=1
+                E[cross+m]=x
+                k+=1
+            k=0
+            while k+1<na:
+                draw_fastHline(int(E[cross+k]),int(E[cross+k+1]),y,col)
+                k+=2
+        k=0
+        while k<na:
+            b=7*int(E[active+k])
+            k+=1
+            x=int(E[b+2])+int(E[b+4])
+            err=int(E[b+3])-int(E[b+5])
+            if err<0:
+                err+=int(E[b+6])
+                x+=1
+            E[b+2]=x
+            E[b+3]=err
+        y+=1
+
+def fill_polygon(xs,ys,col):
+    # Fills the polygon of vertices (xs[i],ys[i]) - xs and ys are array('h') of coordinates
+    global poly_table
+    n=min(len(xs),len(ys))
+    if n<3:
+        return
+    if poly_table is None or len(poly_table)<10*n:
+        poly_table=array('l',range(10*n))
+    fill_poly(xs,ys,n,col,poly_table)
+
+def fill_triangle(x1,y1,x2,y2,x3,y3,col):
+    tri_x[0]=x1
+    tri_y[0]=y1
+    tri_x[1]=x2
+    tri_y[1]=y2
+    tri_x[2]=x3
+    tri_y[2]=y3
+    fill_polygon(tri_x,tri_y,col)
+
+# Flood fill : span algorithm of Heckbert (Graphics Gems, "A seed fill algorithm"). Runs of the
+# old color are found by reading the packed buffer (whole words of it skipped at once) and
+# written as draw_fastHline spans. The spans left to explore are kept on a stack, doubled when
+# a region needs it up to flood_max_spans spans (16k bytes, 24k while it is copied).
+
+flood_spans=const(512)      # initial capacity of the span stack (4 half-words per span)
+flood_max_spans=const(2048) # largest stack allocated by flood_fill
+flood_stack=None            # array('H') allocated on the first flood_fill
+
+@micropython.viper
+def flood_span_fill(x:int,y:int,col:int,stack,top:int)->int:
+    # Fills the 4-connected region of (x,y) - returns 0 when done, or the top of the stack
+    # when a span might not have room for the spans it pushes : nothing is dropped, the fill
+    # goes on by calling again with a larger stack holding the same first top entries
+    # The region stops at the borders of the clip rectangle
+    # stack[0] keeps the color replaced, the spans start at stack[4]
+    C=ptr16(clip_rect)
+    xmin=int(C[0])
+    ymin=int(C[1])
+    xmax=int(C[2])
+    ymax=int(C[3])
+    S=ptr16(stack)
+    size=int(len(stack))
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CS=ptr8(col_shift)
+    CP=ptr8(col_pix)
+    last=int(len(draw_buf))-1
+    if top==0:
+        if (x<xmin or x>=xmax or y<ymin or y>=ymax):
+            return 0
+        k=int(RW[y])+int(CW[x])
+        if k<0:k=last
+        old=(int(Data[k])>>int(CS[x]))&int(pixel_bitmask)
+        if old==col:
+            return 0
+        S[0]=old
+        # A span (y, x1, x2, dy+1) tells that row y is filled from x1 to x2 included, and that
+        # row y+dy next to it is still to be explored
+        top=4
+        if y+1<ymax:
+            S[4]=y
+            S[5]=x
+            S[6]=x
+            S[7]=2
+            top=8
+        # seed, popped first : row y itself
+        S[top]=y+1
+        S[top+1]=x
+        S[top+2]=x
+        S[top+3]=0
+        top+=4
+    old=int(S[0])
+    full=int(ptr32(color_word)[old])
+    while top>4:
+        # a span of n pixels pushes at most n//2+4 spans
+        if top+2*int(S[top-2])-2*int(S[top-3])+16>size:
+            return top
+        top-=4
+        dy=int(S[top+3])-1
+        y=int(S[top])+dy
+        x1=int(S[top+1])
+        x2=int(S[top+2])
+        row=int(RW[y])
+        # spans are only pushed for rows on screen
+        ahead=1 if (y+dy>=ymin and y+dy<ymax) else 0
+        back=1 if (y-dy>=ymin and y-dy<ymax) else 0
+        # run of old color going left from x1
+        x=x1
+        while x>=xmin:
+            k=row+int(CW[x])
+            if k<0:k=last
+            if (int(CP[x])==9 and x-9>=xmin and (int(Data[k])&0x3FFFFFFF)==full):
+                x-=10
+            elif ((int(Data[k])>>int(CS[x]))&int(pixel_bitmask))==old:
+                x-=1
+            else:
+                break
+        run=0
+        if x<x1:
+            l=x+1
+            if (l<x1 and back):
+                # leak on the left : back to the previous row
+                S[top]=y
+                S[top+1]=l
+                S[top+2]=x1-1
+                S[top+3]=1-dy
+                top+=4
+            x=x1+1
+            run=1
+        while 1:
+            if run:
+                # run of old color going right
+                while x<xmax:
+                    k=row+int(CW[x])
+                    if k<0:k=last
+                    if (int(CP[x])==0 and x+10<=xmax and (int(Data[k])&0x3FFFFFFF)==full):
+                        x+=10
+                    elif ((int(Data[k])>>int(CS[x]))&int(pixel_bitmask))==old:
+                        x+=1
+                    else:
+                        break
+                draw_fastHline(l,x,y,col)
+                if ahead:
+                    S[top]=y
+                    S[top+1]=l
+                    S[top+2]=x-1
+                    S[top+3]=dy+1
+                    top+=4
+                if (x>x2+1 and back):
+                    # leak on the right
+                    S[top]=y
+                    S[top+1]=x2+1
+                    S[top+2]=x-1
+                    S[top+3]=1-dy
+                    top+=4
+            # next run of old color under the span
+            x+=1
+            while x<=x2:
+                k=row+int(CW[x])
+                if k<0:k=last
+                if ((int(Data[k])>>int(CS[x]))&int(pixel_bitmask))==old:
+                    break
+                x+=1
+            if x>x2:
+                break
+            l=x
+            run=1
+    return 0
+
+def flood_fill(x,y,col,stack=None,max_spans=flood_max_spans):
+    # Fills with col the region of the color of (x,y) connected to it (4 neighbours), inside
+    # the clip rectangle. stack, an array('H') of 4 half-words per span, replaces the one
+    # allocated on the first call (flood_spans spans).
+    # The stack is doubled while the region needs it, up to max_spans spans : returns False,
+    # the region being partly filled, if that is not enough (or if the memory runs out)
+    global flood_stack
+    if stack is None:
+        if flood_stack is None:
+            flood_stack=array('H',range(4*flood_spans))
+        stack=flood_stack
+    top=flood_span_fill(x,y,col,stack,0)
+    while top:
+        n=min(2*len(stack),4*max_spans)
+        if n<=len(stack):
+            return False
+        try:
+            larger=array('H',range(n))
+        except MemoryError:
+            return False
+        memoryview(larger)[:top]=memoryview(stack)[:top]
+        stack=larger
+        top=flood_span_fill(x,y,col,stack,top)
+    return True
+
+# Readback : pixels copied out of the selected canvas (the screen by default), into a bytearray (one byte per pixel, row
+# after row) or into packed pixels. Packed pixels are stored like the frame buffer, 10 pixels
+# of 3 bits per 32b word (pixel i of a row in word i//10 at bit 3*(i%10)), each row starting
+# on a new word : an array('L') of packed_size(w,h) words holds w*h pixels
+
+def packed_size(w,h):
+    return (w+pix_per_words-1)//pix_per_words*h
+
+@micropython.viper
+def copy_row(src,sw:int,sp:int,dst,dw:int,dp:int,n:int):
+    # Copies n packed pixels from src (word sw, pixel sp of that word) to dst (word dw,
+    # pixel dp) : each destination word gets 10 source pixels shifted from 1 or 2 words and is
+    # merged under the edge masks. Word -1 is the last one (first pixels of the frame buffer)
+    S=ptr32(src)
+    D=ptr32(dst)
+    LM=ptr32(left_mask)
+    RM=ptr32(right_mask)
+    slast=int(len(src))-1
+    dlast=int(len(dst))-1
+    while n>0:
+        cnt=10-dp
+        if cnt>n:cnt=n
+        k=sw
+        if k<0:k=slast
+        v=(int(S[k])&0x3FFFFFFF)>>(3*sp)
+        if sp+cnt>10:
+            v|=(int(S[sw+1])<<(30-3*sp))&0x3FFFFFFF
+        m=int(LM[dp])&int(RM[dp+cnt])
+        k=dw
+        if k<0:k=dlast
+        D[k]=(D[k]&(m^0x3FFFFFFF))|((v<<(3*dp))&m)
+        n-=cnt
+        dw+=1
+        dp=0
+        sp+=cnt
+        if sp>=10:
+            sp-=10
+            sw+=1
+
+@micropython.viper
+def read_pixels(x:int,y:int,w:int,h:int,buf):
+    # One byte per pixel, the pixels out of the canvas read as 0
+    B=ptr8(buf)
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CS=ptr8(col_shift)
+    last=int(len(draw_buf))-1
+    # visible columns
+    x1=x
+    if x1<0:x1=0
+    x2=x+w
+    if x2>int(draw_width):x2=int(draw_width)
+    j=0
+    while j<h:
+        o=j*w
+        i=0
+        while i<w:
+            B[o+i]=0
+            i+=1
+        yy=y+j
+        j+=1
+        if (yy<0 or yy>=int(draw_height) or x1>=x2):
+            continue
+        # walk the words of the row, 3 bits at a time
+        o+=x1-x
+        k=int(RW[yy])+int(CW[x1])
+        s=int(CS[x1])
+        if k<0:
+            word=int(Data[last])>>s
+        else:
+            word=int(Data[k])>>s
+        i=x1
+        while i<x2:
+            B[o]=word&int(pixel_bitmask)
+            o+=1
+            i+=1
+            s+=int(bit_per_pix)
+            word=word>>int(bit_per_pix)
+            if (s==int(usable_bits) and i<x2):
+                k+=1
+                word=int(Data[k])
+                s=0
+
+@micropython.viper
+def read_packed(x:int,y:int,w:int,h:int,buf):
+    # Packed pixels, the pixels out of the canvas read as 0
+    B=ptr32(buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CP=ptr8(col_pix)
+    stride=(w+9)//10
+    x1=x
+    if x1<0:x1=0
+    x2=x+w
+    if x2>int(draw_width):x2=int(draw_width)
+    j=0
+    while j<h:
+        o=j*stride
+        i=0
+        while i<stride:
+            B[o+i]=0
+            i+=1
+        yy=y+j
+        j+=1
+        if (yy<0 or yy>=int(draw_height) or x1>=x2):
+            continue
+        d=x1-x
+        copy_row(draw_buf,int(RW[yy])+int(CW[x1]),int(CP[x1]),buf,o+d//10,d%10,x2-x1)
+
+def read_rect(x,y,w,h,buf):
+    # Copies the w*h pixels from (x,y) into buf : a bytearray of at least w*h bytes gets one
+    # color per byte, anything else (array('L') of packed_size(w,h) words) packed pixels
+    if w<=0 or h<=0:
+        return buf
+    if isinstance(buf,bytearray):
+        if len(buf)<w*h:
+            raise ValueError("buffer too small")
+        read_pixels(x,y,w,h,buf)
+    else:
+        if len(buf)<packed_size(w,h):
+            raise ValueError("buffer too small")
+        read_packed(x,y,w,h,buf)
+    return buf
+
+# Sprites : images stored as packed pixels, drawn by blit a whole word at a time (copy_row)
+
+class Sprite:
+    # width*height pixels stored as packed pixels in data (array('L'), see packed_size)
+    # mask, optional, leaves pixels transparent : one bit per pixel (1 = drawn) in an array('H')
+    # lined up with data, bit i of mask[k] being the pixel i of the word data[k]
+    def __init__(self,width,height,data=None,mask=None):
+        self.width=width
+        self.height=height
+        self.stride=(width+pix_per_words-1)//pix_per_words
+        self.base=0     # word of the first pixel (-1 for the screen, see build_tables)
+        size=self.stride*height
+        if data is None:
+            data=array('L',range(size))
+            clear_buffer(data)
+        if len(data)<size or (mask is not None and len(mask)<size):
+            raise ValueError("buffer too small")
+        self.data=data
+        self.mask=mask
+
+    def set_pixels(self,pixels,transparent=-1):
+        # Packs one color per byte (row after row) - the pixels of color transparent, if any,
+        # get a mask
+        mask=None
+        if transparent>=0:
+            mask=array('H',range(len(self.data)))
+        for j in range(self.height):
+            for k in range(self.stride):
+                word=0
+                bits=0
+                for i in range(min(pix_per_words,self.width-k*pix_per_words)):
+                    c=pixels[j*self.width+k*pix_per_words+i]
+                    if c!=transparent:
+                        word|=c<<(bit_per_pix*i)
+                        bits|=1<<i
+                self.data[j*self.stride+k]=word
+                if mask is not None:
+                    mask[j*self.stride+k]=bits
+        self.mask=mask
+
+    def grab(self,x,y,src=None):
+        # Copies the pixels at (x,y) of the canvas src (by default the selected one, usually the
+        # screen) into the sprite, e.g. to restore them later with blit
+        if src is None or src is target:
+            read_packed(x,y,self.width,self.height,self.data)
+        else:
+            previous=target
+            select(src)
+            read_packed(x,y,self.width,self.height,self.data)
+            select(previous)
+
+@micropython.viper
+def copy_row_masked(src,mask,sw:int,sp:int,dst,dw:int,dp:int,n:int):
+    # copy_row leaving out the pixels whose bit is 0 in mask (array('H') lined up with src)
+    S=ptr32(src)
+    M=ptr16(mask)
+    D=ptr32(dst)
+    LM=ptr32(left_mask)
+    RM=ptr32(right_mask)
+    EX=ptr32(mask_expand)
+    dlast=int(len(dst))-1
+    while n>0:
+        cnt=10-dp
+        if cnt>n:cnt=n
+        v=(int(S[sw])&0x3FFFFFFF)>>(3*sp)
+        b=(int(M[sw])&0x3FF)>>sp
+        if sp+cnt>10:
+            v|=(int(S[sw+1])<<(30-3*sp))&0x3FFFFFFF
+            b|=(int(M[sw+1])<<(10-sp))&0x3FF
+        m=int(LM[dp])&int(RM[dp+cnt])&((int(EX[b&31])|(int(EX[b>>5])<<15))<<(3*dp))
+        k=dw
+        if k<0:k=dlast
+        D[k]=(D[k]&(m^0x3FFFFFFF))|((v<<(3*dp))&m)
+        n-=cnt
+        dw+=1
+        dp=0
+        sp+=cnt
+        if sp>=10:
+            sp-=10
+            sw+=1
+
+@micropython.viper
+def blit(sprite,x:int,y:int):
+    # Draws the sprite (or canvas) with its top left corner at (x,y) : each row is shifted into
+    # place and merged a word at a time (7 words for a 64 pixel wide sprite), inside the clip
+    # rectangle
+    w=int(sprite.width)
+    h=int(sprite.height)
+    stride=int(sprite.stride)
+    data=sprite.data
+    mask=sprite.mask
+    C=ptr16(clip_rect)
+    x1=x
+    if x1<int(C[0]):x1=int(C[0])
+    x2=x+w
+    if x2>int(C[2]):x2=int(C[2])
+    y1=y
+    if y1<int(C[1]):y1=int(C[1])
+    y2=y+h
+    if y2>int(C[3]):y2=int(C[3])
+    if (x1>=x2 or y1>=y2):
+        return
+    RW=ptr32(row_word)
+    dw=int(ptr8(col_word)[x1])
+    dp=int(ptr8(col_pix)[x1])
+    # first visible column and row of the sprite
+    d=x1-x
+    sw=int(sprite.base)+(y1-y)*stride+d//10
+    sp=d%10
+    n=x2-x1
+    while y1<y2:
+        if mask is None:
+            copy_row(data,sw,sp,draw_buf,int(RW[y1])+dw,dp,n)
+        else:
+            copy_row_masked(data,mask,sw,sp,draw_buf,int(RW[y1])+dw,dp,n)
+        sw+=stride
+        y1+=1
+
+# Canvases : every primitive draws into the selected canvas, the screen being the canvas of the
+# frame buffer (created by init). A canvas is packed like a sprite : it is copied into another
+# canvas or on the screen with blit, and filled from one with grab.
 
+class Canvas(Sprite):
+    # width (up to H_res) * height pixels, with their own row table and clip rectangle
+    def __init__(self,width,height,data=None,rows=None):
+        if width>H_res:
+            raise ValueError("canvas wider than the screen")
+        super().__init__(width,height,data)
+        if rows is None:
+            rows=array('l',range(0,height*self.stride,self.stride))
+        self.rows=rows
+        self.base=rows[0] if height else 0
+        self.clip=array('h',[0,0,width,height])
+
+    def select(self):
+        select(self)
+
+def select(canvas):
+    # Makes canvas the target of all the drawing primitives (select(screen) to draw on screen)
+    global target,draw_buf,draw_stride,draw_width,draw_height,row_word,clip_rect
+    target=canvas
+    draw_buf=canvas.data
+    draw_stride=canvas.stride
+    draw_width=canvas.width
+    draw_height=canvas.height
+    row_word=canvas.rows
+    clip_rect=canvas.clip
 
-# Builfing the Data array buffer
-collect()
-a0=mem_free()
-# Initiate the buffer - an array of consecutive 32bit words containing ALL the visible pixels
-H_buffer_line = array('L')
 # Number of required 32bit words
 visible_pix=int((H_res)*V_res*bit_per_pix/usable_bits)
-# Creating an array with all the 32b words set to zero
-for k in range(visible_pix):
-    H_buffer_line.append(0)
-# We need an array containing the adress of the buffer for the DMA chan0 to read the values
-H_buffer_line_address=array('L',[addressof(H_buffer_line)])
-# a few information on what we just built
-a1=mem_free()
-print("mem used by buffer array (kB):\t"+str(round((a0-a1)/1024,3)))
-print("Number of 32b words:\t\t"+str(visible_pix))
-print("Number of bits (total):\t\t"+str(32*visible_pix))
-print("Number of bits (usable):\t"+str(usable_bits*visible_pix))
-collect()
-a0=mem_free()
-print("\nremaining RAM (kB):\t"+str(round(a0/1024,3)))
 
+@micropython.viper
+def clear_buffer(buf):
+    Data=ptr32(buf)
+    n=int(len(buf))
+    i=0
+    while i < n:
+        Data[i]=0
+        i+=1
+
+def alloc_buffer(buf=None):
+    # Returns the buffer - an array of consecutive 32bit words containing ALL the visible pixels
+    # The array is allocated in one step at its final size : array() knows the length of a range
+    # so no reallocation happens (appending the words one by one made the array grow step by step,
+    # which was slow and could fragment the heap before the 120k block was found)
+    # An array('L') of visible_pix words already owned by the caller can be reused instead
+    if buf is None:
+        buf = array('L', range(visible_pix))
+    elif len(buf) != visible_pix:
+        raise ValueError("buffer must hold "+str(visible_pix)+" 32b words")
+    clear_buffer(buf)
+    return buf
 
 # 3 bit color names
 RED     = 0b001
@@ -366,30 +1515,1133 @@ WHITE   = 0b111
 CYAN    = 0b110
 MAGENTA = 0b101
 
-# Configure the DMAs
-configure_DMAs(len(H_buffer_line),H_buffer_line_address)
-# Start the PIO Statemchines and the DMA Channels
-startsync()
-
-# Drawing a simple 8 color checker
-for h in range(8):
-    for i in range(0,60):
-        for k in range(8):
-            col=(h+k)%8
-            draw_fastHline(k*80,k*80+80,h*60+i,col)
-
-
-# Drawing Various figures
-fill_rect(20,20,150,150,BLACK)
-fill_rect(20,200,150,400,BLUE)
-fill_rect(200,205,205,150,WHITE)
-fill_rect(300,415,350,300,YELLOW)
-fill_rect(550,450,640,150,CYAN)
-draw_circle(100,400,75,YELLOW)
-draw_circle(150,150,98,CYAN)
-fill_disk(320,240,150,BLACK)
-fill_disk(320,240,120,RED)
-fill_disk(320,240,80,GREEN)
-fill_disk(320,240,50,WHITE)
-draw_rect(500,50,620,70,BLACK)
-draw_rect(100,390,600,480,RED)
+# Default text color
+text_color = WHITE
+
+# Bundled fonts, selected by number with setfont(1), setfont(2)... (modules written by fontconv.py)
+FONTS = ("FreeMono9pt7b", "FreeSansSerif7pt7b", "FreeMono12pt7b")
+font = None
+font_id = 0         # index of font in glyph_fonts, part of the glyph cache keys
+glyph_fonts = []
+font_advances = []  # x advance of each character of the fonts of glyph_fonts (bytes)
+font_ascents = []   # height of their tallest glyph above the baseline
+advances = None     # of the current font
+ascent = 0
+
+# Text alignments in draw_text_box
+ALIGN_LEFT=const(0)
+ALIGN_CENTER=const(1)
+ALIGN_RIGHT=const(2)
+
+class Cache:
+    # Values kept within a budget of size bytes, the ones not used for the longest time evicted
+    # first with the clock algorithm (like the glyph slots of FontFile) : a hit only sets the
+    # reference bit of the entry, an eviction moves the hand along the ring of keys, clearing the
+    # bits, up to an entry not used since the hand last passed it (or since it was cached)
+    def __init__(self,size):
+        self.size=size
+        self.used=0
+        self.entries={}     # key -> [reference bit, index in ring, bytes, value]
+        self.ring=[]        # keys, None for the places freed (reused first, see free)
+        self.free=[]
+        self.hand=0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self,key):
+        # Value of key, None if it is not cached
+        e=self.entries.get(key)
+        if e is None:
+            return None
+        e[0]=1
+        return e[3]
+
+    def put(self,key,value,size):
+        # Caches value (of size bytes), evicting entries - False if it is larger than the budget
+        if not self.make_room(size):
+            return False
+        if self.free:
+            i=self.free.pop()
+            self.ring[i]=key
+        else:
+            i=len(self.ring)
+            self.ring.append(key)
+        self.entries[key]=[0,i,size,value]
+        self.used+=size
+        return True
+
+    def make_room(self,size):
+        # Evicts entries until size bytes fit in the budget - False if they never will
+        if size>self.size:
+            return False
+        while self.used+size>self.size:
+            self.evict()
+        return True
+
+    def evict(self):
+        ring=self.ring
+        while 1:
+            key=ring[self.hand]
+            self.hand+=1
+            if self.hand==len(ring):
+                self.hand=0
+            if key is not None:
+                e=self.entries[key]
+                if not e[0]:
+                    self.remove(key)
+                    return
+                e[0]=0
+
+    def remove(self,key):
+        e=self.entries.pop(key)
+        self.ring[e[1]]=None
+        self.free.append(e[1])
+        self.used-=e[2]
+        return e[3]
+
+    def keys(self):
+        return list(self.entries)
+
+    def clear(self,size=None):
+        # Empties the cache, with a new budget if size is given
+        if size is not None:
+            self.size=size
+        self.used=0
+        self.entries.clear()
+        self.ring=[]
+        self.free=[]
+        self.hand=0
+
+# Glyph cache : the word masks of a glyph only depend on its color and on the position of its
+# left edge within a word (x mod 10), so drawchar keeps them pre-shifted, keyed by font, char,
+# color and x mod 10, within a budget of 4096 bytes (see set_glyph_cache). glyph_hits and
+# glyph_misses count the lookups to size it.
+glyph_cache = Cache(4096)   # key -> (words per row, array('L') of mask, color word pairs)
+glyph_hits = 0
+glyph_misses = 0
+
+# Label cache : texts rendered by render_label, keyed by text, font and color, within a budget
+# of 4096 bytes of sprite data and mask (see set_label_cache)
+label_cache = Cache(4096)   # (text, font, color) -> label
+
+# Font file written by fontconv.py --binary : a 9 bytes header (b"VGAF", first, last, char_width,
+# char_height, line_spacing), the glyph table (same 7 bytes per glyph as the font modules) then
+# the glyph bitmaps, the offsets of the glyph table counting from the first bitmap byte
+FONT_MAGIC = b"VGAF"
+FONT_HEADER = const(9)
+font_files = {}     # path -> FontFile opened for it, reused by setfont(path)
+
+class FontFile:
+    # Font read from a font file : only the header and the glyph table stay in RAM, the glyph
+    # bitmaps are read when drawn into a cache of at most cache bytes (whole glyphs, evicted
+    # with the clock algorithm), so large fonts can be used with a fixed RAM budget
+    # The file stays open until close(), which also forgets the font (see release_font)
+    def __init__(self,path,cache=512):
+        f=open(path,"rb")
+        head=f.read(FONT_HEADER)
+        if len(head)<FONT_HEADER or head[:4]!=FONT_MAGIC:
+            f.close()
+            raise ValueError("not a font file")
+        self.first=head[4]
+        self.last=head[5]
+        self.char_width=head[6]
+        self.char_height=head[7]
+        self.line_spacing=head[8]
+        n=self.last-self.first+1
+        self.glyphs=f.read(7*n)
+        self.start=FONT_HEADER+7*n
+        g=self.glyphs
+        size=1
+        for k in range(0,7*n,7):
+            size=max(size,(g[k+2]*g[k+3]+7)//8)
+        self.slot_size=size
+        slots=max(1,min(cache//size,n))
+        self.bitmaps=bytearray(slots*size)
+        self.slot=array('H',bytes(2*n))         # glyph -> slot+1 (0 : not loaded)
+        self.owner=array('H',bytes(2*slots))    # slot -> glyph+1
+        self.used=bytearray(slots)      # clock reference bits
+        self.hand=0
+        view=memoryview(self.bitmaps)
+        self.views=[view[i*size:(i+1)*size] for i in range(slots)]
+        self.file=f
+        self.path=path
+        if path not in font_files:
+            font_files[path]=self
+
+    def load(self,k):
+        # Offset in self.bitmaps of the bitmap of glyph k (k : index in glyphs, 7 per glyph),
+        # read from the file if it is not cached - valid until the next load
+        i=k//7
+        s=self.slot[i]
+        if s:
+            self.used[s-1]=1
+            return (s-1)*self.slot_size
+        used=self.used
+        s=self.hand
+        while used[s]:
+            used[s]=0
+            s+=1
+            if s==len(used):
+                s=0
+        self.hand=s+1 if s+1<len(used) else 0
+        if self.owner[s]:
+            self.slot[self.owner[s]-1]=0
+        self.owner[s]=i+1
+        self.slot[i]=s+1
+        used[s]=1
+        g=self.glyphs
+        self.file.seek(self.start+(g[k]|(g[k+1]<<8)))
+        self.file.readinto(self.views[s])
+        return s*self.slot_size
+
+    def close(self):
+        self.file.close()
+        release_font(self)
+
+def glyph_bitmap(f,k):
+    # Offset in f.bitmaps of the bitmap of the glyph k (index in f.glyphs) of the font f
+    if type(f) is FontFile:
+        return f.load(k)
+    g=f.glyphs
+    return g[k]|(g[k+1]<<8)
+
+def load_font(f):
+    # Font object of f (see setfont) - a font file is opened once, then its FontFile is reused
+    if isinstance(f,int):
+        return __import__(FONTS[f-1])
+    if isinstance(f,str):
+        ff=font_files.get(f)
+        return FontFile(f) if ff is None else ff
+    return f
+
+def release_font(f):
+    # Forgets the font f : its path in font_files, its glyphs in the glyph and label caches and
+    # its entry of glyph_fonts (reused by the next font set) - f must not be the current font
+    if font_files.get(getattr(f,"path",None)) is f:
+        del font_files[f.path]
+    for i in range(len(glyph_fonts)):
+        if glyph_fonts[i] is f:
+            break
+    else:
+        return
+    glyph_fonts[i]=None
+    for key in glyph_cache.keys():
+        if key//(8*pix_per_words)>>8==i:
+            glyph_cache.remove(key)
+    for key in label_cache.keys():
+        if key[1] is f:
+            label_cache.remove(key)
+
+def setfont(f):
+    # f : number of a bundled font, font module written by fontconv.py, FontFile or path of a
+    # font file (opened on the first use, see load_font)
+    global font,font_id,advances,ascent,Char_height,Char_width,Line_Spacing
+    f=load_font(f)
+    font=f
+    for i in range(len(glyph_fonts)):
+        if glyph_fonts[i] is f:
+            break
+    else:
+        g=f.glyphs
+        adv=bytes(g[k+4] for k in range(0,len(g),7))
+        asc=max(0,max(-((g[k+6]^0x80)-0x80) for k in range(0,len(g),7)))
+        if None in glyph_fonts:
+            i=glyph_fonts.index(None)
+            glyph_fonts[i]=f
+            font_advances[i]=adv
+            font_ascents[i]=asc
+        else:
+            i=len(glyph_fonts)
+            glyph_fonts.append(f)
+            font_advances.append(adv)
+            font_ascents.append(asc)
+    font_id=i
+    advances=font_advances[i]
+    ascent=font_ascents[i]
+    Char_height=f.char_height
+    Char_width=f.char_width
+    Line_Spacing=f.line_spacing
+
+def settextcursor(x,y):
+    global x_cursor,y_cursor
+    x_cursor = x
+    y_cursor = y
+
+def settextcolor(color):
+    global text_color
+    text_color = color
+
+def printh(mess):
+    global x_cursor,y_cursor
+    for i in mess:
+        if i=="\n":
+            x_cursor=0
+            y_cursor = y_cursor+Char_height+Line_Spacing
+        else:
+            drawchar(i)
+            if x_cursor>(draw_width-1):
+                x_cursor=0
+                y_cursor = y_cursor+Char_height+Line_Spacing
+
+
+@micropython.viper
+def draw_glyph(bits,index:int,w:int,h:int,x:int,y:int,col:int):
+    # Draws the w*h glyph whose bitmap (1 bit per pixel, rows not padded, msb first) starts at
+    # bits[index] with its top left corner at (x,y) : each row is decoded into runs of set pixels,
+    # each run written as a span, one read-modify-write per word
+    if w<=0:
+        return
+    B=ptr8(bits)
+    C=ptr16(clip_rect)
+    Data=ptr32(draw_buf)
+    CW=ptr8(col_word)
+    CP=ptr8(col_pix)
+    LM=ptr32(left_mask)
+    RM=ptr32(right_mask)
+    RW=ptr32(row_word)
+    cx1=int(C[0])
+    cy1=int(C[1])
+    cx2=int(C[2])
+    cy2=int(C[3])
+    last=int(len(draw_buf))-1
+    colw=int(ptr32(color_word)[col])
+    j=0
+    if y<cy1:j=cy1-y
+    if y+h>cy2:h=cy2-y
+    while j<h:
+        yy=y+j
+        # row j starts at bit j*w
+        p=j*w
+        ix=index+(p>>3)
+        a=B[ix]
+        ix+=1
+        m=0x80>>(p&7)
+        row=int(RW[yy])
+        i=0
+        while i<w:
+            if m==0:
+                a=B[ix]
+                ix+=1
+                m=0x80
+            if (a&m)==0:
+                m>>=1
+                i+=1
+                continue
+            # run of set pixels from i to i2 excluded
+            i2=i
+            while i2<w:
+                if m==0:
+                    a=B[ix]
+                    ix+=1
+                    m=0x80
+                if (a&m)==0:
+                    break
+                m>>=1
+                i2+=1
+            x1=x+i
+            x2=x+i2
+            i=i2
+            if x1<cx1:x1=cx1
+            if x2>cx2:x2=cx2
+            if x1>=x2:
+                continue
+            k1=row+CW[x1]
+            k2=row+CW[x2]
+            mask1=int(LM[CP[x1]])
+            mask2=int(RM[CP[x2]])
+            if k2==k1:
+                if k1<0:k1=last
+                mask1&=mask2
+                Data[k1]=(Data[k1]&(mask1^0x3FFFFFFF))|(colw&mask1)
+                continue
+            k=k1+1
+            if k1<0:k1=last
+            Data[k1]=(Data[k1]&(mask1^0x3FFFFFFF))|(colw&mask1)
+            if mask2:
+                Data[k2]=(Data[k2]&(mask2^0x3FFFFFFF))|(colw&mask2)
+            while k<k2:
+                Data[k]=colw
+                k+=1
+        j+=1
+
+@micropython.viper
+def pack_glyph(bits,index:int,w:int,h:int,p:int,col:int,out):
+    # Fills out with the glyph (see draw_glyph) starting at pixel p of a word, as rows of
+    # (p+w+9)//10 (mask, color word) pairs
+    B=ptr8(bits)
+    O=ptr32(out)
+    colw=int(ptr32(color_word)[col])
+    nw=(p+w+9)//10
+    n=0
+    j=0
+    while j<h:
+        i=0
+        while i<nw:
+            O[n+2*i]=0
+            i+=1
+        i=0
+        while i<w:
+            b=j*w+i
+            if int(B[index+(b>>3)])&(0x80>>(b&7)):
+                q=p+i
+                O[n+2*(q//10)]=int(O[n+2*(q//10)])|(7<<(3*(q%10)))
+            i+=1
+        i=0
+        while i<nw:
+            O[n+1]=int(O[n])&colw
+            n+=2
+            i+=1
+        j+=1
+
+@micropython.viper
+def draw_packed_glyph(words,nw:int,h:int,x:int,y:int):
+    # Draws a glyph packed by pack_glyph for the phase x%10, x being inside the clip rectangle
+    # as well as its nw words of each row
+    E=ptr32(words)
+    C=ptr16(clip_rect)
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    last=int(len(draw_buf))-1
+    col=int(ptr8(col_word)[x])
+    j=0
+    if y<int(C[1]):j=int(C[1])-y
+    if y+h>int(C[3]):h=int(C[3])-y
+    n=j*nw*2
+    while j<h:
+        k=int(RW[y+j])+col
+        i=0
+        while i<nw:
+            m=E[n]
+            if m:
+                if k<0:
+                    Data[last]=(Data[last]&(m^0x3FFFFFFF))|E[n+1]
+                else:
+                    Data[k]=(Data[k]&(m^0x3FFFFFFF))|E[n+1]
+            k+=1
+            n+=2
+            i+=1
+        j+=1
+
+def set_glyph_cache(size):
+    # Byte budget of the glyph cache (0 disables it) - empties it and resets the counters
+    global glyph_hits,glyph_misses
+    glyph_cache.clear(size)
+    glyph_hits=0
+    glyph_misses=0
+
+def cache_glyph(key,f,k,p):
+    # Packs the glyph k of font f for the phase p and the text color into the cache - None if
+    # it does not fit in the budget
+    g=f.glyphs
+    w=g[k+2]
+    h=g[k+3]
+    nw=(p+w+9)//10
+    size=8*nw*h
+    if not glyph_cache.make_room(size):
+        return None
+    words=array('L',range(2*nw*h))
+    pack_glyph(f.bitmaps,glyph_bitmap(f,k),w,h,p,text_color,words)
+    entry=(nw,words)
+    glyph_cache.put(key,entry,size)
+    return entry
+
+def print_at(x,y,mess,col):
+    # printh at (x,y) in color col, the text cursor and color being left unchanged
+    global x_cursor,y_cursor,text_color
+    saved=(x_cursor,y_cursor,text_color)
+    x_cursor=x
+    y_cursor=y
+    text_color=col
+    printh(mess)
+    x_cursor,y_cursor,text_color=saved
+
+def drawchar(text):
+    global x_cursor,glyph_hits,glyph_misses
+    c=ord(text)
+    f=font
+    if c<f.first or c>f.last:
+        return
+    g=f.glyphs
+    k=(c-f.first)*7
+    w=g[k+2]
+    h=g[k+3]
+    x=x_cursor+((g[k+5]^0x80)-0x80)
+    y=y_cursor+((g[k+6]^0x80)-0x80)
+    x_cursor+=g[k+4]
+    if w==0 or h==0:
+        return
+    entry=None
+    if glyph_cache.size and x>=clip_rect[0] and x+w<=clip_rect[2]:
+        p=x%pix_per_words
+        key=(((font_id<<8)|c)*8+text_color)*pix_per_words+p
+        entry=glyph_cache.get(key)
+        if entry is None:
+            glyph_misses+=1
+            entry=cache_glyph(key,f,k,p)
+        else:
+            glyph_hits+=1
+    if entry is None:
+        draw_glyph(f.bitmaps,glyph_bitmap(f,k),w,h,x,y,text_color)
+        return
+    draw_packed_glyph(entry[1],entry[0],h,x,y)
+
+
+def text_width(text):
+    # Width in pixels of text printed with the current font (of its longest line)
+    first=font.first
+    n=len(advances)
+    width=0
+    line=0
+    for ch in text:
+        if ch=="\n":
+            width=max(width,line)
+            line=0
+            continue
+        c=ord(ch)-first
+        if 0<=c<n:
+            line+=advances[c]
+    return max(width,line)
+
+def draw_text_box(text,x,y,w,h,align=ALIGN_LEFT,wrap=True):
+    # Prints text in the box (x,y)-(x+w,y+h) excluded : lines broken at the "\n", and if wrap
+    # between words (or within a word longer than w), aligned to the left, center or right.
+    # Lines below the box are not laid out and glyphs outside of it are skipped, the others
+    # being clipped to it. Returns the index of the first character that did not fit.
+    global x_cursor,y_cursor
+    first=font.first
+    n_adv=len(advances)
+    g=font.glyphs
+    C=get_clip()
+    x1=max(x,C[0])
+    y1=max(y,C[1])
+    set_clip(x1,y1,max(min(x+w,C[2]),x1),max(min(y+h,C[3]),y1))
+    bx1=clip_rect[0]
+    bx2=clip_rect[2]
+    cursor=(x_cursor,y_cursor)
+    pitch=Char_height+Line_Spacing
+    base=y+ascent
+    n=len(text)
+    i=0
+    while i<n and base-ascent+Char_height<=y+h:
+        # line from i to j excluded, lw pixels wide
+        j=i
+        lw=0
+        brk=-1
+        brkw=0
+        while j<n:
+            ch=text[j]
+            if ch=="\n":
+                break
+            c=ord(ch)-first
+            adv=advances[c] if 0<=c<n_adv else 0
+            if wrap and lw+adv>w and j>i:
+                if ch!=" " and brk>i:
+                    j=brk
+                    lw=brkw
+                break
+            if ch==" ":
+                brk=j
+                brkw=lw
+            lw+=adv
+            j+=1
+        x_cursor=x
+        if align==ALIGN_CENTER:
+            x_cursor+=(w-lw)//2
+        elif align==ALIGN_RIGHT:
+            x_cursor+=w-lw
+        y_cursor=base
+        for k in range(i,j):
+            c=ord(text[k])-first
+            if 0<=c<n_adv:
+                m=7*c
+                gx=x_cursor+((g[m+5]^0x80)-0x80)
+                if gx<bx2 and gx+g[m+2]>bx1:
+                    drawchar(text[k])
+                else:
+                    x_cursor+=advances[c]
+        i=j
+        if j<n and (text[j]=="\n" or text[j]==" "):
+            i=j+1
+        base+=pitch
+    x_cursor,y_cursor=cursor
+    set_clip(*C)
+    return i
+
+class Label(Sprite):
+    # Text rendered by render_label : transparent sprite whose top left corner is at (dx,dy)
+    # from the text cursor, so blit(label,x+label.dx,y+label.dy) draws like printh at (x,y)
+    def __init__(self,text,width,height,dx,dy,data=None,mask=None):
+        super().__init__(width,height,data,mask)
+        self.text=text
+        self.dx=dx
+        self.dy=dy
+
+    def draw(self,x,y):
+        # Draws the label at the text cursor position (x,y)
+        blit(self,x+self.dx,y+self.dy)
+
+@micropython.viper
+def mask_pixels(data,mask,col:int):
+    # Turns the pixels drawn (non zero) in data into a mask, and paints them in color col
+    D=ptr32(data)
+    M=ptr16(mask)
+    colw=int(ptr32(color_word)[col])
+    n=int(len(data))
+    k=0
+    while k<n:
+        w=int(D[k])
+        bits=0
+        i=0
+        while i<10:
+            if (w>>(3*i))&7:
+                bits|=1<<i
+            i+=1
+        M[k]=bits
+        D[k]=w&colw
+        k+=1
+
+def render_label(text,f=None,color=None):
+    # Label (blittable sprite) of the text in the font f and color (default : the current font
+    # and text color), rendered once and kept in the label cache while it is used
+    # The current font is left unchanged
+    if color is None:
+        color=text_color
+    f=font if f is None else load_font(f)
+    key=(text,f,color)
+    label=label_cache.get(key)
+    if label is None:
+        label=make_label(text,f,color)
+        label_cache.put(key,label,4*len(label.data)+2*len(label.mask))
+    return label
+
+def make_label(text,f,color):
+    # Measures the text, then draws its glyphs into the label data and masks them. The glyphs
+    # are drawn through canvases of at most H_res pixels (the width of the column tables) over
+    # the data, side by side, so a label may be wider than the screen
+    g=f.glyphs
+    cx=0
+    x1=y1=0x7FFF
+    x2=y2=-0x7FFF
+    for ch in text:
+        c=ord(ch)
+        if c<f.first or c>f.last:
+            continue
+        k=(c-f.first)*7
+        if g[k+2] and g[k+3]:
+            dx=cx+((g[k+5]^0x80)-0x80)
+            dy=(g[k+6]^0x80)-0x80
+            x1=min(x1,dx)
+            x2=max(x2,dx+g[k+2])
+            y1=min(y1,dy)
+            y2=max(y2,dy+g[k+3])
+        cx+=g[k+4]
+    if x1>x2:
+        # nothing drawn : blank label of the size of the text
+        x1,x2,y1,y2=0,max(cx,1),-1,0
+    x1=min(x1,0)
+    x2=max(x2,cx)
+    label=Sprite(x2-x1,y2-y1)
+    previous=target if target is not None else screen
+    for x0 in range(0,label.width,H_res):
+        w=min(H_res,label.width-x0)
+        rows=array('l',range(x0//pix_per_words,label.height*label.stride,label.stride))
+        strip=Canvas(w,label.height,label.data,rows)
+        strip.stride=label.stride
+        select(strip)
+        cx=-x1-x0
+        for ch in text:
+            c=ord(ch)
+            if c<f.first or c>f.last:
+                continue
+            k=(c-f.first)*7
+            dx=cx+((g[k+5]^0x80)-0x80)
+            if g[k+2] and g[k+3] and dx<w and dx+g[k+2]>0:
+                draw_glyph(f.bitmaps,glyph_bitmap(f,k),g[k+2],g[k+3],dx,
+                           ((g[k+6]^0x80)-0x80)-y1,WHITE)
+            cx+=g[k+4]
+    if previous is not None:
+        select(previous)
+    mask=array('H',range(len(label.data)))
+    mask_pixels(label.data,mask,color)
+    return Label(text,label.width,label.height,x1,y1,label.data,mask)
+
+def set_label_cache(size):
+    # Byte budget of the label cache (0 : labels are rendered at each call) - empties it
+    label_cache.clear(size)
+
+
+class Console:
+    # Character cell terminal in the box (x,y) w*h (default : the rest of the target) with the
+    # current font : a grid of characters and attributes (text color | background color<<3)
+    # where only the cells that change are redrawn, a line feed on the last line scrolling the
+    # pixels up by one cell. write() understands \n, \r, \b, \t and a few VT100 escape
+    # sequences : ESC[<row>;<col>H (or f), ESC[<n>A/B/C/D, ESC[<n>J, ESC[<n>K, ESC[<n>;...m
+    # (0 reset, 30-37 and 39 text color, 40-47 and 49 background - ANSI and VGA.py colors match)
+    def __init__(self,x=0,y=0,w=None,h=None,fg=WHITE,bg=BLACK):
+        if font is None:
+            raise ValueError("no font selected")
+        g=font.glyphs
+        self.font=font
+        self.ascent=ascent
+        descent=max(0,max(((g[k+6]^0x80)-0x80)+g[k+3] for k in range(0,len(g),7)))
+        self.cell_w=max(Char_width,max(advances))
+        self.cell_h=max(Char_height+Line_Spacing,ascent+descent)
+        if w is None:
+            w=draw_width-x
+        if h is None:
+            h=draw_height-y
+        self.x=x
+        self.y=y
+        self.cols=max(1,w//self.cell_w)
+        self.rows=max(1,h//self.cell_h)
+        self.default=fg|(bg<<3)
+        self.attr=self.default
+        n=self.cols*self.rows
+        self.chars=bytearray(b" ")*n
+        self.attrs=bytearray(n)
+        self.top=0          # row of the grid shown on the first line (the grid is a ring)
+        self.col=0
+        self.row=0
+        self.cursor=True
+        self.shown=-1       # cell under the cursor drawn on screen
+        self.state=0        # escape sequences : 0 text, 1 after ESC, 2 after ESC[
+        self.params=[]
+        self.clear()
+
+    def cell(self,c,r):
+        return ((self.top+r)%self.rows)*self.cols+c
+
+    def draw_cell(self,c,r):
+        global x_cursor,y_cursor,text_color
+        i=self.cell(c,r)
+        a=self.attrs[i]
+        px=self.x+c*self.cell_w
+        py=self.y+r*self.cell_h
+        fill_rect(px,py,px+self.cell_w,py+self.cell_h,a>>3)
+        if self.chars[i]!=32:
+            x_cursor=px
+            y_cursor=py+self.ascent
+            text_color=a&7
+            drawchar(chr(self.chars[i]))
+
+    def put(self,ch,c,r):
+        # Sets the cell (c,r), redrawn only if it changes
+        i=self.cell(c,r)
+        code=ord(ch)
+        if code>255:
+            code=63
+        if self.chars[i]!=code or self.attrs[i]!=self.attr:
+            self.chars[i]=code
+            self.attrs[i]=self.attr
+            self.draw_cell(c,r)
+            if i==self.shown:
+                self.shown=-1
+
+    def erase(self,c1,r1,c2,r2):
+        # Blanks the cells from (c1,r1) to (c2,r2) included, in reading order
+        while r1<r2 or (r1==r2 and c1<=c2):
+            self.put(" ",c1,r1)
+            c1+=1
+            if c1==self.cols:
+                c1=0
+                r1+=1
+
+    def clear(self):
+        # Blank grid in the current colors, cursor home
+        for i in range(len(self.chars)):
+            self.chars[i]=32
+            self.attrs[i]=self.attr
+        self.top=0
+        self.col=0
+        self.row=0
+        self.shown=-1
+        self.run(fill_rect,self.x,self.y,self.x+self.cols*self.cell_w,
+                 self.y+self.rows*self.cell_h,self.attr>>3)
+
+    def redraw(self):
+        # Draws every cell again (e.g. after the screen was overwritten)
+        self.shown=-1
+        self.run(self.draw_all)
+
+    def draw_all(self):
+        for r in range(self.rows):
+            for c in range(self.cols):
+                self.draw_cell(c,r)
+        self.show_cursor()
+
+    def show_cursor(self):
+        # Underlines the cell of the cursor in its text color
+        if self.cursor:
+            c=min(self.col,self.cols-1)
+            self.shown=self.cell(c,self.row)
+            px=self.x+c*self.cell_w
+            draw_fastHline(px,px+self.cell_w,self.y+(self.row+1)*self.cell_h-1,
+                           self.attrs[self.shown]&7)
+
+    def newline(self):
+        self.col=0
+        if self.row<self.rows-1:
+            self.row+=1
+            return
+        # scroll : the pixels move up by one cell, the grid rotates by one row
+        scroll(self.x,self.y,self.x+self.cols*self.cell_w,self.y+self.rows*self.cell_h,
+               self.cell_h,self.attr>>3)
+        self.shown=-1
+        self.top=(self.top+1)%self.rows
+        i=self.cell(0,self.rows-1)
+        for k in range(i,i+self.cols):
+            self.chars[k]=32
+            self.attrs[k]=self.attr
+
+    def run(self,fn,*args):
+        # Calls fn in the font and clip of the console, the text cursor and color left unchanged
+        global x_cursor,y_cursor,text_color
+        previous=font
+        if previous is not self.font:
+            setfont(self.font)
+        saved=(x_cursor,y_cursor,text_color)
+        clip=get_clip()
+        set_clip(max(self.x,clip[0]),max(self.y,clip[1]),
+                 max(min(self.x+self.cols*self.cell_w,clip[2]),self.x),
+                 max(min(self.y+self.rows*self.cell_h,clip[3]),self.y))
+        try:
+            fn(*args)
+        finally:
+            set_clip(*clip)
+            x_cursor,y_cursor,text_color=saved
+            if previous is not self.font and previous is not None:
+                setfont(previous)
+
+    def write(self,text):
+        self.run(self.feed,text)
+
+    def feed(self,text):
+        if self.shown>=0:
+            # erases the cursor
+            i=self.shown
+            self.shown=-1
+            r=(i//self.cols-self.top)%self.rows
+            self.draw_cell(i%self.cols,r)
+        for ch in text:
+            if self.state==1:
+                if ch=="[":
+                    self.state=2
+                    self.params=[0]
+                else:
+                    self.state=0
+            elif self.state==2:
+                if "0"<=ch<="9":
+                    self.params[-1]=self.params[-1]*10+ord(ch)-48
+                elif ch==";":
+                    self.params.append(0)
+                else:
+                    self.state=0
+                    self.escape(ch,self.params)
+            elif ch=="\x1b":
+                self.state=1
+            elif ch=="\n":
+                self.newline()
+            elif ch=="\r":
+                self.col=0
+            elif ch=="\b":
+                if self.col>0:
+                    self.col-=1
+            elif ch=="\t":
+                self.col=min((self.col//8+1)*8,self.cols-1)
+            elif ch>=" ":
+                if self.col>=self.cols:
+                    self.newline()
+                self.put(ch,self.col,self.row)
+                self.col+=1
+        self.show_cursor()
+
+    def escape(self,cmd,p):
+        n=max(p[0],1)
+        if cmd=="m":
+            for v in p:
+                if v==0:
+                    self.attr=self.default
+                elif 30<=v<=37:
+                    self.attr=(self.attr&0x38)|(v-30)
+                elif v==39:
+                    self.attr=(self.attr&0x38)|(self.default&7)
+                elif 40<=v<=47:
+                    self.attr=(self.attr&7)|((v-40)<<3)
+                elif v==49:
+                    self.attr=(self.attr&7)|(self.default&0x38)
+        elif cmd=="H" or cmd=="f":
+            self.row=min(n,self.rows)-1
+            self.col=min(max(p[1],1) if len(p)>1 else 1,self.cols)-1
+        elif cmd=="A":
+            self.row=max(self.row-n,0)
+        elif cmd=="B":
+            self.row=min(self.row+n,self.rows-1)
+        elif cmd=="C":
+            self.col=min(self.col+n,self.cols-1)
+        elif cmd=="D":
+            self.col=max(min(self.col,self.cols-1)-n,0)
+        elif cmd=="J":
+            if p[0]==2:
+                self.erase(0,0,self.cols-1,self.rows-1)
+            elif p[0]==1:
+                self.erase(0,0,min(self.col,self.cols-1),self.row)
+            else:
+                self.erase(min(self.col,self.cols-1),self.row,self.cols-1,self.rows-1)
+        elif cmd=="K":
+            if p[0]==2:
+                self.erase(0,self.row,self.cols-1,self.row)
+            elif p[0]==1:
+                self.erase(0,self.row,min(self.col,self.cols-1),self.row)
+            else:
+                self.erase(min(self.col,self.cols-1),self.row,self.cols-1,self.row)
+
+
+# Display lists : drawing commands recorded in a compact array('h') and executed in one call
+# Each command is an opcode followed by its operands (number of operands in DL_ARGS)
+DL_FILL_SCREEN=const(1)     # col
+DL_PIX=const(2)             # x, y, col
+DL_HLINE=const(3)           # x1, x2, y, col
+DL_VLINE=const(4)           # x, y1, y2, col
+DL_LINE=const(5)            # x1, y1, x2, y2, col
+DL_RECT=const(6)            # x1, y1, x2, y2, col
+DL_FILL_RECT=const(7)       # x1, y1, x2, y2, col
+DL_CIRCLE=const(8)          # x, y, r, col
+DL_DISK=const(9)            # x, y, r, col
+DL_TEXT=const(10)           # x, y, col, index of the string in the objects list
+DL_BLIT=const(11)           # x, y, index of the sprite in the objects list
+DL_ARGS=bytes((0,1,3,4,4,5,5,5,4,4,4,3))
+
+class DisplayList:
+    # Records drawing commands once, run() replays them (e.g. every frame for a static layout)
+    # Strings are kept in the objects list, the commands only hold their index
+    def __init__(self):
+        self.ops=array('h')
+        self.objects=[]
+
+    def clear(self):
+        self.ops=array('h')
+        self.objects=[]
+
+    def add(self,op,*args):
+        if len(args)!=DL_ARGS[op]:
+            raise ValueError("wrong number of operands")
+        self.ops.append(op)
+        for a in args:
+            self.ops.append(a)
+
+    def add_object(self,obj):
+        self.objects.append(obj)
+        return len(self.objects)-1
+
+    def fill_screen(self,col):
+        self.add(DL_FILL_SCREEN,col)
+
+    def pix(self,x,y,col):
+        self.add(DL_PIX,x,y,col)
+
+    def hline(self,x1,x2,y,col):
+        self.add(DL_HLINE,x1,x2,y,col)
+
+    def vline(self,x,y1,y2,col):
+        self.add(DL_VLINE,x,y1,y2,col)
+
+    def line(self,x1,y1,x2,y2,col):
+        self.add(DL_LINE,x1,y1,x2,y2,col)
+
+    def rect(self,x1,y1,x2,y2,col):
+        self.add(DL_RECT,x1,y1,x2,y2,col)
+
+    def fill_rect(self,x1,y1,x2,y2,col):
+        self.add(DL_FILL_RECT,x1,y1,x2,y2,col)
+
+    def circle(self,x,y,r,col):
+        self.add(DL_CIRCLE,x,y,r,col)
+
+    def disk(self,x,y,r,col):
+        self.add(DL_DISK,x,y,r,col)
+
+    def text(self,x,y,mess,col):
+        # Printed with the font selected when the list is run, the text cursor and color being
+        # left unchanged
+        self.add(DL_TEXT,x,y,col,self.add_object(mess))
+
+    def blit(self,sprite,x,y):
+        self.add(DL_BLIT,x,y,self.add_object(sprite))
+
+    def run(self):
+        run_list(self.ops,len(self.ops),self.objects)
+
+@micropython.viper
+def run_list(ops,n:int,objects):
+    # Executes n entries of a display list (see DisplayList)
+    # Pixels, lines along the axes and filled rectangles are all rectangles of pixels : they are
+    # written here by the span fill of fill_rect, without a call per command. The other
+    # commands call their primitive.
+    P=ptr16(ops)
+    A=ptr8(DL_ARGS)
+    Data=ptr32(draw_buf)
+    RW=ptr32(row_word)
+    CW=ptr8(col_word)
+    CP=ptr8(col_pix)
+    LM=ptr32(left_mask)
+    RM=ptr32(right_mask)
+    CWord=ptr32(color_word)
+    C=ptr16(clip_rect)
+    stride=int(draw_stride)
+    last=int(len(draw_buf))-1
+    a=0
+    b=0
+    c=0
+    d=0
+    e=0
+    i=0
+    while i<n:
+        op=int(P[i])
+        cnt=int(A[op])
+        # operands are signed 16b values, read unsigned
+        if cnt>0:a=((int(P[i+1])&0xFFFF)^0x8000)-0x8000
+        if cnt>1:b=((int(P[i+2])&0xFFFF)^0x8000)-0x8000
+        if cnt>2:c=((int(P[i+3])&0xFFFF)^0x8000)-0x8000
+        if cnt>3:d=((int(P[i+4])&0xFFFF)^0x8000)-0x8000
+        if cnt>4:e=((int(P[i+5])&0xFFFF)^0x8000)-0x8000
+        i+=cnt+1
+        if op==int(DL_HLINE) or op==int(DL_FILL_RECT) or op==int(DL_VLINE) or op==int(DL_PIX):
+            if op==int(DL_HLINE):
+                x1=a
+                x2=b
+                y1=c
+                y2=c+1
+                col=d
+            elif op==int(DL_FILL_RECT):
+                x1=a
+                y1=b
+                x2=c
+                y2=d
+                col=e
+            elif op==int(DL_VLINE):
+                x1=a
+                x2=a+1
+                y1=b
+                y2=c
+                col=d
+            else:
+                x1=a
+                x2=a+1
+                y1=b
+                y2=b+1
+                col=c
+            if (x2<x1):
+                temp=x1
+                x1=x2
+                x2=temp
+            if (y2<y1):
+                temp=y1
+                y1=y2
+                y2=temp
+            if (x1<int(C[0])):x1=int(C[0])
+            if (x2>int(C[2])):x2=int(C[2])
+            if (y1<int(C[1])):y1=int(C[1])
+            if (y2>int(C[3])):y2=int(C[3])
+            if (x1>=x2 or y1>=y2):
+                continue
+            w1=int(CW[x1])
+            w2=int(CW[x2])
+            p2=int(CP[x2])
+            mask1=int(LM[CP[x1]])
+            mask2=int(RM[CP[x2]])
+            colword=int(CWord[col])
+            if (w1==w2):
+                mask1&=mask2
+            mask1col=colword & mask1
+            mask2col=colword & mask2
+            mask1^=0x3FFFFFFF
+            mask2^=0x3FFFFFFF
+            k=int(RW[y1])
+            m=y2-y1
+            while m>0:
+                k1=k+w1
+                k2=k+w2
+                j=k1+1
+                if k1<0:k1=last
+                Data[k1]=(Data[k1] & mask1) | mask1col
+                if (w2>w1):
+                    if p2:
+                        Data[k2]=(Data[k2] & mask2) | mask2col
+                    while j < k2:
+                        Data[j]=colword
+                        j+=1
+                k+=stride
+                m-=1
+        elif op==int(DL_LINE):
+            draw_line(a,b,c,d,e)
+        elif op==int(DL_RECT):
+            draw_rect(a,b,c,d,e)
+        elif op==int(DL_CIRCLE):
+            draw_circle(a,b,c,d)
+        elif op==int(DL_DISK):
+            fill_disk(a,b,c,d)
+        elif op==int(DL_FILL_SCREEN):
+            fill_screen(a)
+        elif op==int(DL_TEXT):
+            print_at(a,b,objects[d],c)
+        elif op==int(DL_BLIT):
+            blit(objects[c],a,b)
+
+def init(mode=MODE_125MHZ, buf=None, verbose=False):
+    # Allocates the frame buffer (or reuses buf, see alloc_buffer), creates the state machines,
+    # configures the DMAs and starts the VGA output
+    global paral_write_Hsync,paral_write_Vsync,paral_write_RGB,H_buffer_line,H_buffer_line_address,output_mode,screen
+    output_mode=mode
+    if mode==MODE_250MHZ:
+        set_freq(250000000)
+        RGB_prog=paral_RGB_250
+    else:
+        RGB_prog=paral_RGB
+    SM0_FREQ,SM1_FREQ,SM2_FREQ=SM_FREQS[mode]
+    paral_write_Hsync = StateMachine(0, paral_Hsync,freq=SM0_FREQ, set_base=Pin(4))
+    paral_write_Vsync = StateMachine(1, paral_Vsync,freq=SM1_FREQ, sideset_base=Pin(5))
+    paral_write_RGB = StateMachine(2, RGB_prog,freq=SM2_FREQ, out_base=Pin(0),sideset_base=Pin(0))
+    # Builfing the Data array buffer
+    build_tables()
+    collect()
+    a0=mem_free()
+    t0=ticks_us()
+    H_buffer_line = alloc_buffer(buf)
+    t1=ticks_us()
+    # We need an array containing the adress of the buffer for the DMA chan0 to read the values
+    H_buffer_line_address=array('L',[addressof(H_buffer_line)])
+    # The screen : canvas of the frame buffer, with the row table of build_tables
+    screen=Canvas(H_res,V_res,H_buffer_line,row_word)
+    select(screen)
+    if verbose:
+        # a few information on what we just built
+        a1=mem_free()
+        print("buffer allocation time (ms):\t"+str(ticks_diff(t1,t0)/1000))
+        print("mem used by buffer array (kB):\t"+str(round((a0-a1)/1024,3)))
+        print("Number of 32b words:\t\t"+str(visible_pix))
+        print("Number of bits (total):\t\t"+str(32*visible_pix))
+        print("Number of bits (usable):\t"+str(usable_bits*visible_pix))
+        collect()
+        print("\nremaining RAM (kB):\t"+str(round(mem_free()/1024,3)))
+    # Configure the DMAs
+    configure_DMAs(len(H_buffer_line),H_buffer_line_address)
+    # Start the PIO Statemchines and the DMA Channels
+    startsync()
+
+def deinit():
+    # Stops the VGA output and frees the frame buffer
+    global paral_write_Hsync,paral_write_Vsync,paral_write_RGB,H_buffer_line,H_buffer_line_address
+    global screen,target,draw_buf
+    stopsync()
+    if output_mode==MODE_250MHZ:
+        set_freq(125000000)
+    paral_write_Hsync = None
+    paral_write_Vsync = None
+    paral_write_RGB = None
+    H_buffer_line = None
+    H_buffer_line_address = None
+    screen = None
+    target = None
+    draw_buf = None
+    collect()
@@ -0,0 +1,543 @@
+# Benchmark of the VGA.py drawing primitives
+#
+# Each primitive runs a fixed workload (always the same pseudo random coordinates) on the
+# real packed frame buffer, and the throughput is reported as JSON :
+#   {"name": {"calls": .., "pixels": .., "us": .., "calls_per_s": .., "pixels_per_s": ..}, ...}
+# "pixels" is the nominal number of pixels the workload asks for (area of the rectangles,
+# length of the lines...), so the numbers stay comparable whatever the implementation.
+#
+# Results can be saved as a baseline and later runs checked against it : a primitive fails
+# when its pixels/s drops more than the tolerance below the baseline. The timings only compare
+# on the same machine, so the baseline file (not part of the repository) keeps one entry per
+# machine and Python (see machine_key), and a check without an entry for this one fails.
+#
+# On the Pico (VGA.py, the fonts and demo_graph.py copied on the board) :
+#   import bench
+#   bench.main(save=True)               # once, before the changes to measure
+#   bench.main(check_baseline=True)     # False if a primitive regressed
+#
+# On a computer, with the hardware modules emulated (see emulator.py) :
+#   python bench.py                 # print the results
+#   python bench.py --save          # store them as the baseline for this machine
+#   python bench.py --check         # exit with an error if a primitive regressed
+
+import sys
+import json
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(t1, t0):
+        return t1 - t0
+
+BASELINE_FILE = "bench_baseline.json"
+TOLERANCE = 0.2     # a primitive regresses when it is more than 20% slower than the baseline
+REPEAT = 3          # each workload is run REPEAT times, the best time is kept
+H_res = 640
+V_res = 480
+
+VGA = None          # driver module, imported by setup()
+plot_graph = None   # from demo_graph.py
+
+# Tiny linear congruential generator : same workload on every platform
+_seed = 1
+
+
+def rand(n):
+    global _seed
+    _seed = (_seed * 1103515245 + 12345) & 0x7FFFFFFF
+    return (_seed >> 8) % n
+
+
+def reseed():
+    global _seed
+    _seed = 1
+
+
+#################################################################
+# Workloads - each one returns (calls, nominal pixels) and is timed by measure()
+
+def wl_fill_screen():
+    for col in range(8):
+        VGA.fill_screen(col)
+    return 8, 8 * H_res * V_res
+
+
+def wl_hline():
+    pixels = 0
+    for i in range(300):
+        x1 = rand(H_res)
+        x2 = rand(H_res)
+        VGA.draw_fastHline(x1, x2, rand(V_res), rand(8))
+        pixels += abs(x2 - x1)
+    return 300, pixels
+
+
+def wl_vline():
+    pixels = 0
+    for i in range(300):
+        y1 = rand(V_res)
+        y2 = rand(V_res)
+        VGA.draw_fastVline(rand(H_res), y1, y2, rand(8))
+        pixels += abs(y2 - y1)
+    return 300, pixels
+
+
+def wl_fill_rect():
+    pixels = 0
+    for i in range(50):
+        x1 = rand(H_res)
+        y1 = rand(V_res)
+        x2 = rand(H_res)
+        y2 = rand(V_res)
+        VGA.fill_rect(x1, y1, x2, y2, rand(8))
+        pixels += abs(x2 - x1) * abs(y2 - y1)
+    return 50, pixels
+
+
+def wl_circle():
+    pixels = 0
+    for i in range(100):
+        r = 5 + rand(100)
+        VGA.draw_circle(r + rand(H_res - 2 * r), r + rand(V_res - 2 * r), r, rand(8))
+        pixels += 6 * r             # ~ 2*pi*r
+    return 100, pixels
+
+
+def wl_disk():
+    pixels = 0
+    for i in range(30):
+        r = 5 + rand(100)
+        VGA.fill_disk(r + rand(H_res - 2 * r), r + rand(V_res - 2 * r), r, rand(8))
+        pixels += 3 * r * r         # ~ pi*r^2
+    return 30, pixels
+
+
+def wl_ellipse():
+    pixels = 0
+    for i in range(100):
+        rx = 5 + rand(150)
+        ry = 5 + rand(100)
+        VGA.draw_ellipse(rx + rand(H_res - 2 * rx), ry + rand(V_res - 2 * ry), rx, ry, rand(8))
+        pixels += 3 * (rx + ry)     # ~ perimeter
+    return 100, pixels
+
+
+def wl_fill_ellipse():
+    pixels = 0
+    for i in range(30):
+        rx = 5 + rand(150)
+        ry = 5 + rand(100)
+        VGA.fill_ellipse(rx + rand(H_res - 2 * rx), ry + rand(V_res - 2 * ry), rx, ry, rand(8))
+        pixels += 3 * rx * ry       # ~ pi*rx*ry
+    return 30, pixels
+
+
+def wl_arc():
+    pixels = 0
+    for i in range(100):
+        r = 5 + rand(100)
+        start = rand(360)
+        sweep = 1 + rand(359)
+        VGA.draw_arc(r + rand(H_res - 2 * r), r + rand(V_res - 2 * r), r, start, start + sweep,
+                     rand(8))
+        pixels += 6 * r * sweep // 360
+    return 100, pixels
+
+
+def wl_triangle():
+    pixels = 0
+    for i in range(100):
+        x1 = rand(H_res)
+        y1 = rand(V_res)
+        x2 = rand(H_res)
+        y2 = rand(V_res)
+        x3 = rand(H_res)
+        y3 = rand(V_res)
+        VGA.fill_triangle(x1, y1, x2, y2, x3, y3, rand(8))
+        pixels += abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1)) // 2
+    return 100, pixels
+
+
+def wl_polygon():
+    # 5 branch stars (10 vertices) of random sizes
+    from array import array
+    from math import sin, cos, pi
+    xs = array('h', range(10))
+    ys = array('h', range(10))
+    pixels = 0
+    for i in range(50):
+        r = 20 + rand(100)
+        x = r + rand(H_res - 2 * r)
+        y = r + rand(V_res - 2 * r)
+        for k in range(10):
+            rk = r if k % 2 == 0 else r // 2
+            xs[k] = x + int(rk * cos(k * pi / 5))
+            ys[k] = y + int(rk * sin(k * pi / 5))
+        VGA.fill_polygon(xs, ys, rand(8))
+        area = 0
+        for k in range(10):
+            area += xs[k - 1] * ys[k] - xs[k] * ys[k - 1]
+        pixels += abs(area) // 2
+    return 50, pixels
+
+
+def wl_flood_fill():
+    # Insides of 10 circles filled again and again, with colors that change at each call
+    VGA.fill_screen(0)
+    circles = []
+    for i in range(10):
+        r = 20 + rand(60)
+        x = r + rand(H_res - 2 * r)
+        y = r + rand(V_res - 2 * r)
+        VGA.draw_circle(x, y, r, 7)
+        circles.append((x, y, r))
+    pixels = 0
+    for i in range(3):
+        for x, y, r in circles:
+            VGA.flood_fill(x, y, 1 + (x + i) % 6)
+            pixels += 3 * r * r
+    return 30, pixels
+
+
+def wl_line():
+    # Lines in every direction, all end points on screen
+    pixels = 0
+    for i in range(300):
+        x1 = rand(H_res)
+        y1 = rand(V_res)
+        x2 = rand(H_res)
+        y2 = rand(V_res)
+        VGA.draw_line(x1, y1, x2, y2, rand(8))
+        pixels += max(abs(x2 - x1), abs(y2 - y1)) + 1
+    return 300, pixels
+
+
+def wl_polyline():
+    # Random walk curve of 500 segments across the screen, drawn 10 times in one call each
+    from array import array
+    xs = array('h', [i * (H_res - 1) // 500 for i in range(501)])
+    ys = array('h', xs)
+    y = V_res // 2
+    pixels = 0
+    for i in range(len(xs)):
+        y = min(V_res - 1, max(0, y + rand(21) - 10))
+        ys[i] = y
+        if i:
+            pixels += max(xs[i] - xs[i - 1], abs(ys[i] - ys[i - 1])) + 1
+    for i in range(10):
+        VGA.draw_polyline(xs, ys, rand(8))
+    return 10, 10 * pixels
+
+
+def wl_display_list():
+    # Dashboard like list of 200 small commands, recorded once and replayed 5 times
+    dl = VGA.DisplayList()
+    pixels = 0
+    for i in range(50):
+        x = rand(H_res - 40)
+        y = rand(V_res - 40)
+        dl.fill_rect(x, y, x + 30, y + 20, rand(8))
+        dl.rect(x, y, x + 30, y + 20, rand(8))
+        dl.hline(x, x + 40, y + 30, rand(8))
+        dl.line(x, y, x + 40, y + 35, rand(8))
+        pixels += 30 * 20 + 100 + 40 + 41
+    for i in range(5):
+        dl.run()
+    return 5 * 200, 5 * pixels
+
+
+def wl_clipped():
+    # Sub-panel redraw : the line and rectangle workloads drawn through a 160x120 clip rectangle
+    # (pixels counted as asked, only the visible ones are drawn)
+    VGA.set_clip(240, 180, 400, 300)
+    calls, pixels = wl_line()
+    calls2, pixels2 = wl_fill_rect()
+    VGA.set_clip()
+    return calls + calls2, pixels + pixels2
+
+
+def wl_read_rect():
+    # Save-under of 64x64 popups, into a byte per pixel buffer and into packed pixels
+    from array import array
+    pixbuf = bytearray(64 * 64)
+    packed = array('L', range(VGA.packed_size(64, 64)))
+    for i in range(50):
+        VGA.read_rect(rand(H_res - 64), rand(V_res - 64), 64, 64, pixbuf)
+        VGA.read_rect(rand(H_res - 64), rand(V_res - 64), 64, 64, packed)
+    return 100, 100 * 64 * 64
+
+
+def wl_blit():
+    # 64x64 icon moved around, opaque and with a transparent color
+    icon = bytearray((i ^ (i >> 6)) % 8 for i in range(64 * 64))
+    opaque = VGA.Sprite(64, 64)
+    opaque.set_pixels(icon)
+    masked = VGA.Sprite(64, 64)
+    masked.set_pixels(icon, 0)
+    for i in range(50):
+        VGA.blit(opaque, rand(H_res - 64), rand(V_res - 64))
+        VGA.blit(masked, rand(H_res - 64), rand(V_res - 64))
+    return 100, 100 * 64 * 64
+
+
+def wl_canvas():
+    # Widget composed off-screen on a 160x100 canvas, then copied on the screen 20 times
+    canvas = VGA.Canvas(160, 100)
+    canvas.select()
+    VGA.fill_screen(4)
+    VGA.fill_rect(5, 5, 155, 95, 0)
+    for i in range(10):
+        VGA.draw_line(5, 95, 15 * i + 5, 5 + 9 * i, 2)
+    VGA.fill_disk(130, 30, 20, 1)
+    VGA.select(VGA.screen)
+    for i in range(20):
+        VGA.blit(canvas, rand(H_res - 160), rand(V_res - 100))
+    return 20, 20 * 160 * 100
+
+
+def wl_text():
+    # 3 pages of text with the small font
+    line = "The quick brown fox jumps over the lazy dog 0123456789 !?"
+    VGA.setfont(2)
+    VGA.settextcolor(7)
+    chars = 0
+    for page in range(3):
+        VGA.settextcursor(0, 10)
+        for i in range(40):
+            VGA.printh(line + "\n")
+            chars += len(line)
+    return chars, chars * VGA.Char_width * VGA.Char_height
+
+
+def wl_labels():
+    # Dashboard redrawn 20 times : 12 labels (axis ticks, units) through the label cache
+    VGA.settextcolor(7)
+    VGA.setfont(2)
+    labels = ["%d V" % (i * 5) for i in range(12)]
+    for frame in range(20):
+        for i in range(12):
+            VGA.render_label(labels[i], 2).draw(20 + 50 * (i % 4), 40 + 30 * (i // 4))
+    return 240, 240 * 4 * VGA.Char_width * VGA.Char_height
+
+
+def wl_text_box():
+    # A paragraph wrapped and aligned in 3 boxes, 10 times
+    text = "The quick brown fox jumps over the lazy dog 0123456789 !? " * 4
+    VGA.setfont(2)
+    VGA.settextcolor(7)
+    for i in range(10):
+        for align in range(3):
+            VGA.draw_text_box(text, 10 + 210 * align, 10 + 40 * i, 200, 40, align)
+    return 30, 30 * 200 * 40
+
+
+def wl_console():
+    # Log console over the whole screen : 100 lines, most of them scrolling the screen
+    VGA.setfont(2)
+    console = VGA.Console()
+    for i in range(100):
+        console.write("\x1b[3%dm%4d\x1b[0m sensor %d ok\n" % (1 + i % 7, i, i % 10))
+    return 100, 100 * H_res * console.cell_h
+
+
+def wl_checker():
+    # Checkerboard drawn at the end of VGA.py
+    for h in range(8):
+        for i in range(0, 60):
+            for k in range(8):
+                VGA.draw_fastHline(k * 80, k * 80 + 80, h * 60 + i, (h + k) % 8)
+    return 8 * 60 * 8, H_res * V_res
+
+
+def wl_plot_graph():
+    plot_graph(9.6, 10, 0, 6, 1, 2, 3, 7, 5, 2, 2, 5)
+    return 1, H_res * V_res
+
+
+# name, workload, driver functions it needs
+WORKLOADS = (
+    ("fill_screen", wl_fill_screen, ("fill_screen",)),
+    ("draw_fastHline", wl_hline, ("draw_fastHline",)),
+    ("draw_fastVline", wl_vline, ("draw_fastVline",)),
+    ("fill_rect", wl_fill_rect, ("fill_rect",)),
+    ("draw_circle", wl_circle, ("draw_circle",)),
+    ("fill_disk", wl_disk, ("fill_disk",)),
+    ("draw_ellipse", wl_ellipse, ("draw_ellipse",)),
+    ("fill_ellipse", wl_fill_ellipse, ("fill_ellipse",)),
+    ("draw_arc", wl_arc, ("draw_arc",)),
+    ("fill_triangle", wl_triangle, ("fill_triangle",)),
+    ("fill_polygon", wl_polygon, ("fill_polygon",)),
+    ("flood_fill", wl_flood_fill, ("flood_fill",)),
+    ("draw_line", wl_line, ("draw_line",)),
+    ("draw_polyline", wl_polyline, ("draw_polyline",)),
+    ("display_list", wl_display_list, ("DisplayList",)),
+    ("clipped", wl_clipped, ("set_clip",)),
+    ("read_rect", wl_read_rect, ("read_rect",)),
+    ("blit", wl_blit, ("blit", "Sprite")),
+    ("canvas", wl_canvas, ("Canvas",)),
+    ("printh", wl_text, ("printh", "setfont")),
+    ("labels", wl_labels, ("render_label",)),
+    ("text_box", wl_text_box, ("draw_text_box",)),
+    ("console", wl_console, ("Console",)),
+    ("checkerboard", wl_checker, ("draw_fastHline",)),
+    ("plot_graph", wl_plot_graph, ("draw_line", "printh")),
+)
+
+
+#################################################################
+
+def measure(workload):
+    best = None
+    for i in range(REPEAT):
+        reseed()
+        t0 = ticks_us()
+        calls, pixels = workload()
+        dt = ticks_diff(ticks_us(), t0)
+        if best is None or dt < best:
+            best = dt
+    best = max(best, 1)
+    return {"calls": calls, "pixels": pixels, "us": best,
+            "calls_per_s": round(calls * 1000000 / best, 1),
+            "pixels_per_s": round(pixels * 1000000 / best, 1)}
+
+
+def measure_alloc():
+    # Time and heap used to allocate a frame buffer
+    # On a computer the heap is traced, which also gives the peak during the allocation
+    # The driver is stopped meanwhile (no room for two buffers on the Pico), and restarted
+    # with the new buffer
+    from gc import collect, mem_free
+    VGA.deinit()
+    tracing = sys.platform != "rp2"
+    if tracing:
+        import tracemalloc
+        tracemalloc.start()
+    collect()
+    free = mem_free()
+    t0 = ticks_us()
+    buf = VGA.alloc_buffer()
+    dt = ticks_diff(ticks_us(), t0)
+    result = {"us": dt, "bytes": free - mem_free()}
+    if tracing:
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    VGA.init(buf=buf)
+    return result
+
+
+def run(only=None):
+    # Run every workload supported by the driver (or only the listed ones)
+    results = {}
+    if hasattr(VGA, "alloc_buffer") and (not only or "alloc_buffer" in only):
+        results["alloc_buffer"] = measure_alloc()
+    for name, workload, needs in WORKLOADS:
+        if only and name not in only:
+            continue
+        if not all(hasattr(VGA, f) for f in needs):
+            continue
+        if workload is wl_plot_graph and plot_graph is None:
+            continue
+        results[name] = measure(workload)
+    return results
+
+
+def load_baseline(path=BASELINE_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except OSError:
+        return {}
+
+
+def machine_key():
+    # Baseline entry of this machine : platform, host name and CPU, Python implementation
+    try:
+        import os
+        u = os.uname()
+        machine = "%s %s" % (u.nodename, u.machine)
+    except (ImportError, AttributeError):
+        import platform
+        machine = "%s %s" % (platform.node(), platform.machine())
+    v = sys.implementation
+    return "%s %s %s %d.%d" % (sys.platform, machine, v.name, v.version[0], v.version[1])
+
+
+def save_baseline(results, path=BASELINE_FILE):
+    baseline = load_baseline(path)
+    baseline[machine_key()] = dict((name, r["pixels_per_s"]) for name, r in results.items()
+                                  if "pixels_per_s" in r)
+    with open(path, "w") as f:
+        json.dump(baseline, f)
+
+
+def check(results, path=BASELINE_FILE, tolerance=TOLERANCE):
+    # List of (name, pixels/s, baseline pixels/s) for the primitives that regressed
+    # A missing baseline (file or machine) is an error : generate it with --save first
+    key = machine_key()
+    reference = load_baseline(path).get(key)
+    if not reference:
+        raise RuntimeError("no baseline for %s in %s - run with --save (main(save=True)) first"
+                           % (key, path))
+    failed = []
+    for name, r in results.items():
+        if name in reference and r["pixels_per_s"] < reference[name] * (1 - tolerance):
+            failed.append((name, r["pixels_per_s"], reference[name]))
+    return failed
+
+
+def setup(driver=None):
+    # Import and start the driver - on a computer the hardware modules are emulated first
+    global VGA, plot_graph
+    if sys.platform != "rp2":
+        import os
+        import emulator
+        # out of range pointer accesses raise IndexError : a primitive writing outside of its
+        # buffer fails the run instead of being timed
+        emulator.install(True)
+        here = os.path.dirname(os.path.abspath(__file__))
+        sys.path.insert(0, os.path.join(here, "VGA-with fonts"))
+        if driver is not None:
+            sys.path.insert(0, os.path.dirname(os.path.abspath(driver)))
+    import VGA as driver_module
+    VGA = driver_module
+    VGA.init()
+    try:
+        from demo_graph import plot_graph
+    except ImportError:
+        pass
+
+
+def main(save=False, check_baseline=False, only=None, driver=None, path=BASELINE_FILE):
+    setup(driver)
+    results = run(only)
+    print(json.dumps(results))
+    if save:
+        save_baseline(results, path)
+    if check_baseline:
+        failed = check(results, path)
+        for name, value, reference in failed:
+            print("REGRESSION", name, value, "pixels/s < baseline", reference)
+        return not failed
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark the VGA.py drawing primitives")
+    parser.add_argument("--save", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--check", action="store_true", help="fail if a primitive regressed")
+    parser.add_argument("--baseline", help="baseline JSON file (default: %s next to bench.py)"
+                        % BASELINE_FILE)
+    parser.add_argument("--driver", help="VGA.py to benchmark (default: the one next to bench.py)")
+    parser.add_argument("only", nargs="*", help="primitives to run (default: all)")
+    args = parser.parse_args()
+    import os
+    path = args.baseline or os.path.join(os.path.dirname(os.path.abspath(__file__)), BASELINE_FILE)
+    ok = main(args.save, args.check, args.only, args.driver, path)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,28 @@
+# Demo of the VGA driver : 8 color checker and various figures
+import VGA
+from VGA import RED,GREEN,BLUE,YELLOW,BLACK,WHITE,CYAN,MAGENTA
+
+VGA.init(verbose=True)
+
+# Drawing a simple 8 color checker
+for h in range(8):
+    for i in range(0,60):
+        for k in range(8):
+            col=(h+k)%8
+            VGA.draw_fastHline(k*80,k*80+80,h*60+i,col)
+
+
+# Drawing Various figures
+VGA.fill_rect(20,20,150,150,BLACK)
+VGA.fill_rect(20,200,150,400,BLUE)
+VGA.fill_rect(200,205,205,150,WHITE)
+VGA.fill_rect(300,415,350,300,YELLOW)
+VGA.fill_rect(550,450,640,150,CYAN)
+VGA.draw_circle(100,400,75,YELLOW)
+VGA.draw_circle(150,150,98,CYAN)
+VGA.fill_disk(320,240,150,BLACK)
+VGA.fill_disk(320,240,120,RED)
+VGA.fill_disk(320,240,80,GREEN)
+VGA.fill_disk(320,240,50,WHITE)
+VGA.draw_rect(500,50,620,70,BLACK)
+VGA.draw_rect(100,390,600,480,RED)
@@ -0,0 +1,461 @@
+# Host side emulation of the Pico hardware used by VGA.py
+#
+# VGA.py is written for Micropython on the rp2040 : it imports machine, rp2, uctypes
+# and uses the viper code emitter (ptr32, uint...) to program the DMA and PIO registers.
+# This module provides stand-ins for all of these so the driver (and every drawing routine)
+# can run unchanged under CPython on a regular computer :
+# - the viper/native decorators are no-ops and ptr8/ptr16/ptr32 access the buffers like viper
+#   does (unsigned 8/16b loads, stores truncated to the pointer size, 32b array('L') words)
+# - hardware registers written through ptr32(address) land in a simple register file
+# - the state machines only record what is pushed into their FIFO
+# - H_buffer_line is left untouched : same packed layout (10 pixels of 3 bits per 32b word)
+#
+# The frame that the DMA would send to the screen can then be decoded and saved as a PPM image.
+#
+# Usage :
+#   import emulator
+#   emulator.install()          # must be called before importing VGA
+#   import VGA
+#   VGA.init()
+#   emulator.save_ppm("frame.ppm")
+#
+# or from the command line, to run a script and dump the resulting frame :
+#   python emulator.py "VGA-with fonts/demo_graph.py" -o frame.ppm
+
+import array as _array
+import builtins
+import gc
+import os
+import sys
+import time
+import types
+import weakref
+
+# Geometry of the visible frame (must match VGA.py)
+H_res = 640
+V_res = 480
+bit_per_pix = 3
+pix_per_words = 10
+
+# Emulated heap size reported by gc.mem_free() (approx. what Micropython gets on a Pico)
+HEAP_SIZE = 192 * 1024
+
+# DMA registers used by configure_DMAs
+DMA_CH0_READ_ADDR = 0x50000000
+DMA_CH1_TRANS_COUNT = 0x50000048
+
+# 3 bit color -> RGB triplet (bit0 = red, bit1 = green, bit2 = blue)
+PALETTE = [((c & 1) * 255, ((c >> 1) & 1) * 255, ((c >> 2) & 1) * 255) for c in range(8)]
+
+
+#################################################################
+# Memory : register file and fake addresses for Python objects
+
+registers = {}      # address -> 32b value written through ptr8/ptr16/ptr32(address)
+# fake address -> object (see addressof), weak so that deinit() frees the frame buffer
+_objects = weakref.WeakValueDictionary()
+
+# Viper does not check bounds : on the Pico an out of range index silently reads or corrupts
+# whatever lies around the buffer. With strict=False (see install) such accesses are dropped
+# and counted here instead of raising IndexError (see _View).
+strict = True
+out_of_bounds = 0
+
+
+def addressof(obj):
+    # Give a stable fake SRAM address to an object, and remember it (while it is alive) so the
+    # address written into the DMA registers can be turned back into the object
+    addr = 0x20000000 | ((id(obj) >> 2) << 2 & 0x0FFFFFFC)
+    _objects[addr] = obj
+    return addr
+
+
+def deref(addr):
+    # Object previously passed to addressof() or None
+    return _objects.get(addr)
+
+
+class _Pointer:
+    # Viper pointer to a raw address (registers) : pointer[i] reads/writes address+i*size
+    __slots__ = ("addr", "size")
+
+    def __init__(self, addr, size):
+        self.addr = addr
+        self.size = size
+
+    def __int__(self):
+        return self.addr
+
+    __index__ = __int__
+
+    def __getitem__(self, i):
+        return registers.get(self.addr + i * self.size, 0)
+
+    def __setitem__(self, i, value):
+        registers[self.addr + i * self.size] = value & ((1 << (8 * self.size)) - 1)
+
+
+class _View:
+    # Viper pointer to a buffer : ptr8/ptr16 loads are unsigned, ptr32 loads are signed 32b
+    # and stores keep the low 8/16/32 bits, like the machine words of the rp2040.
+    # Out of range indices (negative ones too) raise IndexError, or with strict=False are
+    # dropped (reads give 0) and counted in out_of_bounds.
+    __slots__ = ("buf", "n", "size", "signed")
+
+    def __init__(self, buf, size):
+        self.buf = buf
+        self.n = len(buf)
+        self.size = size
+        self.signed = getattr(buf, "typecode", getattr(buf, "format", "B")) in "bhilq"
+
+    def __len__(self):
+        return self.n
+
+    def _out(self, i):
+        global out_of_bounds
+        if strict:
+            raise IndexError("ptr%d index %d out of range (%d items)" % (8 * self.size, i, self.n))
+        out_of_bounds += 1
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.n:
+            self._out(i)
+            return 0
+        v = self.buf[i]
+        if self.size == 4:
+            v &= 0xFFFFFFFF
+            return v - 0x100000000 if v & 0x80000000 else v
+        return v & (0xFF if self.size == 1 else 0xFFFF)
+
+    def __setitem__(self, i, value):
+        if not 0 <= i < self.n:
+            self._out(i)
+            return
+        bits = 8 * self.size
+        value &= (1 << bits) - 1
+        if self.signed and value >> (bits - 1):
+            value -= 1 << bits
+        self.buf[i] = value
+
+
+_CODES = {1: "B", 2: "H", 4: "I"}
+
+
+def _make_ptr(size):
+    def ptr(obj):
+        if isinstance(obj, int):
+            return _Pointer(obj, size)
+        if isinstance(obj, _Pointer):
+            return _Pointer(obj.addr, size)
+        if isinstance(obj, _View):
+            obj = obj.buf
+        # the pointer sees the memory of the buffer as items of its own size
+        itemsize = getattr(obj, "itemsize", 1)
+        if itemsize != size and isinstance(obj, (bytearray, memoryview, _array.array)):
+            obj = memoryview(obj).cast("B").cast(_CODES[size])
+        return _View(obj, size)
+    return ptr
+
+
+ptr8 = _make_ptr(1)
+ptr16 = _make_ptr(2)
+ptr32 = _make_ptr(4)
+
+
+def uint(obj):
+    # Viper uint() cast : 32b unsigned value of an int, or address of a buffer
+    if isinstance(obj, int):
+        return obj & 0xFFFFFFFF
+    if isinstance(obj, _Pointer):
+        return obj.addr
+    return addressof(obj)
+
+
+#################################################################
+# Stand-in modules
+
+def _identity(f):
+    return f
+
+
+def _const(value):
+    return value
+
+
+# Heap : with install(trace_heap=True) tracemalloc follows every allocation (slower), otherwise
+# only the arrays created by the device code are counted (frame buffer, canvases, sprites...)
+_arrays = {}        # id -> weak reference to the arrays created through the array stand-in
+
+
+def _mem_alloc():
+    import tracemalloc
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    total = 0
+    for ref in list(_arrays.values()):
+        a = ref()
+        if a is not None:
+            total += a.itemsize * len(a)
+    return total
+
+
+def _mem_free():
+    return HEAP_SIZE - _mem_alloc()
+
+
+# Micropython's 'L' and 'l' items are 32 bits, CPython's are the C long (64 bits on most hosts)
+_WORD_CODES = {"L": "I" if _array.array("I").itemsize == 4 else "L",
+               "l": "i" if _array.array("i").itemsize == 4 else "l"}
+
+
+def _new_array(typecode, initializer=()):
+    a = _array.array(_WORD_CODES.get(typecode, typecode), initializer)
+    key = id(a)
+    _arrays[key] = weakref.ref(a, lambda ref: _arrays.pop(key, None))
+    return a
+
+
+def _ticks_us():
+    return time.perf_counter_ns() // 1000
+
+
+def _ticks_ms():
+    return time.perf_counter_ns() // 1000000
+
+
+def _ticks_diff(t1, t0):
+    return t1 - t0
+
+
+def _ticks_add(t, delta):
+    return t + delta
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self._value = value or 0
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self._value = v
+
+    def __repr__(self):
+        return "Pin(%d)" % self.id
+
+
+_freq = [125000000]
+
+
+def freq(hz=None):
+    if hz is None:
+        return _freq[0]
+    _freq[0] = hz
+
+
+class PIO:
+    IN_LOW = 0
+    IN_HIGH = 1
+    OUT_LOW = 2
+    OUT_HIGH = 3
+    SHIFT_LEFT = 0
+    SHIFT_RIGHT = 1
+    JOIN_NONE = 0
+    JOIN_TX = 1
+    JOIN_RX = 2
+    IRQ_SM0 = 0x100
+    IRQ_SM1 = 0x200
+    IRQ_SM2 = 0x400
+    IRQ_SM3 = 0x800
+
+    def __init__(self, id):
+        self.id = id
+
+
+class PIOProgram:
+    # The assembler body is never executed : only the decorator parameters are kept
+    def __init__(self, func, config):
+        self.func = func
+        self.config = config
+
+    def __repr__(self):
+        return "<PIO program %s>" % self.func.__name__
+
+
+def asm_pio(**config):
+    def decorator(func):
+        return PIOProgram(func, config)
+    return decorator
+
+
+class StateMachine:
+    def __init__(self, id, program=None, freq=-1, **config):
+        self.id = id
+        self.program = program
+        self.freq = freq
+        self.config = config
+        self.fifo = []
+        self._active = False
+
+    def init(self, program, freq=-1, **config):
+        self.__init__(self.id, program, freq, **config)
+
+    def active(self, value=None):
+        if value is None:
+            return self._active
+        self._active = bool(value)
+
+    def put(self, value, shift=0):
+        self.fifo.append(value >> shift)
+
+    def get(self, buf=None, shift=0):
+        return 0
+
+    def exec(self, instr):
+        pass
+
+    def restart(self):
+        pass
+
+    def irq(self, handler=None, trigger=0, hard=False):
+        pass
+
+    def rx_fifo(self):
+        return 0
+
+    def tx_fifo(self):
+        return len(self.fifo)
+
+
+def _module(name, **attrs):
+    mod = types.ModuleType(name)
+    mod.__dict__.update(attrs)
+    return mod
+
+
+# Host modules replaced by stand-ins for the device code only (see _import)
+_standins = {}
+_host_import = builtins.__import__
+_host_dirs = tuple(os.path.realpath(p) + os.sep
+                   for p in set((sys.prefix, sys.base_prefix, sys.exec_prefix)))
+
+
+def _is_device(globals):
+    # Device code : the modules and scripts that are not part of Python nor of the emulator
+    path = globals.get("__file__") if globals else None
+    if not path:
+        return False
+    path = os.path.realpath(path)
+    return path != os.path.realpath(__file__) and not path.startswith(_host_dirs)
+
+
+def _import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level == 0 and name in _standins and _is_device(globals):
+        return _standins[name]
+    return _host_import(name, globals, locals, fromlist, level)
+
+
+def install(check_bounds=True, trace_heap=False):
+    # Register the stand-in modules and viper builtins - call before importing VGA
+    # check_bounds=False mimics the Pico : out of range pointer accesses are counted, not raised
+    # trace_heap=True makes gc.mem_free()/mem_alloc() follow all the allocations (slower)
+    # The host gc, time and array modules are left untouched : only the device code (VGA.py,
+    # the scripts...) imports their stand-ins, with the Micropython functions and 32b words
+    global strict
+    strict = check_bounds
+    if trace_heap:
+        import tracemalloc
+        tracemalloc.start()
+    micropython = _module("micropython", viper=_identity, native=_identity,
+                          const=_const, mem_info=lambda *a: None,
+                          alloc_emergency_exception_buf=lambda n: None)
+    sys.modules["micropython"] = micropython
+    sys.modules["machine"] = _module("machine", Pin=Pin, freq=freq,
+                                     reset=lambda: None, mem32=_Pointer(0, 4))
+    sys.modules["rp2"] = _module("rp2", PIO=PIO, StateMachine=StateMachine,
+                                 asm_pio=asm_pio, PIOASMError=Exception)
+    sys.modules["uctypes"] = _module("uctypes", addressof=addressof)
+    # @micropython.viper is resolved by the Micropython compiler without any import
+    builtins.micropython = micropython
+    builtins.ptr8 = ptr8
+    builtins.ptr16 = ptr16
+    builtins.ptr32 = ptr32
+    builtins.uint = uint
+    _standins["gc"] = _module("gc", **dict(vars(gc), mem_free=_mem_free, mem_alloc=_mem_alloc))
+    _standins["time"] = _module("time", **dict(
+        vars(time), ticks_us=_ticks_us, ticks_ms=_ticks_ms, ticks_cpu=_ticks_us,
+        ticks_diff=_ticks_diff, ticks_add=_ticks_add,
+        sleep_ms=lambda ms: time.sleep(ms / 1000), sleep_us=lambda us: time.sleep(us / 1000000)))
+    _standins["array"] = _module("array", array=_new_array)
+    builtins.__import__ = _import
+
+
+#################################################################
+# Frame decoding
+
+def frame_buffer():
+    # Buffer the DMA is configured to scan out (found through the DMA registers)
+    table = deref(registers.get(DMA_CH0_READ_ADDR, 0))
+    if table is None:
+        raise RuntimeError("DMA not configured - is VGA running ?")
+    return deref(table[0])
+
+
+def pixels(buf=None):
+    # Decode the packed buffer into a bytearray of H_res*V_res 3 bit colors (row major).
+    # Same addressing as draw_pix : pixel n is stored in word (n//10)-1, the first 10
+    # pixels of the frame being in the last word of the buffer.
+    if buf is None:
+        buf = frame_buffer()
+    n = len(buf)
+    out = bytearray(n * pix_per_words)
+    for k in range(n):
+        word = buf[k]
+        base = ((k + 1) % n) * pix_per_words
+        for i in range(pix_per_words):
+            out[base + i] = (word >> (bit_per_pix * i)) & 0b111
+    return out
+
+
+def save_ppm(path, buf=None, width=H_res, height=V_res):
+    # Write the visible frame as a binary PPM (P6) image
+    pix = pixels(buf)
+    rgb = bytearray()
+    for c in pix[:width * height]:
+        rgb += bytes(PALETTE[c])
+    with open(path, "wb") as f:
+        f.write(b"P6\n%d %d\n255\n" % (width, height))
+        f.write(rgb)
+
+
+def run(path, check_bounds=True):
+    # Run a Micropython script under emulation, its folder being importable (fonts...)
+    import runpy
+    install(check_bounds)
+    folder = os.path.dirname(os.path.abspath(path))
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    return runpy.run_path(path, run_name="__main__")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Run a VGA script on the host and dump the frame")
+    parser.add_argument("script", help="Micropython script using VGA.py")
+    parser.add_argument("-o", "--output", default="frame.ppm", help="PPM file to write")
+    parser.add_argument("--no-bounds-check", action="store_true",
+                        help="ignore out of range pointer accesses instead of raising IndexError")
+    args = parser.parse_args()
+    namespace = run(args.script, not args.no_bounds_check)
+    buf = namespace.get("H_buffer_line")
+    save_ppm(args.output, buf if buf is not None else frame_buffer())
+    if out_of_bounds:
+        print("warning :", out_of_bounds, "out of range pointer accesses ignored")
+    print("frame saved to", args.output)
@@ -0,0 +1,147 @@
+# Font converter : Adafruit GFX font (.h) -> compact font module for VGA.py
+#
+# The Adafruit GFX fonts (https://github.com/adafruit/Adafruit-GFX-Library/tree/master/Fonts)
+# are C arrays : the bitmaps of all the glyphs (1 bit per pixel, row after row) and a table of
+# glyphs {bitmap offset, width, height, x advance, x offset, y offset}. The module written here
+# keeps them as two bytes objects, so importing it creates 2 objects instead of thousands of ints
+# (and nothing at all on the heap once the module is frozen in the firmware) :
+#   first, last         codes of the first and last characters
+#   char_width, char_height, line_spacing   metrics used by printh
+#   bitmaps             bytes of the glyph bitmaps
+#   glyphs              7 bytes per character from first to last : bitmap offset (2 bytes, little
+#                       endian), width, height, x advance, x offset, y offset (signed bytes)
+# The font list modules of the first versions of VGA.py ([...] lists) are read as well.
+# With --binary, the same data is written as a font file instead, read by VGA.FontFile glyph by
+# glyph when drawn : b"VGAF", first, last, char_width, char_height, line_spacing (1 byte each),
+# then the glyphs table and the bitmaps.
+#
+# Usage (on a computer) :
+#   python fontconv.py FreeMono9pt7b.h -o "VGA-with fonts/FreeMono9pt7b.py"
+#   python fontconv.py FreeSans12pt7b.h --height 17 --spacing 4
+#   python fontconv.py FreeSerif18pt7b.h --binary      (writes FreeSerif18pt7b.vgf)
+# then VGA.setfont(module) or add the module name to VGA.FONTS, or VGA.setfont("font.vgf")
+
+import os
+import re
+import sys
+
+GLYPH_SIZE = 7      # bytes per glyph in the glyphs table
+MAGIC = b"VGAF"     # start of the font files
+
+
+def strip_comments(text):
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    return re.sub(r"(//|#)[^\n]*", "", text)
+
+
+def numbers(text):
+    return [int(n, 0) for n in re.findall(r"-?(?:0x[0-9A-Fa-f]+|\d+)", text)]
+
+
+def parse(text):
+    # (name, bitmaps, glyphs, first, y advance) - first and y advance are None if unknown
+    text = strip_comments(text)
+    bitmaps = re.search(r"(\w+)Bitmaps(?:\[\])?[^=]*=\s*[\[{](.*?)[\]}]\s*;?", text, re.S)
+    glyphs = re.search(r"(\w+)Glyphs(?:\[\])?[^=]*=\s*[\[{](.*?)[\]}]\s*;?\s*(?:$|const|\w+\s*=)",
+                       text, re.S)
+    if bitmaps is None or glyphs is None:
+        raise ValueError("no Bitmaps / Glyphs arrays found")
+    values = numbers(glyphs.group(2))
+    if len(values) % 6:
+        raise ValueError("the glyph table does not have 6 values per glyph")
+    table = [values[i:i + 6] for i in range(0, len(values), 6)]
+    first = y_advance = None
+    # const GFXfont Name PROGMEM = {(uint8_t *)NameBitmaps, (GFXglyph *)NameGlyphs, first, last, yAdvance};
+    font = re.search(r"GFXfont\s+\w+[^=]*=\s*\{[^,]*,[^,]*,([^,]*),([^,]*),([^,}]*)\}", text)
+    if font is not None:
+        first = int(font.group(1).strip(), 0)
+        y_advance = int(font.group(3).strip(), 0)
+    return bitmaps.group(1), bytes(numbers(bitmaps.group(2))), table, first, y_advance
+
+
+def pack_glyphs(table):
+    out = bytearray()
+    for offset, width, height, advance, dx, dy in table:
+        if not (0 <= offset < 65536 and -128 <= dx < 128 and -128 <= dy < 128):
+            raise ValueError("glyph out of range of the compact format")
+        out += bytes((offset & 0xFF, offset >> 8, width, height, advance, dx & 0xFF, dy & 0xFF))
+    return bytes(out)
+
+
+def bytes_literal(data, indent="    ", per_line=16):
+    lines = []
+    for i in range(0, len(data), per_line):
+        lines.append(indent + "b'" + "".join("\\x%02x" % b for b in data[i:i + per_line]) + "'")
+    return "(\n" + "\n".join(lines) + ")" if lines else "b''"
+
+
+def metrics(text, first=None, width=None, height=None, spacing=None):
+    # (name, bitmaps, glyph table, first, width, height, spacing) with the defaults filled in
+    name, bitmaps, table, font_first, y_advance = parse(text)
+    if first is None:
+        first = font_first if font_first is not None else 0x20
+    if height is None:
+        height = max(g[2] for g in table)
+    if width is None:
+        width = max(g[3] for g in table)
+    if spacing is None:
+        spacing = max(y_advance - height, 0) if y_advance is not None else 2
+    return name, bitmaps, table, first, width, height, spacing
+
+
+def convert(text, source="", first=None, width=None, height=None, spacing=None):
+    # Python source of the font module
+    name, bitmaps, table, first, width, height, spacing = metrics(text, first, width, height,
+                                                                  spacing)
+    return "\n".join([
+        "# %s, converted by fontconv.py%s" % (name, " from " + source if source else ""),
+        "# bitmaps : 1 bit per pixel, row after row for each glyph",
+        "# glyphs : %d bytes per character from first to last : bitmap offset (2 bytes, little"
+        % GLYPH_SIZE,
+        "# endian), width, height, x advance, x offset, y offset (signed bytes)",
+        "first=%d" % first,
+        "last=%d" % (first + len(table) - 1),
+        "char_width=%d" % width,
+        "char_height=%d" % height,
+        "line_spacing=%d" % spacing,
+        "bitmaps=" + bytes_literal(bitmaps),
+        "glyphs=" + bytes_literal(pack_glyphs(table), per_line=GLYPH_SIZE * 2),
+        ""])
+
+
+def convert_binary(text, first=None, width=None, height=None, spacing=None):
+    # Content of the font file
+    name, bitmaps, table, first, width, height, spacing = metrics(text, first, width, height,
+                                                                  spacing)
+    last = first + len(table) - 1
+    if not (0 <= first <= last < 256 and max(width, height, spacing) < 256):
+        raise ValueError("font out of range of the font file format")
+    return MAGIC + bytes((first, last, width, height, spacing)) + pack_glyphs(table) + bitmaps
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert an Adafruit GFX font for VGA.py")
+    parser.add_argument("font", help="Adafruit GFX .h file (or font list module)")
+    parser.add_argument("-o", "--output",
+                        help="file to write (default: <font name>.py, or .vgf with --binary)")
+    parser.add_argument("--binary", action="store_true",
+                        help="write a font file read glyph by glyph (VGA.FontFile)")
+    parser.add_argument("--first", type=lambda s: int(s, 0), help="first character code")
+    parser.add_argument("--width", type=int, help="char_width (default: largest x advance)")
+    parser.add_argument("--height", type=int, help="char_height (default: tallest glyph)")
+    parser.add_argument("--spacing", type=int,
+                        help="line_spacing (default: y advance - height, or 2)")
+    args = parser.parse_args()
+    with open(args.font) as f:
+        source = f.read()
+    output = args.output or (os.path.splitext(os.path.basename(args.font))[0]
+                             + (".vgf" if args.binary else ".py"))
+    if args.binary:
+        with open(output, "wb") as f:
+            f.write(convert_binary(source, args.first, args.width, args.height, args.spacing))
+    else:
+        with open(output, "w") as f:
+            f.write(convert(source, os.path.basename(args.font), args.first, args.width,
+                            args.height, args.spacing))
+    print("font written to", output, file=sys.stderr)
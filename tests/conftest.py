@@ -0,0 +1,27 @@
+# Tests of VGA.py under emulation (see emulator.py) : python -m pytest -q
+# The pointers check their bounds, so a primitive writing outside of its buffer fails its test.
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "VGA-with fonts")]
+
+import emulator  # noqa: E402
+
+emulator.install(True)
+
+import VGA  # noqa: E402
+
+
+@pytest.fixture
+def vga():
+    # VGA running, the screen selected, cleared and without clip rectangle
+    if VGA.H_buffer_line is None:
+        VGA.init()
+    VGA.select(VGA.screen)
+    VGA.set_clip()
+    VGA.fill_screen(VGA.BLACK)
+    return VGA
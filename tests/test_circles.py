@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+import emulator
+
+import VGA
+
+
+@pytest.fixture
+def spans(vga, monkeypatch):
+    # (x1, x2, y) of the draw_fastHline calls of fill_disk and fill_ellipse
+    calls = []
+    draw_fastHline = VGA.draw_fastHline
+
+    def record(x1, x2, y, col):
+        calls.append((x1, x2, y))
+        draw_fastHline(x1, x2, y, col)
+    monkeypatch.setattr(VGA, "draw_fastHline", record)
+    return calls
+
+
+def lit():
+    return {(i % 640, i // 640) for i, c in enumerate(emulator.pixels(VGA.H_buffer_line)) if c}
+
+
+def outline_rows(draw, *args):
+    # {y: (x1, x2)} : the leftmost pixel and the pixel after the rightmost one of each row
+    VGA.fill_screen(VGA.BLACK)
+    draw(*args, VGA.WHITE)
+    rows = {}
+    for x, y in lit():
+        x1, x2 = rows.get(y, (x, x + 1))
+        rows[y] = (min(x1, x), max(x2, x + 1))
+    VGA.fill_screen(VGA.BLACK)
+    return rows
+
+
+def check_rows(spans, outline):
+    # every row of the outline filled exactly once, from its leftmost to its rightmost pixel
+    rows = sorted(y for x1, x2, y in spans)
+    assert rows == sorted(outline)
+    assert {y: (x1, x2) for x1, x2, y in spans} == outline
+
+
+@pytest.mark.parametrize("r", list(range(12)) + [37, 100, 239])
+def test_disk_rows(spans, r):
+    outline = outline_rows(VGA.draw_circle, 320, 240, r)
+    VGA.fill_disk(320, 240, r, VGA.GREEN)
+    check_rows(spans, outline)
+
+
+@pytest.mark.parametrize("rx, ry", [(0, 0), (0, 5), (5, 0), (1, 1), (3, 7), (7, 3), (20, 20),
+                                    (150, 2), (2, 150), (100, 60), (61, 99), (319, 239)])
+def test_ellipse_rows(spans, rx, ry):
+    outline = outline_rows(VGA.draw_ellipse, 320, 240, rx, ry)
+    VGA.fill_ellipse(320, 240, rx, ry, VGA.BLUE)
+    check_rows(spans, outline)
+
+
+def test_random_rows(spans):
+    # also across the screen edges : the spans are clipped by draw_fastHline only
+    rnd = random.Random(12)
+    for i in range(40):
+        x, y = rnd.randrange(640), rnd.randrange(480)
+        rx, ry = rnd.randrange(80), rnd.randrange(80)
+        VGA.fill_disk(x, y, rx, VGA.RED)
+        rows = [s[2] for s in spans]
+        assert sorted(rows) == list(range(y - rx, y + rx + 1))
+        spans.clear()
+        VGA.fill_ellipse(x, y, rx, ry, VGA.RED)
+        rows = [s[2] for s in spans]
+        assert sorted(rows) == list(range(y - ry, y + ry + 1))
+        spans.clear()
@@ -0,0 +1,92 @@
+import random
+from array import array
+
+import VGA
+
+
+def test_display_list_draws_like_calls(vga):
+    VGA.setfont(2)
+    sprite = VGA.Sprite(23, 11)
+    for i in range(len(sprite.data)):
+        sprite.data[i] = 0x12345678 * (i + 1) & 0x3FFFFFFF
+    d = VGA.DisplayList()
+    d.fill_screen(1)
+    d.fill_rect(10, 10, -100, 200, 3)
+    d.hline(-5, 700, 5, 4)
+    d.vline(7, -3, 100, 6)
+    d.line(-50, -50, 700, 400, 2)
+    d.rect(100, 100, 200, 150, 5)
+    d.circle(320, 240, 50, 7)
+    d.disk(320, 240, 20, 4)
+    d.text(10, 300, "Hello", 6)
+    d.blit(sprite, 403, 77)
+    d.pix(3, 3, 0)
+    d.run()
+    listed = array("L", VGA.H_buffer_line)
+    VGA.fill_screen(1)
+    VGA.fill_rect(10, 10, -100, 200, 3)
+    VGA.draw_fastHline(-5, 700, 5, 4)
+    VGA.draw_fastVline(7, -3, 100, 6)
+    VGA.draw_line(-50, -50, 700, 400, 2)
+    VGA.draw_rect(100, 100, 200, 150, 5)
+    VGA.draw_circle(320, 240, 50, 7)
+    VGA.fill_disk(320, 240, 20, 4)
+    VGA.settextcursor(10, 300)
+    VGA.settextcolor(6)
+    VGA.printh("Hello")
+    VGA.blit(sprite, 403, 77)
+    VGA.draw_pix(3, 3, 0)
+    assert VGA.H_buffer_line == listed
+
+
+def test_text_keeps_cursor_and_color(vga):
+    VGA.setfont(1)
+    VGA.settextcursor(50, 60)
+    VGA.settextcolor(VGA.GREEN)
+    d = VGA.DisplayList()
+    d.text(300, 400, "list", VGA.RED)
+    d.run()
+    assert (VGA.x_cursor, VGA.y_cursor, VGA.text_color) == (50, 60, VGA.GREEN)
+
+
+def random_spans(d, rnd, n):
+    # The commands written by run_list itself, with their direct calls
+    calls = []
+    for i in range(n):
+        op = rnd.randrange(4)
+        v = [rnd.randrange(-50, 700) for j in range(4)]
+        col = rnd.randrange(8)
+        if op == 0:
+            d.pix(v[0], v[1] % 490 - 5, col)
+            calls.append((VGA.draw_pix, (v[0], v[1] % 490 - 5, col)))
+        elif op == 1:
+            d.hline(v[0], v[1], v[2] % 490 - 5, col)
+            calls.append((VGA.draw_fastHline, (v[0], v[1], v[2] % 490 - 5, col)))
+        elif op == 2:
+            d.vline(v[0], v[1] % 490 - 5, v[2] % 490 - 5, col)
+            calls.append((VGA.draw_fastVline, (v[0], v[1] % 490 - 5, v[2] % 490 - 5, col)))
+        else:
+            d.fill_rect(v[0], v[1] % 490 - 5, v[2], v[3] % 490 - 5, col)
+            calls.append((VGA.fill_rect, (v[0], v[1] % 490 - 5, v[2], v[3] % 490 - 5, col)))
+    return calls
+
+
+def test_inlined_spans(vga):
+    rnd = random.Random(4)
+    canvas = VGA.Canvas(123, 77)
+    for target, clip in ((VGA.screen, None), (VGA.screen, (13, 9, 301, 200)), (canvas, None),
+                         (canvas, (5, 3, 100, 70))):
+        target.select()
+        d = VGA.DisplayList()
+        calls = random_spans(d, rnd, 300)
+        if clip:
+            VGA.set_clip(*clip)
+        VGA.fill_screen(VGA.BLACK)
+        d.run()
+        listed = array("L", VGA.draw_buf)
+        VGA.fill_screen(VGA.BLACK)
+        for fn, args in calls:
+            fn(*args)
+        assert VGA.draw_buf == listed
+        VGA.set_clip()
+    VGA.select(VGA.screen)
@@ -0,0 +1,16 @@
+import emulator
+
+import VGA
+
+
+def test_deinit_frees_the_frame_buffer(vga):
+    running = VGA.mem_free()
+    VGA.deinit()
+    stopped = VGA.mem_free()
+    assert stopped - running >= 4 * 30720
+    assert emulator.deref(emulator.registers[emulator.DMA_CH0_READ_ADDR]) is None
+    VGA.init()
+    assert VGA.mem_free() == running
+    VGA.deinit()
+    assert VGA.mem_free() == stopped
+    VGA.init()
@@ -0,0 +1,101 @@
+import random
+from array import array
+from collections import deque
+
+import emulator
+
+W, H = 640, 480
+
+
+def reference_fill(pix, x, y, col, clip=(0, 0, W, H)):
+    # Breadth first fill of the decoded frame, pixel by pixel
+    pix = bytearray(pix)
+    x1, y1, x2, y2 = clip
+    old = pix[y * W + x]
+    if old == col:
+        return pix
+    pix[y * W + x] = col
+    todo = deque([(x, y)])
+    while todo:
+        a, b = todo.popleft()
+        for c, d in ((a + 1, b), (a - 1, b), (a, b + 1), (a, b - 1)):
+            if x1 <= c < x2 and y1 <= d < y2 and pix[d * W + c] == old:
+                pix[d * W + c] = col
+                todo.append((c, d))
+    return pix
+
+
+def draw_maze(VGA, x0, y0, cols, rows, seed):
+    # Perfect maze of 1 pixel wide corridors and walls (recursive backtracker)
+    rnd = random.Random(seed)
+    VGA.fill_rect(x0, y0, x0 + 2 * cols + 1, y0 + 2 * rows + 1, VGA.WHITE)
+    seen = {(0, 0)}
+    path = [(0, 0)]
+    VGA.draw_pix(x0 + 1, y0 + 1, VGA.BLACK)
+    while path:
+        i, j = path[-1]
+        nexts = [(i + di, j + dj) for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                 if 0 <= i + di < cols and 0 <= j + dj < rows and (i + di, j + dj) not in seen]
+        if not nexts:
+            path.pop()
+            continue
+        a, b = rnd.choice(nexts)
+        VGA.draw_pix(x0 + i + a + 1, y0 + j + b + 1, VGA.BLACK)
+        VGA.draw_pix(x0 + 2 * a + 1, y0 + 2 * b + 1, VGA.BLACK)
+        seen.add((a, b))
+        path.append((a, b))
+
+
+def check_fill(VGA, x, y, col, stack=None, clip=(0, 0, W, H), max_spans=None):
+    before = emulator.pixels(VGA.H_buffer_line)
+    if max_spans is None:
+        assert VGA.flood_fill(x, y, col, stack)
+    else:
+        assert VGA.flood_fill(x, y, col, stack, max_spans)
+    assert emulator.pixels(VGA.H_buffer_line) == reference_fill(before, x, y, col, clip)
+
+
+def test_maze(vga):
+    # Every corridor of the maze is a pending span : far more than the stack holds at first,
+    # and than flood_max_spans for a maze of the whole screen
+    draw_maze(vga, 0, 0, 319, 239, 1)
+    check_fill(vga, 1, 1, vga.RED, max_spans=4096)
+
+
+def test_max_spans(vga):
+    # Past max_spans the fill stops : False, only pixels of the region filled
+    draw_maze(vga, 0, 0, 319, 239, 1)
+    before = emulator.pixels(vga.H_buffer_line)
+    region = reference_fill(before, 1, 1, vga.RED)
+    assert not vga.flood_fill(1, 1, vga.RED)
+    after = emulator.pixels(vga.H_buffer_line)
+    assert after != region
+    assert all(a == b or a == c for a, b, c in zip(after, before, region))
+    vga.fill_screen(vga.BLACK)
+    draw_maze(vga, 100, 50, 60, 40, 2)
+    assert not vga.flood_fill(101, 51, vga.BLUE, array('H', range(32)), 16)
+
+
+def test_comb(vga):
+    # One tooth every 2 pixels, all of them pending at once
+    for x in range(1, W, 2):
+        vga.draw_fastVline(x, 1, H - 1, vga.WHITE)
+    check_fill(vga, 0, 0, vga.GREEN)
+
+
+def test_small_stack_grows(vga):
+    # The caller's stack is doubled as many times as needed, the region is fully filled
+    draw_maze(vga, 100, 50, 60, 40, 2)
+    check_fill(vga, 101, 51, vga.BLUE, array('H', range(32)))
+
+
+def test_clip(vga):
+    draw_maze(vga, 0, 0, 100, 80, 3)
+    vga.set_clip(30, 20, 150, 120)
+    check_fill(vga, 31, 21, vga.CYAN, clip=(30, 20, 150, 120))
+
+
+def test_same_color(vga):
+    before = emulator.pixels(vga.H_buffer_line)
+    assert vga.flood_fill(10, 10, vga.BLACK)
+    assert emulator.pixels(vga.H_buffer_line) == before
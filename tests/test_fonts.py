@@ -0,0 +1,91 @@
+import emulator
+
+import FreeMono9pt7b
+
+
+def write_font(path, first, last, w, h, spacing, glyphs, bitmaps):
+    with open(path, "wb") as f:
+        f.write(b"VGAF" + bytes((first, last, w, h, spacing)) + glyphs + bitmaps)
+    return str(path)
+
+
+def write_module(path, font):
+    return write_font(path, font.first, font.last, font.char_width, font.char_height,
+                      font.line_spacing, font.glyphs, font.bitmaps)
+
+
+def test_font_file_draws_like_module(vga, tmp_path):
+    text = "Hello, World! {}~"
+    vga.settextcolor(vga.YELLOW)
+    vga.setfont(FreeMono9pt7b)
+    vga.settextcursor(5, 20)
+    vga.printh(text)
+    expected = emulator.pixels(vga.H_buffer_line)
+    vga.fill_screen(vga.BLACK)
+    # a cache of 2 glyphs : most of them are read again from the file
+    ff = vga.FontFile(write_module(tmp_path / "mono.vgf", FreeMono9pt7b), cache=64)
+    vga.set_glyph_cache(0)
+    vga.setfont(ff)
+    vga.settextcursor(5, 20)
+    vga.printh(text)
+    vga.set_glyph_cache(4096)
+    vga.setfont(1)
+    ff.close()
+    assert emulator.pixels(vga.H_buffer_line) == expected
+
+
+def test_setfont_path_reuses_font_file(vga, tmp_path):
+    path = write_module(tmp_path / "mono.vgf", FreeMono9pt7b)
+    vga.setfont(path)
+    ff = vga.font
+    fonts = len(vga.glyph_fonts)
+    for i in range(50):
+        vga.setfont(1)
+        vga.setfont(path)
+        assert vga.font is ff
+    assert vga.load_font(path) is ff
+    assert len(vga.glyph_fonts) == fonts
+    vga.setfont(1)
+    ff.close()
+    assert ff.file.closed
+    assert path not in vga.font_files
+    assert ff not in vga.glyph_fonts
+    # the entry of the closed font is reused
+    vga.setfont(path)
+    assert vga.font is not ff
+    assert len(vga.glyph_fonts) == fonts
+    vga.setfont(1)
+    vga.font_files[path].close()
+
+
+def test_font_file_close_empties_caches(vga, tmp_path):
+    ff = vga.FontFile(write_module(tmp_path / "mono.vgf", FreeMono9pt7b))
+    vga.setfont(ff)
+    i = vga.font_id
+    vga.printh("cached")
+    vga.setfont(1)
+    used = vga.glyph_cache.used
+    ff.close()
+    assert vga.glyph_cache.used < used
+    assert all(key // 80 >> 8 != i for key in vga.glyph_cache.keys())
+
+
+def test_font_file_256_glyphs(vga, tmp_path):
+    # 256 glyphs, all of them cached : slot and glyph numbers up to 256
+    glyphs = b"".join(bytes((k, 0, 1, 1, 2, 0, 0xFF)) for k in range(256))
+    path = write_font(tmp_path / "full.vgf", 0, 255, 2, 1, 1, glyphs, bytes([0x80]) * 256)
+    ff = vga.FontFile(path)
+    for k in range(256):
+        assert ff.load(7 * k) == k
+    assert sorted(ff.owner) == list(range(1, 257))
+    assert list(ff.slot) == list(range(1, 257))
+    vga.setfont(ff)
+    vga.set_glyph_cache(0)
+    vga.settextcolor(vga.WHITE)
+    vga.settextcursor(0, 10)
+    vga.printh("".join(chr(c) for c in range(11, 256)))
+    vga.set_glyph_cache(4096)
+    vga.setfont(1)
+    ff.close()
+    pix = emulator.pixels(vga.H_buffer_line)
+    assert pix[9 * 640:9 * 640 + 490] == bytes((vga.WHITE, 0)) * 245
@@ -0,0 +1,104 @@
+import pytest
+
+import emulator
+
+import FreeMono9pt7b
+
+
+def printh_pixels(VGA, text, f, col, x, y):
+    VGA.setfont(f)
+    VGA.settextcolor(col)
+    VGA.settextcursor(x, y)
+    VGA.printh(text)
+    pix = emulator.pixels(VGA.H_buffer_line)
+    VGA.fill_screen(VGA.BLACK)
+    return pix
+
+
+@pytest.mark.parametrize("f", [1, 2, 3])
+@pytest.mark.parametrize("x", [0, 3, 9, 10, 14, 460])
+def test_label_draws_like_printh(vga, f, x):
+    text = "gjpq 12.5 V!"
+    expected = printh_pixels(vga, text, f, vga.YELLOW, x, 40)
+    vga.setfont(1)
+    vga.render_label(text, f, vga.YELLOW).draw(x, 40)
+    assert emulator.pixels(vga.H_buffer_line) == expected
+
+
+def test_label_clipped(vga):
+    vga.set_clip(5, 30, 100, 45)
+    expected = printh_pixels(vga, "Clipped label", 2, vga.GREEN, 0, 40)
+    vga.render_label("Clipped label", 2, vga.GREEN).draw(0, 40)
+    assert emulator.pixels(vga.H_buffer_line) == expected
+
+
+def test_cache_hit_keeps_font(vga, monkeypatch):
+    vga.set_label_cache(4096)
+    vga.setfont(1)
+    label = vga.render_label("Hit", 2, vga.RED)
+
+    def setfont(f):
+        raise AssertionError("setfont called")
+    monkeypatch.setattr(vga, "setfont", setfont)
+    assert vga.render_label("Hit", 2, vga.RED) is label
+    assert vga.render_label("Miss", 3, vga.RED) is not label
+    assert vga.font is vga.load_font(1)
+
+
+def test_cache_lru(vga):
+    # labels of the same size : room for 3 of them
+    vga.set_label_cache(4096)
+    vga.render_label("a", 1, vga.RED)
+    vga.set_label_cache(3 * vga.label_cache.used)
+    a = vga.render_label("a", 1, vga.RED)
+    b = vga.render_label("a", 1, vga.GREEN)
+    vga.render_label("a", 1, vga.BLUE)
+    assert vga.render_label("a", 1, vga.RED) is a
+    # b is now the least recently used label, evicted first
+    vga.render_label("a", 1, vga.WHITE)
+    assert len(vga.label_cache) == 3
+    assert vga.render_label("a", 1, vga.RED) is a
+    assert vga.render_label("a", 1, vga.GREEN) is not b
+    vga.set_label_cache(4096)
+
+
+def test_font_file_label(vga, tmp_path):
+    path = str(tmp_path / "mono.vgf")
+    with open(path, "wb") as f:
+        f.write(b"VGAF" + bytes((FreeMono9pt7b.first, FreeMono9pt7b.last,
+                                 FreeMono9pt7b.char_width, FreeMono9pt7b.char_height,
+                                 FreeMono9pt7b.line_spacing))
+                + FreeMono9pt7b.glyphs + FreeMono9pt7b.bitmaps)
+    expected = printh_pixels(vga, "File", FreeMono9pt7b, vga.CYAN, 20, 30)
+    vga.setfont(1)
+    fonts = len(vga.glyph_fonts)
+    for i in range(50):
+        vga.render_label("File", path, vga.CYAN).draw(20, 30)
+    assert len(vga.glyph_fonts) == fonts
+    assert emulator.pixels(vga.H_buffer_line) == expected
+    vga.font_files[path].close()
+
+
+@pytest.mark.parametrize("x", [-700, -333, 0, 17])
+def test_label_wider_than_screen(vga, x):
+    # rendered through several canvases, drawn clipped like the characters one by one
+    text = "The quick brown fox jumps over the lazy dog 0123456789 " * 2
+    vga.setfont(3)
+    vga.settextcolor(vga.MAGENTA)
+    vga.settextcursor(x, 60)
+    for ch in text:
+        vga.drawchar(ch)
+    expected = emulator.pixels(vga.H_buffer_line)
+    vga.fill_screen(vga.BLACK)
+    label = vga.render_label(text, 3, vga.MAGENTA)
+    assert label.width > 2 * 640
+    label.draw(x, 60)
+    assert emulator.pixels(vga.H_buffer_line) == expected
+
+
+def test_label_restores_screen(vga, monkeypatch):
+    # no canvas selected : the label canvases leave the screen selected
+    monkeypatch.setattr(vga, "target", None)
+    vga.render_label("target", 1, vga.RED)
+    assert vga.target is vga.screen
+    assert vga.draw_buf is vga.H_buffer_line
@@ -0,0 +1,124 @@
+import random
+from array import array
+
+import pytest
+
+import emulator
+
+import VGA
+
+
+def bresenham(x1, y1, x2, y2):
+    # Pixels of the line from (x1,y1) to (x2,y2) included
+    dx, sx = abs(x2 - x1), 1 if x1 < x2 else -1
+    dy, sy = -abs(y2 - y1), 1 if y1 < y2 else -1
+    err = dx + dy
+    points = [(x1, y1)]
+    while (x1, y1) != (x2, y2):
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x1 += sx
+        if e2 <= dx:
+            err += dx
+            y1 += sy
+        points.append((x1, y1))
+    return points
+
+
+def previous_draw_line(x1, y1, x2, y2, col):
+    # draw_line of the first versions (left to right, one pixel per column)
+    a = 0 if x2 == x1 else (y2 - y1) / (x2 - x1)
+    b = y1 - a * x1
+    for x in range(x1, x2 + 1):
+        VGA.draw_pix(x, int(x * a + b), col)
+
+
+def render(draw):
+    VGA.fill_screen(VGA.BLACK)
+    draw()
+    return array("L", VGA.H_buffer_line)
+
+
+def lit():
+    # (x, y) of the pixels of the screen that are not black
+    return {(i % 640, i // 640) for i, c in enumerate(emulator.pixels(VGA.H_buffer_line)) if c}
+
+
+def drawn(x1, y1, x2, y2):
+    VGA.fill_screen(VGA.BLACK)
+    VGA.draw_line(x1, y1, x2, y2, VGA.WHITE)
+    return lit()
+
+
+def ends(n):
+    # End points all around (320,240) : every octant, the axes and the diagonals
+    return [(320 + dx, 240 + dy) for dx in range(-n, n + 1) for dy in (-n, n)] + \
+        [(320 + dx, 240 + dy) for dy in range(-n + 1, n) for dx in (-n, n)]
+
+
+def test_all_octants(vga):
+    for x2, y2 in ends(9):
+        assert drawn(320, 240, x2, y2) == set(bresenham(320, 240, x2, y2)), (x2, y2)
+
+
+def test_long_lines(vga):
+    rnd = random.Random(1)
+    for i in range(40):
+        x1, x2 = rnd.randrange(640), rnd.randrange(640)
+        y1, y2 = rnd.randrange(480), rnd.randrange(480)
+        points = bresenham(x1, y1, x2, y2)
+        expected = render(lambda: [VGA.draw_pix(x, y, 3) for x, y in points])
+        assert render(lambda: VGA.draw_line(x1, y1, x2, y2, 3)) == expected, (x1, y1, x2, y2)
+
+
+@pytest.mark.parametrize("line", [(0, 0, 639, 0), (5, 17, 300, 17), (3, 479, 630, 479),
+                                  (10, 10, 200, 200), (10, 300, 170, 140)])
+def test_previous_draw_line_exact(vga, line):
+    # horizontal lines and diagonals : same pixels as the previous draw_line
+    assert render(lambda: VGA.draw_line(*line, 5)) == render(lambda: previous_draw_line(*line, 5))
+
+
+def test_previous_draw_line_shallow(vga):
+    # lines drawn left to right, less than 45 degrees : same columns, one pixel each, at most
+    # one row away from the previous draw_line (which truncated instead of rounding)
+    rnd = random.Random(2)
+    for i in range(30):
+        x1, x2 = sorted(rnd.sample(range(600), 2))
+        y1 = rnd.randrange(480)
+        y2 = max(0, min(479, y1 + rnd.randint(-(x2 - x1), x2 - x1)))
+        a = 0 if x2 == x1 else (y2 - y1) / (x2 - x1)
+        previous = {x: int(x * a + y1 - a * x1) for x in range(x1, x2 + 1)}
+        rows = {}
+        for x, y in drawn(x1, y1, x2, y2):
+            assert x not in rows
+            rows[x] = y
+        assert sorted(rows) == sorted(previous)
+        assert all(abs(rows[x] - previous[x]) <= 1 for x in rows), (x1, y1, x2, y2)
+
+
+@pytest.mark.parametrize("clip", [(0, 0, 640, 480), (37, 21, 402, 333)])
+def test_clipped_lines(vga, clip):
+    # end points far out of the clip rectangle : only pixels inside it, next to the pixels of
+    # the whole line (the end points moved on the edges are rounded)
+    rnd = random.Random(3)
+    x1c, y1c, x2c, y2c = clip
+    for i in range(30):
+        x1, y1, x2, y2 = (rnd.randrange(-900, 1500) for j in range(4))
+        VGA.set_clip(*clip)
+        VGA.fill_screen(VGA.BLACK)
+        VGA.draw_line(x1, y1, x2, y2, VGA.WHITE)
+        VGA.set_clip()
+        got = lit()
+        assert all(x1c <= x < x2c and y1c <= y < y2c for x, y in got), (x1, y1, x2, y2)
+        whole = bresenham(x1, y1, x2, y2)
+        inside = {(x, y) for x, y in whole if x1c <= x < x2c and y1c <= y < y2c}
+        near = {(x + i, y + j) for x, y in whole for i in (-1, 0, 1) for j in (-1, 0, 1)}
+        assert got <= near, (x1, y1, x2, y2)
+        assert abs(len(got) - len(inside)) <= 2, (x1, y1, x2, y2)
+
+
+def test_huge_coordinates(vga):
+    for line in [(-30000, -30000, 30000, 30000), (30000, 5, -30000, 400), (5, -30000, 600, 30000),
+                 (-30000, 240, 30000, 240), (320, 30000, 320, -30000)]:
+        VGA.draw_line(*line, VGA.RED)
@@ -0,0 +1,113 @@
+import math
+import random
+from array import array
+from fractions import Fraction
+
+import pytest
+
+import emulator
+
+import VGA
+
+
+def reference(xs, ys, clip=(0, 0, 640, 480)):
+    # Pixels of the even-odd fill : (x, y) is inside when its left edge x is in [a, b) for a pair
+    # of exact crossings a < b of the row y with the edges (top row included, bottom excluded)
+    x1c, y1c, x2c, y2c = clip
+    edges = []
+    for i in range(len(xs)):
+        x1, y1, x2, y2 = xs[i - 1], ys[i - 1], xs[i], ys[i]
+        if y1 > y2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        if y1 < y2:
+            edges.append((x1, y1, x2, y2))
+    pixels = set()
+    for y in range(max(y1c, min(ys)), min(y2c, max(ys))):
+        cross = sorted(x1 + Fraction((y - y1) * (x2 - x1), y2 - y1)
+                       for x1, y1, x2, y2 in edges if y1 <= y < y2)
+        for a, b in zip(cross[0::2], cross[1::2]):
+            pixels.update((x, y) for x in range(max(x1c, math.ceil(a)), min(x2c, math.ceil(b))))
+    return pixels
+
+
+@pytest.fixture
+def spans(vga, monkeypatch):
+    # (x1, x2, y) of the draw_fastHline calls of fill_poly
+    calls = []
+    draw_fastHline = VGA.draw_fastHline
+
+    def record(x1, x2, y, col):
+        calls.append((x1, x2, y))
+        draw_fastHline(x1, x2, y, col)
+    monkeypatch.setattr(VGA, "draw_fastHline", record)
+    return calls
+
+
+def lit():
+    return {(i % 640, i // 640) for i, c in enumerate(emulator.pixels(VGA.H_buffer_line)) if c}
+
+
+def check_spans(calls):
+    # rows filled from top to bottom, each of them once : spans of a row sorted and disjoint
+    assert calls == sorted(calls, key=lambda s: s[2])
+    for (a1, b1, y1), (a2, b2, y2) in zip(calls, calls[1:]):
+        assert a1 <= b1
+        if y1 == y2:
+            assert b1 <= a2
+
+
+def random_polygon(rnd, n, size):
+    cx, cy = rnd.randrange(640), rnd.randrange(480)
+    return (array("h", [cx + rnd.randrange(-size, size) for i in range(n)]),
+            array("h", [cy + rnd.randrange(-size, size) for i in range(n)]))
+
+
+@pytest.mark.parametrize("n", [3, 4, 5, 8, 12])
+def test_random_polygons(spans, n):
+    rnd = random.Random(n)
+    for i in range(12):
+        xs, ys = random_polygon(rnd, n, rnd.choice([40, 300, 900]))
+        VGA.fill_screen(VGA.BLACK)
+        spans.clear()
+        VGA.fill_polygon(xs, ys, VGA.GREEN)
+        check_spans(spans)
+        assert lit() == reference(list(xs), list(ys)), (list(xs), list(ys))
+
+
+def test_convex_one_span_per_row(spans):
+    # regular 9-gon : one span per row, rows in a row
+    xs = array("h", [int(320 + 200 * math.cos(2 * math.pi * i / 9)) for i in range(9)])
+    ys = array("h", [int(240 + 200 * math.sin(2 * math.pi * i / 9)) for i in range(9)])
+    VGA.fill_polygon(xs, ys, VGA.BLUE)
+    rows = [y for x1, x2, y in spans]
+    assert rows == list(range(min(ys), max(ys)))
+    assert lit() == reference(list(xs), list(ys))
+
+
+def test_shared_edge(spans):
+    # two triangles of a quad : every pixel of the quad written once
+    VGA.fill_triangle(30, 20, 400, 90, 120, 300, VGA.RED)
+    VGA.fill_triangle(400, 90, 120, 300, 520, 410, VGA.RED)
+    covered = [(x, y) for x1, x2, y in spans for x in range(x1, x2)]
+    assert len(covered) == len(set(covered))
+    assert set(covered) == reference([30, 400, 520, 120], [20, 90, 410, 300])
+
+
+def test_rectangle_is_fill_rect(vga):
+    VGA.fill_polygon(array("h", [13, 200, 200, 13]), array("h", [7, 7, 99, 99]), VGA.WHITE)
+    polygon = array("L", VGA.H_buffer_line)
+    VGA.fill_screen(VGA.BLACK)
+    VGA.fill_rect(13, 7, 200, 99, VGA.WHITE)
+    assert VGA.H_buffer_line == polygon
+
+
+def test_clip(vga):
+    clip = (53, 41, 377, 229)
+    rnd = random.Random(7)
+    for i in range(10):
+        xs, ys = random_polygon(rnd, 6, 300)
+        VGA.set_clip(*clip)
+        VGA.fill_screen(VGA.BLACK)
+        VGA.fill_polygon(xs, ys, VGA.YELLOW)
+        VGA.set_clip()
+        assert lit() == reference(list(xs), list(ys), clip)
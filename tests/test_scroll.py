@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+import VGA
+
+
+def read(w, h):
+    buf = bytearray(w * h)
+    VGA.read_pixels(0, 0, w, h, buf)
+    return buf
+
+
+def expected_scroll(pix, w, clip, x1, y1, x2, y2, dy, col):
+    # Pixel by pixel : rows of the rectangle (clipped) moved up by dy, the rest filled with col
+    cx1, cy1, cx2, cy2 = clip
+    x1, x2 = max(min(x1, x2), cx1), min(max(x1, x2), cx2)
+    y1, y2 = max(min(y1, y2), cy1), min(max(y1, y2), cy2)
+    out = bytearray(pix)
+    if dy:
+        for y in range(y1, y2):
+            for x in range(x1, x2):
+                out[y * w + x] = pix[(y + dy) * w + x] if y1 <= y + dy < y2 else col
+    return out
+
+
+@pytest.mark.parametrize("size", [(1, 5), (13, 40), (97, 61), (200, 100)])
+def test_scroll_canvas(vga, size):
+    w, h = size
+    rnd = random.Random(w)
+    canvas = VGA.Canvas(w, h)
+    canvas.select()
+    try:
+        for i in range(25):
+            VGA.set_clip()
+            for y in range(h):
+                for x in range(w):
+                    VGA.draw_pix(x, y, rnd.randrange(8))
+            if i % 3 == 0:
+                VGA.set_clip(rnd.randrange(w), rnd.randrange(h), rnd.randrange(w + 1),
+                             rnd.randrange(h + 1))
+            clip = VGA.get_clip()
+            x1, x2, y1, y2 = (rnd.randrange(-5, w + 5), rnd.randrange(-5, w + 5),
+                              rnd.randrange(-5, h + 5), rnd.randrange(-5, h + 5))
+            dy, col = rnd.randrange(-30, 30), rnd.randrange(8)
+            before = read(w, h)
+            VGA.scroll(x1, y1, x2, y2, dy, col)
+            VGA.set_clip()
+            assert read(w, h) == expected_scroll(before, w, clip, x1, y1, x2, y2, dy, col), \
+                (clip, x1, y1, x2, y2, dy)
+    finally:
+        VGA.set_clip()
+        VGA.select(VGA.screen)
+
+
+@pytest.mark.parametrize("box", [(0, 0, 640, 480, 16), (3, 10, 637, 300, -7),
+                                 (10, 0, 20, 480, 479), (0, 0, 640, 480, -480)])
+def test_scroll_screen(vga, box):
+    x1, y1, x2, y2, dy = box
+    for i in range(0, 640, 7):
+        VGA.fill_rect(i, (i * 3) % 480, i + 7, 480, (i // 7) % 8)
+        VGA.draw_line(i, 0, 639 - i, 479, (i // 5) % 8)
+    before = read(640, 480)
+    VGA.scroll(x1, y1, x2, y2, dy, VGA.BLUE)
+    assert read(640, 480) == expected_scroll(before, 640, (0, 0, 640, 480), x1, y1, x2, y2,
+                                             dy, VGA.BLUE)
+
+
+@pytest.mark.parametrize("box", [(), (13, 7, 301, 150)])
+def test_console_matches_redraw(vga, box):
+    # scrolled and incrementally redrawn console : same pixels as all its cells drawn again
+    VGA.setfont(1)
+    console = VGA.Console(*box)
+    for i in range(40):
+        console.write("\x1b[3%dm%d \x1b[4%dmline\x1b[0m %s\n"
+                      % (i % 8, i, (i + 3) % 8, "x" * (i % 23)))
+    console.write("\x1b[2;3Hmoved\x1b[K")
+    scrolled = read(640, 480)
+    VGA.fill_screen(VGA.BLACK)
+    console.redraw()
+    assert read(640, 480) == scrolled
@@ -0,0 +1,276 @@
+from array import array
+
+import pytest
+
+import VGA
+
+TEXT = "".join(chr(c) for c in range(32, 127))
+
+
+def background():
+    # Stripes of every color : the glyphs must leave the pixels around them untouched
+    for i in range(0, VGA.draw_width, 7):
+        VGA.fill_rect(i, 0, i + 7, VGA.draw_height, (i // 7) % 8)
+
+
+def pixel_drawchar(ch):
+    # drawchar of the first versions : one draw_pix per pixel set in the glyph bitmap
+    f = VGA.font
+    c = ord(ch)
+    if c < f.first or c > f.last:
+        return
+    g = f.glyphs
+    k = (c - f.first) * 7
+    index = VGA.glyph_bitmap(f, k)
+    w, h = g[k + 2], g[k + 3]
+    x = VGA.x_cursor + ((g[k + 5] ^ 0x80) - 0x80)
+    y = VGA.y_cursor + ((g[k + 6] ^ 0x80) - 0x80)
+    for n in range(w * h):
+        if f.bitmaps[index + (n >> 3)] & (0x80 >> (n & 7)):
+            VGA.draw_pix(x + n % w, y + n // w, VGA.text_color)
+    VGA.x_cursor += g[k + 4]
+
+
+def draw_lines(drawchar, lines):
+    # lines : (x, y, color, text) drawn character by character (no wrapping)
+    for x, y, col, text in lines:
+        VGA.settextcolor(col)
+        VGA.settextcursor(x, y)
+        for ch in text:
+            drawchar(ch)
+
+
+def render(drawchar, lines):
+    background()
+    draw_lines(drawchar, lines)
+    return array("L", VGA.draw_buf)
+
+
+def text_lines(x0=0):
+    # Every character, starting at each of the 10 positions within a word
+    return [(x0 + p, 20 + 45 * p, 1 + p % 7, TEXT[30 * (p % 4):30 * (p % 4) + 30])
+            for p in range(10)]
+
+
+@pytest.fixture
+def no_cache(vga):
+    # drawchar through draw_glyph only
+    vga.set_glyph_cache(0)
+    yield
+    vga.set_glyph_cache(4096)
+
+
+@pytest.mark.parametrize("f", [1, 2, 3])
+def test_span_glyphs(no_cache, f):
+    VGA.setfont(f)
+    lines = text_lines()
+    assert render(VGA.drawchar, lines) == render(pixel_drawchar, lines)
+
+
+@pytest.mark.parametrize("x", [-9, -3, 1, 600, 615, 633])
+def test_span_glyphs_screen_edges(no_cache, x):
+    VGA.setfont(3)
+    lines = [(x, -4, 7, "Wgj"), (x, 240, 2, "Wgj@"), (x, 488, 4, "Wgj")]
+    assert render(VGA.drawchar, lines) == render(pixel_drawchar, lines)
+
+
+@pytest.mark.parametrize("x1", range(20, 30))
+def test_span_glyphs_clip(no_cache, x1):
+    VGA.setfont(2)
+    VGA.set_clip(x1, 15, x1 + 37, 43)
+    lines = [(x1 - 8 + i, 20 + 9 * i, 5, "MW@#") for i in range(3)]
+    assert render(VGA.drawchar, lines) == render(pixel_drawchar, lines)
+
+
+@pytest.fixture
+def cache(vga):
+    vga.set_glyph_cache(4096)
+    yield
+    vga.set_glyph_cache(4096)
+
+
+@pytest.mark.parametrize("f", [1, 2, 3])
+def test_glyph_cache(cache, f):
+    VGA.setfont(f)
+    VGA.set_glyph_cache(1 << 20)
+    lines = text_lines()
+    expected = render(pixel_drawchar, lines)
+    # first pass : mostly misses, second pass : hits of the same glyphs
+    assert render(VGA.drawchar, lines[:3]) == render(pixel_drawchar, lines[:3])
+    hits = VGA.glyph_hits
+    assert render(VGA.drawchar, lines[:3] + lines) == render(pixel_drawchar, lines[:3] + lines)
+    assert VGA.glyph_hits > hits
+    assert VGA.glyph_cache.used <= VGA.glyph_cache.size
+    VGA.fill_screen(VGA.BLACK)
+    assert render(VGA.drawchar, lines) == expected
+
+
+def test_glyph_cache_colors(cache):
+    # same characters and positions, another color : other cache entries
+    VGA.setfont(2)
+    lines = [(3, 30 + 20 * col, col, "ABab12") for col in range(8)] * 2
+    assert render(VGA.drawchar, lines) == render(pixel_drawchar, lines)
+
+
+def test_glyph_cache_eviction(vga):
+    VGA.setfont(3)
+    VGA.set_glyph_cache(700)
+    lines = text_lines()
+    assert render(VGA.drawchar, lines) == render(pixel_drawchar, lines)
+    assert 0 < VGA.glyph_cache.used <= 700
+    VGA.set_glyph_cache(4096)
+
+
+@pytest.mark.parametrize("x1", range(20, 30))
+def test_glyph_cache_clip(cache, x1):
+    # glyphs inside, across and outside every edge of clip rectangles at each x%10
+    VGA.setfont(2)
+    VGA.set_clip(x1, 15, x1 + 37 + x1 % 7, 43)
+    lines = [(x1 - 8 + i, 20 + 9 * i, 5, "MW@#") for i in range(3)] * 2
+    assert render(VGA.drawchar, lines) == render(pixel_drawchar, lines)
+
+
+@pytest.mark.parametrize("x", [-9, -3, 1, 600, 615, 633])
+def test_glyph_cache_screen_edges(cache, x):
+    VGA.setfont(3)
+    lines = [(x, -4, 7, "Wgj"), (x, 240, 2, "Wgj@"), (x, 488, 4, "Wgj")] * 2
+    assert render(VGA.drawchar, lines) == render(pixel_drawchar, lines)
+
+
+@pytest.mark.parametrize("width", [97, 160])
+def test_glyph_cache_canvas(cache, width):
+    # canvas rows are not 64 words apart : the cached masks are placed with its row table
+    VGA.setfont(1)
+    canvas = VGA.Canvas(width, 120)
+    canvas.select()
+    lines = [(p - 2, 15 + 11 * p, 1 + p % 7, TEXT[p * 9:p * 9 + 9]) for p in range(10)] * 2
+    try:
+        assert render(VGA.drawchar, lines) == render(pixel_drawchar, lines)
+    finally:
+        VGA.select(VGA.screen)
+
+
+def test_cache_clock():
+    cache = VGA.Cache(3)
+    for key in "abc":
+        assert cache.put(key, key.upper(), 1)
+    assert cache.get("a") == "A"
+    # b and c were not used since they were cached : b goes first, then c
+    cache.put("d", "D", 1)
+    assert cache.keys() == ["a", "c", "d"]
+    # the hand cleared the bit of a : without another use it would go before d
+    assert cache.get("a") == "A"
+    cache.put("e", "E", 2)
+    assert sorted(cache.keys()) == ["a", "e"]
+    assert cache.used == 3
+    assert not cache.put("f", "F", 4)
+    assert cache.get("b") is None
+    cache.clear(10)
+    assert (len(cache), cache.used, cache.size) == (0, 0, 10)
+
+
+SENTENCE = "The quick brown fox jumps over the lazy dog\nPack my box with five dozen liquor jugs"
+
+
+def box_lines(text, w):
+    # Lines of draw_text_box : the longest runs of words separated by a space that fit in w
+    lines = []
+    for para in text.split("\n"):
+        line = None
+        for word in para.split(" "):
+            if line is not None and VGA.text_width(line + " " + word) <= w:
+                line += " " + word
+            else:
+                if line is not None:
+                    lines.append(line)
+                line = word
+        lines.append(line)
+    return lines
+
+
+def render_box(lines, x, y, w, h, align, col):
+    # lines printed with printh at the alignment computed with text_width, clipped to the box
+    background()
+    VGA.set_clip(x, y, x + w, y + h)
+    VGA.settextcolor(col)
+    for k, line in enumerate(lines):
+        lx = x
+        if align == VGA.ALIGN_CENTER:
+            lx += (w - VGA.text_width(line)) // 2
+        elif align == VGA.ALIGN_RIGHT:
+            lx += w - VGA.text_width(line)
+        VGA.settextcursor(lx, y + VGA.ascent + k * (VGA.Char_height + VGA.Line_Spacing))
+        VGA.printh(line)
+    VGA.set_clip()
+    return array("L", VGA.draw_buf)
+
+
+def draw_box(text, x, y, w, h, align, col, wrap=True):
+    background()
+    VGA.settextcolor(col)
+    VGA.settextcursor(7, 9)
+    i = VGA.draw_text_box(text, x, y, w, h, align, wrap)
+    # the text cursor and the clip rectangle are left as they were
+    assert (VGA.x_cursor, VGA.y_cursor) == (7, 9)
+    assert tuple(VGA.get_clip()) == (0, 0, VGA.draw_width, VGA.draw_height)
+    return i, array("L", VGA.draw_buf)
+
+
+@pytest.mark.parametrize("f", [1, 2, 3])
+def test_text_width(vga, f):
+    VGA.setfont(f)
+    for text in [TEXT[:40], TEXT[40:70], "a", "", "ab\ncdefgh\nij", "\xe9 x"]:
+        widths = []
+        for line in text.split("\n"):
+            VGA.settextcursor(0, 200)
+            VGA.printh(line)
+            widths.append(VGA.x_cursor)
+        assert VGA.text_width(text) == max(widths)
+
+
+@pytest.mark.parametrize("align", [VGA.ALIGN_LEFT, VGA.ALIGN_CENTER, VGA.ALIGN_RIGHT])
+@pytest.mark.parametrize("w", [60, 97, 200])
+def test_text_box_wrap(cache, align, w):
+    VGA.setfont(2)
+    lines = box_lines(SENTENCE, w)
+    assert len(lines) > 2 and all(VGA.text_width(line) <= w for line in lines)
+    i, buf = draw_box(SENTENCE, 33, 41, w, 400, align, 6)
+    assert i == len(SENTENCE)
+    assert buf == render_box(lines, 33, 41, w, 400, align, 6)
+
+
+@pytest.mark.parametrize("rows", [1, 2, 3])
+def test_text_box_overflow(cache, rows):
+    # only the lines that fit entirely are printed, the index is the start of the next one
+    VGA.setfont(3)
+    pitch = VGA.Char_height + VGA.Line_Spacing
+    h = VGA.Char_height + (rows - 1) * pitch + pitch // 2
+    lines = box_lines(SENTENCE, 140)
+    i, buf = draw_box(SENTENCE, 250, 100, 140, h, VGA.ALIGN_CENTER, 3)
+    assert i == sum(len(line) + 1 for line in lines[:rows])
+    assert SENTENCE[i:].startswith(lines[rows])
+    assert buf == render_box(lines[:rows], 250, 100, 140, h, VGA.ALIGN_CENTER, 3)
+
+
+def test_text_box_long_word(cache):
+    # a word wider than the box is broken between its characters
+    VGA.setfont(2)
+    word = TEXT[33:90]
+    lines = [""]
+    for ch in word:
+        if VGA.text_width(lines[-1] + ch) > 90:
+            lines.append("")
+        lines[-1] += ch
+    i, buf = draw_box(word, 300, 60, 90, 300, VGA.ALIGN_RIGHT, 5)
+    assert i == len(word)
+    assert buf == render_box(lines, 300, 60, 90, 300, VGA.ALIGN_RIGHT, 5)
+
+
+@pytest.mark.parametrize("align", [VGA.ALIGN_LEFT, VGA.ALIGN_CENTER, VGA.ALIGN_RIGHT])
+def test_text_box_no_wrap(cache, align):
+    # lines wider than the box are clipped to it, on both sides when centered
+    VGA.setfont(2)
+    lines = SENTENCE.split("\n")
+    i, buf = draw_box(SENTENCE, 200, 150, 80, 100, align, 2, wrap=False)
+    assert i == len(SENTENCE)
+    assert buf == render_box(lines, 200, 150, 80, 100, align, 2)